@@ -0,0 +1,336 @@
+"""
+Throughput Benchmarks
+
+Author: Pradeep Kumar
+
+Times and memory-profiles the core entry points on deterministic
+synthetic datasets and writes machine-readable results.
+
+Usage:
+
+    python -m benchmarks.run_benchmarks --sizes 1000 100000 \
+        --output bench.json
+    python -m benchmarks.run_benchmarks --sizes 1000 100000 \
+        --compare bench.json
+
+Each benchmark is run --repeat times for wall and CPU time (the best
+run is kept) and once more under tracemalloc for peak memory, so the
+profiler does not distort the timings.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from llm_eval.config import Config
+from llm_eval.models import EvaluationEntry, Metadata
+from llm_eval.validation import load_and_validate_dataset
+from llm_eval.reporting import generate_report
+from llm_eval.significance import independent_t_test
+from llm_eval.advanced_statistics import bootstrap_significance_test
+from llm_eval.agreement import compute_cohens_kappa
+from llm_eval.advanced_drift import detect_kl_drift
+from llm_eval.benchmark import benchmark_against_reference
+from llm_eval.synthetic import generate_rating_pairs, write_synthetic_dataset
+
+
+# Bump when benchmark definitions change, so results are not compared
+# across incompatible runs.
+BENCHMARK_VERSION = 1
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    size: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_bytes: int
+    items_per_second: float
+
+
+def run_benchmarks(
+    sizes: List[int],
+    config: Config,
+    groups: int = 2,
+    repeat: int = 3,
+    seed: int = 0,
+) -> List[BenchmarkResult]:
+    """
+    Run every benchmark at every size.
+    """
+
+    results: List[BenchmarkResult] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for name, func in _benchmarks(
+                Path(directory), size, config, groups, seed
+            ):
+                results.append(_measure(name, size, func, repeat))
+                _print_result(results[-1])
+
+    return results
+
+
+def _benchmarks(
+    directory: Path,
+    size: int,
+    config: Config,
+    groups: int,
+    seed: int,
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Build inputs for one size and return (name, callable) pairs.
+    """
+
+    current = directory / f"current_{size}.jsonl"
+    baseline = directory / f"baseline_{size}.jsonl"
+
+    write_synthetic_dataset(current, size, config, groups=groups, seed=seed)
+    write_synthetic_dataset(
+        baseline, size, config, groups=groups, seed=seed + 1
+    )
+
+    dataset = load_and_validate_dataset(current, config)
+    reference = load_and_validate_dataset(baseline, config)
+    pairs = [
+        EvaluationEntry(
+            id=item["id"],
+            prompt=item["prompt"],
+            response=item["response"],
+            scores=item["scores"],
+            metadata=Metadata(**item["metadata"]),
+        )
+        for item in generate_rating_pairs(size // 2, config, seed)
+    ]
+
+    return [
+        (
+            "load_and_validate_dataset",
+            lambda: load_and_validate_dataset(current, config),
+        ),
+        ("generate_report", lambda: generate_report(dataset, config)),
+        ("independent_t_test", lambda: independent_t_test(dataset, config)),
+        (
+            "bootstrap_significance_test",
+            lambda: bootstrap_significance_test(dataset, config),
+        ),
+        ("compute_cohens_kappa", lambda: compute_cohens_kappa(pairs, config)),
+        (
+            "detect_kl_drift",
+            lambda: detect_kl_drift(dataset, reference, config),
+        ),
+        (
+            "benchmark_against_reference",
+            lambda: benchmark_against_reference(dataset, reference, config),
+        ),
+    ]
+
+
+def _measure(
+    name: str,
+    size: int,
+    func: Callable[[], Any],
+    repeat: int,
+) -> BenchmarkResult:
+
+    best_wall = best_cpu = float("inf")
+
+    for _ in range(max(repeat, 1)):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        func()
+        best_wall = min(best_wall, time.perf_counter() - wall_start)
+        best_cpu = min(best_cpu, time.process_time() - cpu_start)
+
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        benchmark=name,
+        size=size,
+        wall_seconds=best_wall,
+        cpu_seconds=best_cpu,
+        peak_bytes=peak,
+        items_per_second=size / best_wall if best_wall > 0 else 0.0,
+    )
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "benchmark_version": BENCHMARK_VERSION,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        f"{result.benchmark:<30} {result.size:>10} "
+        f"{result.wall_seconds:>10.4f}s {result.cpu_seconds:>10.4f}s "
+        f"{result.peak_bytes / 2**20:>9.1f} MiB "
+        f"{result.items_per_second:>12.0f}/s"
+    )
+
+
+def _compare(
+    results: List[BenchmarkResult],
+    parameters: Dict[str, Any],
+    previous_path: Path,
+) -> None:
+    """
+    Print wall-time and peak-memory ratios against an earlier run with
+    the same benchmark version and parameters.
+    """
+
+    with previous_path.open("r", encoding="utf-8") as f:
+        previous = json.load(f)
+
+    if previous["environment"]["benchmark_version"] != BENCHMARK_VERSION:
+        print("Previous results use a different benchmark version.")
+        return
+
+    earlier_parameters = previous.get("parameters", {})
+    differing = sorted(
+        name
+        for name in parameters.keys() | earlier_parameters.keys()
+        if parameters.get(name) != earlier_parameters.get(name)
+    )
+
+    if differing:
+        print(
+            "Previous results use different parameters: "
+            + ", ".join(differing)
+        )
+        return
+
+    earlier = {
+        (item["benchmark"], item["size"]): item
+        for item in previous["results"]
+    }
+
+    print(f"\nCompared with {previous['environment']['commit']}:")
+
+    for result in results:
+        before = earlier.get((result.benchmark, result.size))
+
+        if before is None or not before["wall_seconds"]:
+            continue
+
+        time_ratio = result.wall_seconds / before["wall_seconds"]
+        memory_ratio = result.peak_bytes / max(before["peak_bytes"], 1)
+
+        print(
+            f"{result.benchmark:<30} {result.size:>10} "
+            f"time x{time_ratio:.2f}  memory x{memory_ratio:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="LLM Evaluation Framework benchmarks"
+    )
+
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Dataset sizes to benchmark (entries)",
+    )
+    parser.add_argument("--groups", type=int, default=2)
+    parser.add_argument(
+        "--dimensions",
+        type=int,
+        help="Number of score dimensions (default: Config's five)",
+    )
+    parser.add_argument("--score-min", type=int, default=0)
+    parser.add_argument("--score-max", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument(
+        "--compare",
+        help="Earlier results JSON to compare against",
+    )
+
+    args = parser.parse_args()
+
+    config = Config(
+        min_dataset_size=min(5, min(args.sizes)),
+        score_min=args.score_min,
+        score_max=args.score_max,
+        workers=args.workers,
+    )
+
+    if args.dimensions is not None:
+        config = Config(
+            min_dataset_size=config.min_dataset_size,
+            score_min=config.score_min,
+            score_max=config.score_max,
+            workers=config.workers,
+            required_dimensions=tuple(
+                f"dimension_{index}" for index in range(args.dimensions)
+            ),
+        )
+
+    results = run_benchmarks(
+        args.sizes,
+        config,
+        groups=args.groups,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+
+    parameters = {
+        "groups": args.groups,
+        "dimensions": list(config.required_dimensions),
+        "score_min": config.score_min,
+        "score_max": config.score_max,
+        "workers": config.workers,
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+    payload = {
+        "environment": _environment(),
+        "parameters": parameters,
+        "results": [asdict(result) for result in results],
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    if args.compare:
+        _compare(results, parameters, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ LLM Evaluation Framework Core Package
 
 from .config import Config
 from .models import EvaluationEntry, Metadata
+from .score_matrix import ScoreMatrix
 from .exceptions import (
     EvaluationError,
     DatasetValidationError,
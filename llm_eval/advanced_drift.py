@@ -7,20 +7,21 @@ Implements KL-divergence based distribution drift detection.
 """
 
 import math
-from typing import Dict, List
+from typing import Dict
 
-from .models import Dataset
 from .config import Config
+from .summary import Histogram, SummarySource, dimension_histograms
 from .exceptions import DriftDetectionError
 
 
 def detect_kl_drift(
-    dataset: Dataset,
-    baseline_dataset: Dataset,
+    dataset: SummarySource,
+    baseline_dataset: SummarySource,
     config: Config,
 ) -> Dict[str, object]:
     """
     Compute KL divergence per dimension and detect drift.
+    Either side may be a prebuilt ScoreMatrix or DatasetSummary.
 
     Returns:
         {
@@ -31,17 +32,16 @@ def detect_kl_drift(
     """
 
     try:
+        current = dimension_histograms(dataset, config)
+        baseline = dimension_histograms(baseline_dataset, config)
+
         dimension_kl: Dict[str, float] = {}
 
         for dim in config.required_dimensions:
-            current_dist = _compute_distribution(dataset, dim, config)
-            baseline_dist = _compute_distribution(
-                baseline_dataset,
-                dim,
-                config,
-            )
-
-            kl_value = _kl_divergence(current_dist, baseline_dist)
+            current_dist = compute_distribution(current[dim], config)
+            baseline_dist = compute_distribution(baseline[dim], config)
+
+            kl_value = kl_divergence(current_dist, baseline_dist)
             dimension_kl[dim] = kl_value
 
         overall_kl = sum(dimension_kl.values()) / len(dimension_kl)
@@ -58,9 +58,8 @@ def detect_kl_drift(
         )
 
 
-def _compute_distribution(
-    dataset: Dataset,
-    dimension: str,
+def compute_distribution(
+    histogram: Histogram,
     config: Config,
 ) -> Dict[int, float]:
     """
@@ -73,9 +72,8 @@ def _compute_distribution(
         for score in range(config.score_min, config.score_max + 1)
     }
 
-    for entry in dataset:
-        score = entry.scores[dimension]
-        counts[score] += 1
+    for score, count in histogram.items():
+        counts[score] += count
 
     total = sum(counts.values())
 
@@ -85,7 +83,7 @@ def _compute_distribution(
     }
 
 
-def _kl_divergence(
+def kl_divergence(
     p: Dict[int, float],
     q: Dict[int, float],
 ) -> float:
@@ -99,3 +97,16 @@ def _kl_divergence(
         kl += p[key] * math.log(p[key] / q[key])
 
     return kl
+
+
+def js_divergence(
+    p: Dict[int, float],
+    q: Dict[int, float],
+) -> float:
+    """
+    Compute Jensen-Shannon divergence (natural log, bounded by ln 2).
+    """
+
+    m = {key: (p[key] + q[key]) / 2 for key in p}
+
+    return (kl_divergence(p, m) + kl_divergence(q, m)) / 2
@@ -3,59 +3,132 @@ Advanced Statistical Methods
 
 Author: Pradeep Kumar
 
-Implements bootstrap-based significance testing.
+Implements bootstrap-based significance testing and an exact
+permutation test.
+
+Resampling is batched: draws for many iterations are taken in one call
+and reduced with C-level slice sums instead of per-iteration lists and
+mean() calls. Scores are kept as integer per-entry totals so the extremeness
+comparison is exact rather than subject to float rounding.
+
+Scores are discrete, so per-entry totals take few distinct values.
+The default "multinomial" method draws each resample of a group as
+bin counts of the pooled histogram, one binomial per distinct value,
+which is equivalent in distribution to drawing n values with
+replacement but costs O(distinct values) per iteration instead of
+O(n). The default "auto" uses it once the sample is large relative to
+the number of distinct values; "resample" and "multinomial" force
+either method.
+
+The permutation test needs no sampling at all: the null distribution
+of group A's score sum, over every way of splitting the pooled entries
+into groups of the observed sizes, is computed by dynamic programming
+over the pooled histogram of totals. The (drawn count, drawn sum) state
+space grows with the square of the smaller group and each state takes
+up to one transition per drawn entry, so the work is cubic in the
+smaller group (times the span of totals). Above
+_PERMUTATION_STATE_BUDGET the test falls back to the normal
+approximation of the same permutation distribution, which is accurate
+at those sizes.
+
+Iterations are split into fixed-size blocks, each with its own RNG
+stream derived from the seed and block index. Blocks may run in a
+process pool; because block boundaries do not depend on the worker
+count, the merged p-value is identical for any number of workers.
 """
 
+import math
 import random
-from typing import Dict, List
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
-from .models import Dataset
+from .summary import Histogram, SummarySource, group_histograms
 from .config import Config
-from .utils import mean, set_global_seed
+from .utils import binomial_variate, derive_rng
 from .exceptions import StatisticalComputationError
 
 
+# Upper bound on resampled values materialized per batch.
+_BATCH_ELEMENTS = 1 << 20
+
+# Iterations per independently seeded block.
+_BLOCK_ITERATIONS = 4096
+
+BOOTSTRAP_METHODS = ("auto", "multinomial", "resample")
+
+# Work bound (see _permutation_states) above which the permutation test
+# uses its normal approximation; the bound overestimates, so this is
+# roughly a second of work (about 200 entries per group at 0..10).
+_PERMUTATION_STATE_BUDGET = 100_000_000
+
+# "auto" switches to multinomial draws above this many entries per
+# distinct value: a Python-level binomial per bin costs about as much
+# as drawing and summing this many values in C.
+_MULTINOMIAL_MIN_ENTRIES_PER_BIN = 40
+
+
 def bootstrap_significance_test(
-    dataset: Dataset,
+    dataset: SummarySource,
     config: Config,
 ) -> Dict[str, float]:
 
-    try:
-        set_global_seed(config.random_seed)
+    if config.bootstrap_method not in BOOTSTRAP_METHODS:
+        raise StatisticalComputationError(
+            f"Unknown bootstrap method: {config.bootstrap_method}"
+        )
 
-        group_scores = _collect_group_scores(dataset)
+    try:
+        histograms = list(group_histograms(dataset, config).values())
 
-        if len(group_scores) != 2:
+        if len(histograms) != 2:
             raise StatisticalComputationError(
                 "Bootstrap requires exactly two groups."
             )
 
-        groups = list(group_scores.keys())
-        group_a = group_scores[groups[0]]
-        group_b = group_scores[groups[1]]
+        histogram_a, histogram_b = histograms
+        n_a = sum(histogram_a.values())
+        n_b = sum(histogram_b.values())
 
-        if len(group_a) < 2 or len(group_b) < 2:
+        if n_a < 2 or n_b < 2:
             raise StatisticalComputationError(
                 "Bootstrap requires at least 2 samples per group."
             )
 
-        observed_diff = mean(group_a) - mean(group_b)
+        sum_a = sum(value * count for value, count in histogram_a.items())
+        sum_b = sum(value * count for value, count in histogram_b.items())
 
-        combined = group_a + group_b
-        n_a = len(group_a)
+        n_dimensions = len(config.required_dimensions)
+        observed_diff = (sum_a / n_a - sum_b / n_b) / n_dimensions
+        observed = sum_a * n_b - sum_b * n_a
 
-        count_extreme = 0
+        pooled = Counter(histogram_a) + Counter(histogram_b)
+        bins = sorted(pooled)
+        method = config.bootstrap_method
 
-        for _ in range(config.bootstrap_iterations):
-            resample = random.choices(combined, k=len(combined))
+        if method == "auto":
+            method = (
+                "multinomial"
+                if n_a + n_b > _MULTINOMIAL_MIN_ENTRIES_PER_BIN * len(bins)
+                else "resample"
+            )
 
-            resample_a = resample[:n_a]
-            resample_b = resample[n_a:]
+        count_block: Callable[..., int]
+        data: Tuple[Any, ...]
 
-            diff = mean(resample_a) - mean(resample_b)
+        if method == "multinomial":
+            count_block = _count_extreme_multinomial
+            data = (bins, [pooled[value] for value in bins], n_a, observed)
+        else:
+            count_block = _count_extreme_resamples
+            data = (
+                _expand_histogram(histogram_a)
+                + _expand_histogram(histogram_b),
+                n_a,
+                observed,
+            )
 
-            if abs(diff) >= abs(observed_diff):
-                count_extreme += 1
+        count_extreme = _run_bootstrap_blocks(count_block, data, config)
 
         empirical_p = count_extreme / config.bootstrap_iterations
 
@@ -71,16 +144,396 @@ def bootstrap_significance_test(
         )
 
 
-def _collect_group_scores(dataset: Dataset) -> Dict[str, List[float]]:
-    group_scores: Dict[str, List[float]] = {}
+def exact_permutation_test(
+    dataset: SummarySource,
+    config: Config,
+) -> Dict[str, Any]:
+    """
+    Two-sided permutation test of the difference in mean entry scores
+    between two groups.
+
+    The p-value is the probability, over all equally likely
+    reassignments of the pooled entries to groups of the observed
+    sizes, of a mean difference at least as large as the observed
+    one. It is exact ("method": "exact") while the dynamic program
+    fits _PERMUTATION_STATE_BUDGET, otherwise normal-approximated
+    ("method": "normal").
+    """
+
+    try:
+        histograms = list(group_histograms(dataset, config).values())
+
+        if len(histograms) != 2:
+            raise StatisticalComputationError(
+                "Permutation test requires exactly two groups."
+            )
+
+        histogram_a, histogram_b = histograms
+        n_a = sum(histogram_a.values())
+        n_b = sum(histogram_b.values())
+
+        if n_a < 2 or n_b < 2:
+            raise StatisticalComputationError(
+                "Permutation test requires at least 2 samples per group."
+            )
+
+        sum_a = sum(value * count for value, count in histogram_a.items())
+        sum_b = sum(value * count for value, count in histogram_b.items())
+
+        observed_diff = (sum_a / n_a - sum_b / n_b) / len(
+            config.required_dimensions
+        )
+
+        pooled = Counter(histogram_a) + Counter(histogram_b)
+
+        # Splits are symmetric, so track whichever group is smaller
+        draws, drawn_sum = (n_a, sum_a) if n_a <= n_b else (n_b, sum_b)
+
+        if _permutation_states(pooled, draws) <= _PERMUTATION_STATE_BUDGET:
+            p_value = _exact_permutation_p_value(pooled, draws, drawn_sum)
+            method = "exact"
+        else:
+            p_value = _normal_permutation_p_value(pooled, draws, drawn_sum)
+            method = "normal"
+
+        return {
+            "observed_mean_difference": observed_diff,
+            "p_value": p_value,
+            "method": method,
+            "significant": p_value < config.significance_alpha,
+        }
+
+    except Exception as e:
+        raise StatisticalComputationError(
+            f"Permutation test failed: {str(e)}"
+        )
+
+
+def format_permutation_test(result: Dict[str, Any]) -> str:
+    """
+    The raw result, with a note when the p-value is approximate.
+    """
+
+    text = str(result)
+
+    if result["method"] != "exact":
+        text += (
+            "\nNote: p-value is a normal approximation; the exact "
+            "permutation distribution exceeds the work budget."
+        )
+
+    return text
+
+
+def _permutation_states(pooled: Histogram, draws: int) -> int:
+    """
+    Upper bound on the work of _exact_permutation_p_value: (drawn
+    count, drawn sum) states times the transitions into each, cubic
+    in draws.
+    """
+
+    span = max(pooled) - min(pooled)
+    states = (draws + 1) * (draws * span + 1)
+
+    return states * (draws + len(pooled))
+
+
+def _exact_permutation_p_value(
+    pooled: Histogram,
+    draws: int,
+    drawn_sum: int,
+) -> float:
+    """
+    P(|S * N - T * draws| >= |drawn_sum * N - T * draws|) where S is the
+    sum of draws entries taken without replacement from pooled (N
+    entries summing to T).
+
+    Bins are processed in turn; rows[j][s] is the probability that j
+    entries with shifted sum s have been taken from the bins so far.
+    The number taken from each bin, given how many remain to be taken,
+    is hypergeometric, so every probability stays within float range.
+    """
+
+    low = min(pooled)
+    population = sum(pooled.values())
+    total = sum(value * count for value, count in pooled.items())
+
+    rows: Dict[int, List[float]] = {0: [1.0]}
+    remaining = population
+
+    for value in sorted(pooled):
+        count = pooled[value]
+        shift = value - low
+        updated: Dict[int, List[float]] = {}
+
+        for taken, row in rows.items():
+            needed = draws - taken
+
+            for drawn, weight in _hypergeometric_pmf(
+                remaining, count, needed
+            ):
+                offset = shift * drawn
+                target = updated.setdefault(taken + drawn, [])
+                length = offset + len(row)
+
+                if len(target) < length:
+                    target.extend([0.0] * (length - len(target)))
+
+                target[offset:length] = [
+                    current + weight * probability
+                    for current, probability in zip(
+                        target[offset:length], row
+                    )
+                ]
+
+        rows = updated
+        remaining -= count
+
+    threshold = abs(drawn_sum * population - total * draws)
+
+    return min(
+        1.0,
+        sum(
+            probability
+            for shifted, probability in enumerate(rows[draws])
+            if abs((shifted + low * draws) * population - total * draws)
+            >= threshold
+        ),
+    )
+
+
+def _hypergeometric_pmf(
+    population: int,
+    successes: int,
+    draws: int,
+) -> List[Tuple[int, float]]:
+    """
+    (k, P(k)) for k successes in draws taken without replacement from
+    population items of which successes are marked; zero terms omitted.
+    """
+
+    low = max(0, draws - (population - successes))
+    high = min(successes, draws)
+
+    if low == high:
+        return [(low, 1.0)]
+
+    log_total = _log_binomial(population, draws)
+
+    return [
+        (
+            k,
+            math.exp(
+                _log_binomial(successes, k)
+                + _log_binomial(population - successes, draws - k)
+                - log_total
+            ),
+        )
+        for k in range(low, high + 1)
+    ]
+
+
+def _log_binomial(n: int, k: int) -> float:
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def _normal_permutation_p_value(
+    pooled: Histogram,
+    draws: int,
+    drawn_sum: int,
+) -> float:
+    """
+    Normal approximation of the same permutation distribution, using
+    its exact mean and variance (sampling without replacement).
+    """
+
+    population = sum(pooled.values())
+    mean = sum(value * count for value, count in pooled.items()) / population
+    variance = (
+        sum(count * (value - mean) ** 2 for value, count in pooled.items())
+        / population
+    )
+
+    sum_variance = (
+        draws * variance * (population - draws) / (population - 1)
+    )
+
+    if sum_variance == 0:
+        return 1.0
+
+    z = abs(drawn_sum - draws * mean) / math.sqrt(sum_variance)
+
+    return math.erfc(z / math.sqrt(2))
+
+
+def _run_bootstrap_blocks(
+    count_block: Callable[..., int],
+    data: Tuple[Any, ...],
+    config: Config,
+) -> int:
+    """
+    Split iterations into seeded blocks and merge their extreme counts,
+    in-process or across config.workers processes.
+    """
+
+    blocks: List[Tuple[int, int]] = []
+
+    for index, start in enumerate(
+        range(0, config.bootstrap_iterations, _BLOCK_ITERATIONS)
+    ):
+        size = min(_BLOCK_ITERATIONS, config.bootstrap_iterations - start)
+        blocks.append((index, size))
+
+    workers = min(config.workers, len(blocks))
+
+    if workers <= 1:
+        return _count_blocks(count_block, data, config.random_seed, blocks)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _count_blocks,
+                count_block,
+                data,
+                config.random_seed,
+                blocks[worker::workers],
+            )
+            for worker in range(workers)
+        ]
+
+        return sum(future.result() for future in futures)
+
+
+def _count_blocks(
+    count_block: Callable[..., int],
+    data: Tuple[Any, ...],
+    seed: int,
+    blocks: List[Tuple[int, int]],
+) -> int:
+    """
+    Worker entry point: process (block index, iterations) pairs with
+    count_block(*data, iterations, rng).
+    """
+
+    return sum(
+        count_block(*data, size, derive_rng(seed, index))
+        for index, size in blocks
+    )
+
+
+def _count_extreme_resamples(
+    combined: Sequence[int],
+    n_a: int,
+    observed: int,
+    iterations: int,
+    rng: random.Random,
+) -> int:
+    """
+    Count resamples whose mean difference, scaled by n_a * n_b and the
+    dimension count, is at least as extreme as the observed one.
+
+    Each batch draws the resamples for many iterations as one flat
+    (batch x n) block and reduces every row to its group-A and group-B
+    sums with C-level slice sums.
+    """
+
+    n = len(combined)
+    n_b = n - n_a
+    threshold = abs(observed)
+    batch_size = max(1, _BATCH_ELEMENTS // n)
+
+    count_extreme = 0
+    remaining = iterations
+
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        remaining -= batch
+
+        resampled = rng.choices(combined, k=n * batch)
+
+        for start in range(0, n * batch, n):
+            sum_a = sum(resampled[start:start + n_a])
+            sum_b = sum(resampled[start + n_a:start + n])
+
+            if abs(sum_a * n_b - sum_b * n_a) >= threshold:
+                count_extreme += 1
+
+    return count_extreme
+
+
+def _count_extreme_multinomial(
+    values: Sequence[int],
+    counts: Sequence[int],
+    n_a: int,
+    observed: int,
+    iterations: int,
+    rng: random.Random,
+) -> int:
+    """
+    Same statistic as _count_extreme_resamples, drawing each group's
+    resample as multinomial bin counts over the pooled histogram
+    (values with their counts).
+
+    The counts are drawn bin by bin as binomials conditioned on the
+    draws so far, so an iteration costs O(len(values)) regardless of
+    the number of entries.
+    """
+
+    n = sum(counts)
+    n_b = n - n_a
+    threshold = abs(observed)
+    bins = list(zip(values, counts))[:-1]
+    last = values[-1]
+
+    count_extreme = 0
+
+    for _ in range(iterations):
+        sum_a = _multinomial_total(bins, last, n, n_a, rng)
+        sum_b = _multinomial_total(bins, last, n, n_b, rng)
+
+        if abs(sum_a * n_b - sum_b * n_a) >= threshold:
+            count_extreme += 1
+
+    return count_extreme
+
+
+def _multinomial_total(
+    bins: Sequence[Tuple[int, int]],
+    last: int,
+    population: int,
+    draws: int,
+    rng: random.Random,
+) -> int:
+    """
+    Sum of draws values sampled with replacement from a population
+    given as (value, count) bins plus a final bin holding last.
+    """
+
+    total = 0
+
+    for value, count in bins:
+        if not draws:
+            return total
+
+        taken = binomial_variate(rng, draws, count / population)
+        total += value * taken
+        draws -= taken
+        population -= count
+
+    return total + last * draws
+
+
+def _expand_histogram(histogram: Histogram) -> List[int]:
+    """
+    Values of a histogram in ascending order.
 
-    for entry in dataset:
-        entry_mean = mean(entry.scores.values())
-        group = entry.metadata.group
+    Resampling from the sorted expansion makes the result independent
+    of row order, so sharded and single-file inputs agree.
+    """
 
-        if group not in group_scores:
-            group_scores[group] = []
+    values: List[int] = []
 
-        group_scores[group].append(entry_mean)
+    for value in sorted(histogram):
+        values.extend([value] * histogram[value])
 
-    return group_scores
\ No newline at end of file
+    return values
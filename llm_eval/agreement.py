@@ -4,68 +4,272 @@ Inter-Rater Agreement Layer
 Author: Pradeep Kumar
 
 Implements Cohen's Kappa for inter-rater reliability.
+
+Agreement is computed from per-dimension k x k contingency tables
+built in a single pass over the rating pairs. Unweighted, linear and
+quadratic weighted kappa all derive from the same tables.
+IncrementalAgreement grows the tables one rating at a time for data
+that is still arriving.
 """
 
-from typing import Dict, List, DefaultDict
-from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, DefaultDict
+from collections import Counter, defaultdict
 
-from .models import Dataset, EvaluationEntry
 from .config import Config
+from .models import EvaluationEntry
+from .score_matrix import ScoreMatrix, ScoreSource, as_score_matrix
 from .exceptions import StatisticalComputationError
 
 
+ContingencyTable = List[List[int]]
+
+KAPPA_WEIGHTS = ("linear", "quadratic")
+
+# Ratings of each ID: one per rater
+RATINGS_PER_ID = 2
+
+
 def compute_cohens_kappa(
-    dataset: Dataset,
+    dataset: ScoreSource,
     config: Config,
+    weights: Optional[str] = None,
 ) -> Dict[str, float]:
     """
     Compute Cohen's Kappa per dimension.
     Assumes exactly two raters (groups) scoring same IDs.
+
+    weights may be None (unweighted), "linear" or "quadratic".
     """
 
     try:
-        paired_entries = _pair_by_id(dataset)
+        tables = build_contingency_tables(dataset, config)
 
-        kappa_results: Dict[str, float] = {}
+        return {
+            dimension: kappa_from_table(table, weights)
+            for dimension, table in tables.items()
+        }
 
-        for dimension in config.required_dimensions:
-            rater_a_scores: List[int] = []
-            rater_b_scores: List[int] = []
+    except Exception as e:
+        raise StatisticalComputationError(
+            f"Cohen's Kappa computation failed: {str(e)}"
+        )
 
-            for pair in paired_entries.values():
-                rater_a_scores.append(pair[0].scores[dimension])
-                rater_b_scores.append(pair[1].scores[dimension])
 
-            kappa = _cohens_kappa(rater_a_scores, rater_b_scores)
-            kappa_results[dimension] = kappa
+def build_contingency_tables(
+    dataset: ScoreSource,
+    config: Config,
+) -> Dict[str, ContingencyTable]:
+    """
+    Build a k x k table per dimension, where cell [i][j] counts pairs
+    in which the first rating is score_min + i and the second is
+    score_min + j.
 
-        return kappa_results
+    All dimensions are tallied in one pass by counting joint score
+    vectors of each pair, then folding those counts into the tables.
+    """
 
-    except Exception as e:
+    matrix = as_score_matrix(dataset, config)
+    first_rows, second_rows = _pair_by_id(matrix)
+
+    first_columns = [
+        list(map(column.__getitem__, first_rows))
+        for column in matrix.columns
+    ]
+    second_columns = [
+        list(map(column.__getitem__, second_rows))
+        for column in matrix.columns
+    ]
+
+    joint_counts = Counter(zip(*first_columns, *second_columns))
+
+    k = config.score_max - config.score_min + 1
+    n_dimensions = len(matrix.dimensions)
+    tables: List[ContingencyTable] = [
+        [[0] * k for _ in range(k)] for _ in range(n_dimensions)
+    ]
+
+    for key, count in joint_counts.items():
+        for position, table in enumerate(tables):
+            i = key[position] - config.score_min
+            j = key[n_dimensions + position] - config.score_min
+            table[i][j] += count
+
+    return dict(zip(matrix.dimensions, tables))
+
+
+class IncrementalAgreement:
+    """
+    Contingency tables updated as ratings arrive.
+
+    As in build_contingency_tables, the first rating of an ID is the
+    first rater's and the second the other's. A first rating waits
+    until its pair arrives; unpaired ratings do not count.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+        k = config.score_max - config.score_min + 1
+        self.tables: Dict[str, ContingencyTable] = {
+            dim: [[0] * k for _ in range(k)]
+            for dim in config.required_dimensions
+        }
+        self.pairs = 0
+
+        self._pending: Dict[int, Tuple[int, ...]] = {}
+        self._paired: Set[int] = set()
+
+    def add(self, entry: EvaluationEntry) -> None:
+        if entry.id in self._paired:
+            raise StatisticalComputationError(
+                f"ID {entry.id} must have exactly 2 ratings."
+            )
+
+        dimensions = self.config.required_dimensions
+        vector = entry.score_vector(dimensions)
+        first = self._pending.pop(entry.id, None)
+
+        if first is None:
+            self._pending[entry.id] = vector
+            return
+
+        score_min = self.config.score_min
+
+        for dim, a, b in zip(dimensions, first, vector):
+            self.tables[dim][a - score_min][b - score_min] += 1
+
+        self._paired.add(entry.id)
+        self.pairs += 1
+
+    def check_complete(self) -> None:
+        """
+        Raise if any ID is still waiting for its second rating, as the
+        batch path does once the dataset is complete.
+        """
+
+        if self._pending:
+            entry_id = next(iter(self._pending))
+            raise StatisticalComputationError(
+                f"ID {entry_id} must have exactly 2 ratings."
+            )
+
+    def kappa(self, weights: Optional[str] = None) -> Dict[str, float]:
+        """
+        Cohen's Kappa per dimension over the pairs completed so far.
+        """
+
+        try:
+            return {
+                dimension: kappa_from_table(table, weights)
+                for dimension, table in self.tables.items()
+            }
+
+        except Exception as e:
+            raise StatisticalComputationError(
+                f"Cohen's Kappa computation failed: {str(e)}"
+            )
+
+
+def kappa_from_table(
+    table: ContingencyTable,
+    weights: Optional[str] = None,
+) -> float:
+    """
+    Compute (weighted) Cohen's Kappa from a square contingency table.
+    """
+
+    k = len(table)
+    n = sum(sum(row) for row in table)
+
+    if n == 0:
         raise StatisticalComputationError(
-            f"Cohen's Kappa computation failed: {str(e)}"
+            "Cannot compute kappa on empty ratings."
         )
 
+    agreement = _agreement_weights(k, weights)
+
+    row_totals = [sum(row) for row in table]
+    column_totals = [sum(column) for column in zip(*table)]
+
+    observed_agreement: float = sum(
+        agreement[i][j] * table[i][j]
+        for i in range(k)
+        for j in range(k)
+    ) / n
+
+    expected_agreement: float = sum(
+        agreement[i][j] * row_totals[i] * column_totals[j]
+        for i in range(k)
+        for j in range(k)
+    ) / (n * n)
+
+    if expected_agreement == 1:
+        return 1.0
+
+    return (observed_agreement - expected_agreement) / (
+        1 - expected_agreement
+    )
+
+
+def _agreement_weights(
+    k: int,
+    weights: Optional[str],
+) -> List[List[float]]:
+    """
+    Agreement weight matrix: identity for unweighted kappa, otherwise
+    1 - d (linear) or 1 - d^2 (quadratic) with d = |i - j| / (k - 1).
+    """
+
+    if weights is None:
+        return [
+            [1.0 if i == j else 0.0 for j in range(k)]
+            for i in range(k)
+        ]
+
+    if weights not in KAPPA_WEIGHTS:
+        raise StatisticalComputationError(
+            f"Unknown kappa weighting: {weights}"
+        )
+
+    if k == 1:
+        return [[1.0]]
+
+    distances = [
+        [abs(i - j) / (k - 1) for j in range(k)]
+        for i in range(k)
+    ]
+
+    if weights == "linear":
+        return [[1 - d for d in row] for row in distances]
+
+    return [[1 - d * d for d in row] for row in distances]
+
 
 def _pair_by_id(
-    dataset: Dataset,
-) -> Dict[int, List[EvaluationEntry]]:
+    matrix: ScoreMatrix,
+) -> Tuple[List[int], List[int]]:
     """
-    Group entries by ID and ensure exactly two ratings per ID.
+    Group rows by ID and ensure exactly two ratings per ID.
+
+    Returns the row indices of the first and second rating of each
+    ID, in first-seen order.
     """
 
-    grouped: DefaultDict[int, List[EvaluationEntry]] = defaultdict(list)
+    grouped: DefaultDict[int, List[int]] = defaultdict(list)
 
-    for entry in dataset:
-        grouped[entry.id].append(entry)
+    for row, entry_id in enumerate(matrix.ids):
+        grouped[entry_id].append(row)
 
-    for entry_id, entries in grouped.items():
-        if len(entries) != 2:
+    for entry_id, rows in grouped.items():
+        if len(rows) != 2:
             raise StatisticalComputationError(
                 f"ID {entry_id} must have exactly 2 ratings."
             )
 
-    return dict(grouped)
+    first_rows = [rows[0] for rows in grouped.values()]
+    second_rows = [rows[1] for rows in grouped.values()]
+
+    return first_rows, second_rows
 
 
 def _cohens_kappa(
@@ -81,33 +285,17 @@ def _cohens_kappa(
             "Rater score lengths mismatch."
         )
 
-    n = len(rater_a)
-
-    if n == 0:
+    if not rater_a:
         raise StatisticalComputationError(
             "Cannot compute kappa on empty ratings."
         )
 
-    observed_agreement = sum(
-        1 for a, b in zip(rater_a, rater_b) if a == b
-    ) / n
-
-    categories = set(rater_a) | set(rater_b)
+    categories = sorted(set(rater_a) | set(rater_b))
+    index = {category: i for i, category in enumerate(categories)}
 
-    prob_a: Dict[int, float] = {
-        c: rater_a.count(c) / n for c in categories
-    }
-    prob_b: Dict[int, float] = {
-        c: rater_b.count(c) / n for c in categories
-    }
+    table: ContingencyTable = [[0] * len(categories) for _ in categories]
 
-    expected_agreement = sum(
-        prob_a[c] * prob_b[c] for c in categories
-    )
+    for (a, b), count in Counter(zip(rater_a, rater_b)).items():
+        table[index[a]][index[b]] += count
 
-    if expected_agreement == 1:
-        return 1.0
-
-    return (observed_agreement - expected_agreement) / (
-        1 - expected_agreement
-    )
\ No newline at end of file
+    return kappa_from_table(table)
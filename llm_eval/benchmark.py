@@ -6,21 +6,22 @@ Author: Pradeep Kumar
 Compares evaluation dataset against a reference dataset.
 """
 
-from typing import Dict, List
+from typing import Dict
 
-from .models import Dataset
 from .config import Config
+from .summary import SummarySource, dimension_histograms, histogram_mean
 from .utils import mean
 from .exceptions import StatisticalComputationError
 
 
 def benchmark_against_reference(
-    dataset: Dataset,
-    reference_dataset: Dataset,
+    dataset: SummarySource,
+    reference_dataset: SummarySource,
     config: Config,
 ) -> Dict[str, object]:
     """
     Compare dataset against reference dataset.
+    Either side may be a prebuilt ScoreMatrix or DatasetSummary.
 
     Returns:
         {
@@ -72,21 +73,11 @@ def benchmark_against_reference(
 
 
 def _compute_dimension_means(
-    dataset: Dataset,
+    dataset: SummarySource,
     config: Config,
 ) -> Dict[str, float]:
 
-    dimension_scores: Dict[str, List[int]] = {
-        dim: [] for dim in config.required_dimensions
-    }
-
-    for entry in dataset:
-        for dim in config.required_dimensions:
-            dimension_scores[dim].append(
-                entry.scores[dim]
-            )
-
     return {
-        dim: mean(scores)
-        for dim, scores in dimension_scores.items()
-      }
+        dim: histogram_mean(histogram)
+        for dim, histogram in dimension_histograms(dataset, config).items()
+    }
@@ -0,0 +1,455 @@
+"""
+Binary Dataset Format
+
+Author: Pradeep Kumar
+
+Compact columnar storage for already-validated datasets.
+
+File layout (little-endian):
+
+    magic            8 bytes   b"LLMEVAL\\x01"
+    header offset    uint64
+    header length    uint64
+    text blob        UTF-8 prompt/response bytes, back to back
+    sections         8-byte aligned typed columns
+    header           JSON: counts, labels, section table, config
+
+Sections hold entry IDs, one fixed-width score column per dimension,
+dictionary-encoded group and model codes, epoch-microsecond timestamps
+with UTC offsets, and an offsets table into the text blob. Opening a
+file memory-maps it and exposes every column as a zero-copy memoryview,
+so an analysis can start in milliseconds and several processes can
+share the same pages.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from .config import Config
+from .models import EvaluationEntry, Metadata, Text
+from .score_matrix import ScoreMatrix, score_typecode
+from .cache import SUMMARY_CONFIG_FIELDS, config_fingerprint
+from .validation import iter_validated_entries
+from .utils import default_file_mode
+from .exceptions import DatasetValidationError
+
+
+MAGIC = b"LLMEVAL\x01"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sQQ")
+_ALIGNMENT = 8
+
+# Offset marker for timestamps that carried no timezone.
+_NAIVE_OFFSET = -(1 << 31)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def is_binary_dataset(path: Path) -> bool:
+    """
+    True if the file starts with the binary dataset magic.
+    """
+
+    try:
+        with path.open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def convert_to_binary(
+    source: Path,
+    target: Path,
+    config: Config,
+) -> int:
+    """
+    Validate a JSON/JSON Lines dataset and write it in binary form.
+
+    Returns the number of entries written. The target is only
+    replaced once the whole source has passed validation.
+    """
+
+    return write_binary_dataset(
+        iter_validated_entries(source, config),
+        target,
+        config,
+    )
+
+
+def write_binary_dataset(
+    entries: Iterable[EvaluationEntry],
+    path: Path,
+    config: Config,
+) -> int:
+    """
+    Write validated entries to a binary dataset file atomically.
+
+    Text is streamed straight to disk; only the fixed-width columns
+    are buffered in memory.
+    """
+
+    dimensions = tuple(config.required_dimensions)
+
+    ids = array("q")
+    columns = [array(score_typecode(config)) for _ in dimensions]
+    group_codes = array("I")
+    model_codes = array("I")
+    timestamps = array("q")
+    utc_offsets = array("i")
+    text_offsets = array("Q", [0])
+    group_index: Dict[str, int] = {}
+    model_index: Dict[str, int] = {}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, 0, 0))
+            position = 0
+
+            for entry in entries:
+                ids.append(entry.id)
+
+                for column, value in zip(
+                    columns, entry.score_vector(dimensions)
+                ):
+                    column.append(value)
+
+                group_codes.append(
+                    group_index.setdefault(
+                        entry.metadata.group, len(group_index)
+                    )
+                )
+                model_codes.append(
+                    model_index.setdefault(
+                        entry.metadata.model, len(model_index)
+                    )
+                )
+
+                micros, offset = _encode_timestamp(entry.metadata.timestamp)
+                timestamps.append(micros)
+                utc_offsets.append(offset)
+
+                for text in entry.load_text():
+                    encoded = text.encode("utf-8")
+                    f.write(encoded)
+                    position += len(encoded)
+                    text_offsets.append(position)
+
+            sections: Dict[str, List[int]] = {}
+            named_arrays: List[Tuple[str, "array[int]"]] = [
+                ("ids", ids),
+                *(
+                    (f"score:{dim}", column)
+                    for dim, column in zip(dimensions, columns)
+                ),
+                ("group_codes", group_codes),
+                ("model_codes", model_codes),
+                ("timestamps", timestamps),
+                ("utc_offsets", utc_offsets),
+                ("text_offsets", text_offsets),
+            ]
+
+            for name, values in named_arrays:
+                _pad(f)
+                sections[name] = [f.tell(), len(values)]
+                _write_array(f, values)
+
+            header = json.dumps({
+                "version": FORMAT_VERSION,
+                "count": len(ids),
+                "dimensions": list(dimensions),
+                "typecodes": {
+                    name: values.typecode for name, values in named_arrays
+                },
+                "sections": sections,
+                "group_labels": list(group_index),
+                "model_labels": list(model_index),
+                "config": config_fingerprint(config, SUMMARY_CONFIG_FIELDS),
+            }).encode("utf-8")
+
+            header_offset = f.tell()
+            f.write(header)
+            f.seek(0)
+            f.write(_PREAMBLE.pack(MAGIC, header_offset, len(header)))
+
+        os.chmod(tmp_name, default_file_mode())
+        os.replace(tmp_name, path)
+
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return len(ids)
+
+
+class BinaryDataset:
+    """
+    Memory-mapped view of a binary dataset file.
+
+    Columns are zero-copy memoryviews into the mapping. Entries and
+    their text are only decoded when requested.
+    """
+
+    def __init__(self, path: Path, config: Config) -> None:
+        self.path = path
+
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+        self._views: List[memoryview] = []
+
+        try:
+            self._header = _read_header(self._mmap)
+            _check_compatible(self._header, config)
+
+            self.count: int = self._header["count"]
+            self.ids = self._section("ids")
+            self.timestamps = self._section("timestamps")
+            self.utc_offsets = self._section("utc_offsets")
+            self._text_offsets = self._section("text_offsets")
+
+            dimensions = tuple(self._header["dimensions"])
+
+            self.matrix = ScoreMatrix(
+                dimensions=dimensions,
+                columns=tuple(
+                    self._section(f"score:{dim}") for dim in dimensions
+                ),
+                ids=self.ids,
+                group_codes=self._section("group_codes"),
+                group_labels=tuple(self._header["group_labels"]),
+                model_codes=self._section("model_codes"),
+                model_labels=tuple(self._header["model_labels"]),
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[EvaluationEntry]:
+        return self.iter_entries()
+
+    def iter_entries(
+        self,
+        lazy_text: bool = False,
+    ) -> Iterator[EvaluationEntry]:
+        for row in range(self.count):
+            yield self.entry(row, lazy_text)
+
+    def __enter__(self) -> "BinaryDataset":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def text(self, row: int) -> Tuple[str, str]:
+        """
+        Decode the prompt and response of one row.
+        """
+
+        start = self._text_offsets[2 * row]
+        middle = self._text_offsets[2 * row + 1]
+        end = self._text_offsets[2 * row + 2]
+        blob_start = _PREAMBLE.size
+
+        return (
+            str(self._view[blob_start + start:blob_start + middle], "utf-8"),
+            str(self._view[blob_start + middle:blob_start + end], "utf-8"),
+        )
+
+    def timestamp(self, row: int) -> str:
+        return _decode_timestamp(self.timestamps[row], self.utc_offsets[row])
+
+    def entry(self, row: int, lazy_text: bool = False) -> EvaluationEntry:
+        """
+        Materialize one row as an EvaluationEntry.
+
+        With lazy_text the entry decodes its text from the mapping on
+        access, so it must not outlive this dataset.
+        """
+
+        matrix = self.matrix
+        text: Text = _BinaryText(self, row) if lazy_text else self.text(row)
+
+        return EvaluationEntry.from_score_vector(
+            id=self.ids[row],
+            dimensions=matrix.dimensions,
+            values=tuple(column[row] for column in matrix.columns),
+            metadata=Metadata(
+                model=matrix.model_labels[matrix.model_codes[row]],
+                timestamp=self.timestamp(row),
+                group=matrix.group_labels[matrix.group_codes[row]],
+            ),
+            text=text,
+        )
+
+    def copy_matrix(self) -> ScoreMatrix:
+        """
+        The score matrix with its columns copied out of the mapping,
+        so it stays valid after close().
+        """
+
+        matrix = self.matrix
+
+        return ScoreMatrix(
+            dimensions=matrix.dimensions,
+            columns=tuple(_copy_view(column) for column in matrix.columns),
+            ids=_copy_view(matrix.ids),
+            group_codes=_copy_view(matrix.group_codes),
+            group_labels=matrix.group_labels,
+            model_codes=_copy_view(matrix.model_codes),
+            model_labels=matrix.model_labels,
+        )
+
+    def close(self) -> None:
+        """
+        Release all views and unmap the file.
+        """
+
+        for view in self._views:
+            view.release()
+
+        self._view.release()
+        self._mmap.close()
+
+    def _section(self, name: str) -> memoryview:
+        offset, length = self._header["sections"][name]
+        typecode = self._header["typecodes"][name]
+        size = array(typecode).itemsize
+
+        view = self._view[offset:offset + length * size].cast(typecode)
+        self._views.append(view)
+        return view
+
+
+def _copy_view(view: Any) -> "array[int]":
+    return array(view.format, view.tobytes())
+
+
+class _BinaryText:
+    """
+    Text of one row of a mapped binary dataset.
+    """
+
+    __slots__ = ("dataset", "row")
+
+    def __init__(self, dataset: BinaryDataset, row: int) -> None:
+        self.dataset = dataset
+        self.row = row
+
+    def load(self) -> Tuple[str, str]:
+        return self.dataset.text(self.row)
+
+
+def open_binary_dataset(path: Path, config: Config) -> BinaryDataset:
+    """
+    Memory-map a binary dataset written under a compatible Config.
+    """
+
+    if not path.exists():
+        raise DatasetValidationError(f"Dataset file not found: {path}")
+
+    return BinaryDataset(path, config)
+
+
+def _read_header(buffer: mmap.mmap) -> Dict[str, Any]:
+    if len(buffer) < _PREAMBLE.size:
+        raise DatasetValidationError("Binary dataset is truncated.")
+
+    magic, offset, length = _PREAMBLE.unpack_from(buffer, 0)
+
+    if magic != MAGIC:
+        raise DatasetValidationError("Not a binary evaluation dataset.")
+
+    header: Dict[str, Any] = json.loads(buffer[offset:offset + length])
+
+    if header.get("version") != FORMAT_VERSION:
+        raise DatasetValidationError(
+            f"Unsupported binary dataset version: {header.get('version')}"
+        )
+
+    return header
+
+
+def _check_compatible(header: Dict[str, Any], config: Config) -> None:
+    """
+    Entries were validated when written; that only carries over if
+    the validation-relevant Config fields are unchanged.
+    """
+
+    if sys.byteorder != "little":
+        raise DatasetValidationError(
+            "Binary datasets can only be mapped on little-endian hosts."
+        )
+
+    if header["config"] != config_fingerprint(config, SUMMARY_CONFIG_FIELDS):
+        raise DatasetValidationError(
+            "Binary dataset was validated under a different Config."
+        )
+
+
+def _encode_timestamp(timestamp: str) -> Tuple[int, int]:
+    """
+    Epoch microseconds and UTC offset in seconds (or the naive marker).
+    """
+
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    utc_offset = parsed.utcoffset()
+
+    if utc_offset is None:
+        delta = parsed.replace(tzinfo=timezone.utc) - _EPOCH
+        offset = _NAIVE_OFFSET
+    else:
+        delta = parsed - _EPOCH
+        offset = int(utc_offset.total_seconds())
+
+    return delta // timedelta(microseconds=1), offset
+
+
+def _decode_timestamp(micros: int, offset: int) -> str:
+    """
+    ISO 8601 string for a stored timestamp; UTC is rendered with 'Z'.
+    """
+
+    moment = _EPOCH + timedelta(microseconds=micros)
+
+    if offset == _NAIVE_OFFSET:
+        return moment.replace(tzinfo=None).isoformat()
+
+    if offset == 0:
+        return moment.isoformat().replace("+00:00", "Z")
+
+    return moment.astimezone(timezone(timedelta(seconds=offset))).isoformat()
+
+
+def _pad(f: BinaryIO) -> None:
+    remainder = f.tell() % _ALIGNMENT
+
+    if remainder:
+        f.write(b"\0" * (_ALIGNMENT - remainder))
+
+
+def _write_array(f: BinaryIO, values: "array[int]") -> None:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    values.tofile(f)
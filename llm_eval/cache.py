@@ -0,0 +1,265 @@
+"""
+Caching Layer
+
+Author: Pradeep Kumar
+
+Persistent summaries of reference and baseline datasets.
+
+Benchmark and drift comparisons only need a DatasetSummary of the
+other dataset. The summary is stored in a sidecar JSON file keyed by
+the dataset's content hash and the Config fields that affect
+validation and histogram layout, so repeat comparisons against an
+unchanged file skip parsing and validation entirely.
+
+ResultCache stores finished analysis results in a content-addressed
+directory keyed by input hashes, Config and analysis version, with
+least-recently-used eviction once it outgrows its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import Config
+from .score_matrix import ScoreMatrix
+from .summary import DatasetSummary
+from .validation import iter_validated_entries
+from .utils import default_file_mode
+
+
+# Bump when the stored summary layout changes.
+SUMMARY_CACHE_VERSION = 1
+
+SUMMARY_CONFIG_FIELDS = (
+    "min_dataset_size",
+    "score_min",
+    "score_max",
+    "required_dimensions",
+)
+
+# Every Config field that can change a result; workers only changes
+# how results are computed.
+RESULT_CONFIG_FIELDS = tuple(
+    field.name for field in fields(Config) if field.name != "workers"
+)
+
+DEFAULT_RESULT_CACHE_BYTES = 64 << 20
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """
+    SHA-256 of a file's contents, read in chunks.
+    """
+
+    digest = hashlib.sha256()
+
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def config_fingerprint(
+    config: Config,
+    fields: Sequence[str],
+) -> Dict[str, Any]:
+    """
+    JSON-compatible snapshot of selected Config fields.
+    """
+
+    return {
+        field: list(value) if isinstance(value, tuple) else value
+        for field, value in (
+            (field, getattr(config, field)) for field in fields
+        )
+    }
+
+
+def load_summary_cached(
+    path: Path,
+    config: Config,
+    cache_dir: Optional[Path] = None,
+    digest: Optional[str] = None,
+) -> DatasetSummary:
+    """
+    Return the summary of a dataset file, using the sidecar cache.
+
+    On a miss the file is streamed through full validation and the
+    resulting summary is written next to it (or into cache_dir).
+    Failing to write the sidecar does not fail the evaluation.
+
+    Pass digest when the caller already has the file's file_digest,
+    so the file is not hashed twice.
+    """
+
+    key = {
+        "version": SUMMARY_CACHE_VERSION,
+        "digest": digest or file_digest(path),
+        "config": config_fingerprint(config, SUMMARY_CONFIG_FIELDS),
+    }
+
+    sidecar = _sidecar_path(path, cache_dir)
+    cached = _read_json(sidecar)
+
+    if cached is not None and cached.get("key") == key:
+        return DatasetSummary.from_dict(cached["summary"])
+
+    summary = DatasetSummary.from_matrix(
+        ScoreMatrix.from_entries(iter_validated_entries(path, config), config)
+    )
+
+    try:
+        write_json_atomic(sidecar, {"key": key, "summary": summary.to_dict()})
+    except OSError:
+        pass
+
+    return summary
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of analysis results.
+
+    Each result is one JSON file named by the SHA-256 of its key. A
+    hit refreshes the file's modification time; after every write the
+    least recently used files are removed until the directory fits in
+    max_bytes. Cache I/O failures never fail an evaluation.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(
+        analysis: str,
+        version: int,
+        digests: Sequence[str],
+        config: Config,
+        params: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Cache key for one analysis over inputs with the given content
+        digests; params holds any analysis options not in Config.
+        """
+
+        return {
+            "analysis": analysis,
+            "version": version,
+            "inputs": list(digests),
+            "config": config_fingerprint(config, RESULT_CONFIG_FIELDS),
+            "params": params,
+        }
+
+    def get(self, key: Dict[str, Any]) -> Optional[Any]:
+        """
+        Stored result for key, or None on a miss.
+        """
+
+        path = self._path(key)
+        cached = _read_json(path)
+
+        if cached is None or cached.get("key") != key:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return cached.get("result")
+
+    def put(self, key: Dict[str, Any], result: Any) -> None:
+        try:
+            write_json_atomic(self._path(key), {"key": key, "result": result})
+            self._evict()
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _path(self, key: Dict[str, Any]) -> Path:
+        encoded = json.dumps(key, sort_keys=True).encode("utf-8")
+        return self.directory / f"{hashlib.sha256(encoded).hexdigest()}.json"
+
+    def _evict(self) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def default_result_cache_dir() -> Path:
+    """
+    $XDG_CACHE_HOME/llm_eval/results, defaulting to ~/.cache.
+    """
+
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "llm_eval" / "results"
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """
+    Write JSON to a temporary file in the target directory and
+    rename it into place.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+    )
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.chmod(tmp_name, default_file_mode())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _sidecar_path(path: Path, cache_dir: Optional[Path]) -> Path:
+    if cache_dir is None:
+        return path.with_name(f"{path.name}.summary.json")
+
+    # Same-named files in different directories share cache_dir
+    location = hashlib.sha256(str(path.resolve()).encode("utf-8"))
+
+    return cache_dir / f"{path.name}.{location.hexdigest()[:16]}.summary.json"
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return data if isinstance(data, dict) else None
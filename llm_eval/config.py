@@ -21,6 +21,13 @@ class Config:
     # Bootstrap configuration
     bootstrap_iterations: int = 1000
     random_seed: int = 42
+    # "multinomial" draws bin counts of the pooled score histogram
+    # (O(distinct values) per iteration), "resample" draws n values,
+    # "auto" picks whichever is cheaper for the data
+    bootstrap_method: str = "auto"
+
+    # Parallel execution (1 runs everything in-process)
+    workers: int = 1
 
     # Required score dimensions
     required_dimensions: Tuple[str, ...] = (
@@ -6,20 +6,21 @@ Author: Pradeep Kumar
 Provides advanced per-dimension statistical diagnostics.
 """
 
-from typing import Dict, List
+from typing import Dict
 
-from .models import Dataset
 from .config import Config
-from .utils import mean, variance, standard_deviation
+from .summary import SummarySource, dimension_histograms
+from .utils import RunningStatistics
 from .exceptions import StatisticalComputationError
 
 
 def dimensional_breakdown(
-    dataset: Dataset,
+    dataset: SummarySource,
     config: Config,
 ) -> Dict[str, object]:
     """
     Perform detailed per-dimension statistical analysis.
+    Accepts a dataset, a prebuilt ScoreMatrix or a DatasetSummary.
 
     Returns:
         {
@@ -36,23 +37,17 @@ def dimensional_breakdown(
     """
 
     try:
-        dimension_scores: Dict[str, List[int]] = {
-            dim: [] for dim in config.required_dimensions
-        }
-
-        for entry in dataset:
-            for dim in config.required_dimensions:
-                dimension_scores[dim].append(
-                    entry.scores[dim]
-                )
+        histograms = dimension_histograms(dataset, config)
 
         dimension_statistics: Dict[str, Dict[str, float]] = {}
         high_variance_dimensions = []
 
-        for dim, scores in dimension_scores.items():
-            m = mean(scores)
-            var = variance(scores)
-            sd = standard_deviation(scores)
+        for dim, histogram in histograms.items():
+            stats = RunningStatistics.from_histogram(histogram)
+
+            m = stats.mean
+            var = stats.variance
+            sd = stats.standard_deviation
 
             if m == 0:
                 cv = 0.0
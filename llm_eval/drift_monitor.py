@@ -0,0 +1,309 @@
+"""
+Windowed Drift Monitor
+
+Author: Pradeep Kumar
+
+Drift as a time series: entries are bucketed into fixed windows of
+metadata.timestamp and each window's score distribution is compared
+with a fixed baseline or with the windows just before it.
+
+Per-window, per-dimension score counts are updated as entries are
+added, and the trailing reference is kept as a running sum (the
+newest window added, the oldest subtracted), so producing each point
+of the series costs O(dimensions x score bins) however many entries
+the windows hold.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import Config
+from .models import EvaluationEntry
+from .summary import Histogram, SummarySource, dimension_histograms
+from .advanced_drift import (
+    compute_distribution,
+    js_divergence,
+    kl_divergence,
+)
+from .exceptions import DriftDetectionError
+
+
+WINDOW_NAMES = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_WINDOW_PATTERN = re.compile(r"(\d+)([smhd]?)")
+
+
+def parse_window(spec: str) -> int:
+    """
+    Window length in seconds from "hour", "day", "week" or a count
+    with an optional unit: "900", "15m", "6h", "2d".
+    """
+
+    if spec in WINDOW_NAMES:
+        return WINDOW_NAMES[spec]
+
+    match = _WINDOW_PATTERN.fullmatch(spec.strip())
+
+    if match is None or int(match.group(1)) <= 0:
+        raise ValueError(f"Invalid drift window: {spec}")
+
+    return int(match.group(1)) * _WINDOW_UNITS[match.group(2) or "s"]
+
+
+class DriftMonitor:
+    """
+    Incremental per-window score histograms.
+
+    With a baseline, every window is compared against it; otherwise
+    against the merged counts of the previous trailing windows that
+    hold entries (the first window then has no reference).
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        window_seconds: int,
+        baseline: Optional[SummarySource] = None,
+        trailing: int = 1,
+    ) -> None:
+        if window_seconds <= 0:
+            raise DriftDetectionError("Drift window must be positive.")
+
+        if trailing < 1:
+            raise DriftDetectionError("Trailing window count must be >= 1.")
+
+        self.config = config
+        self.window_seconds = window_seconds
+        self.trailing = trailing
+
+        self._dimensions = config.required_dimensions
+        self._bins = config.score_max - config.score_min + 1
+        self._windows: Dict[int, List[List[int]]] = {}
+        self._last_timestamp: Optional[str] = None
+        self._last_window = 0
+
+        self._baseline: Optional[Dict[str, Dict[int, float]]] = None
+
+        if baseline is not None:
+            histograms = dimension_histograms(baseline, config)
+            self._baseline = {
+                dim: compute_distribution(histograms[dim], config)
+                for dim in self._dimensions
+            }
+
+    def add(self, entry: EvaluationEntry) -> None:
+        """
+        Count one entry into its timestamp's window.
+        """
+
+        timestamp = entry.metadata.timestamp
+
+        # Batch runs repeat timestamps; skip re-parsing the last one
+        if timestamp != self._last_timestamp:
+            self._last_window = self._window_of(timestamp)
+            self._last_timestamp = timestamp
+
+        counts = self._windows.get(self._last_window)
+
+        if counts is None:
+            counts = [[0] * self._bins for _ in self._dimensions]
+            self._windows[self._last_window] = counts
+
+        score_min = self.config.score_min
+
+        for column, value in zip(
+            counts, entry.score_vector(self._dimensions)
+        ):
+            column[value - score_min] += 1
+
+    def extend(self, entries: Iterable[EvaluationEntry]) -> "DriftMonitor":
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    def series(self) -> List[Dict[str, Any]]:
+        """
+        One point per non-empty window, in time order:
+
+            {
+                "window_start": ISO 8601 UTC,
+                "count": int,
+                "dimension_kl": {...}, "dimension_js": {...},
+                "overall_kl": float, "overall_js": float,
+                "drift_detected": bool
+            }
+
+        Divergence fields are None for a window without a reference.
+        drift_detected applies config.drift_threshold to overall_kl,
+        as detect_kl_drift does.
+        """
+
+        points: List[Dict[str, Any]] = []
+        order = sorted(self._windows)
+
+        reference = [[0] * self._bins for _ in self._dimensions]
+        reference_count = 0
+
+        for position, window in enumerate(order):
+            counts = self._windows[window]
+
+            if self._baseline is not None:
+                point = self._compare(window, counts, self._baseline)
+            elif reference_count:
+                point = self._compare(
+                    window, counts, self._distributions(reference)
+                )
+            else:
+                point = self._point(window, counts, None, None)
+
+            points.append(point)
+
+            # Slide the trailing reference forward by one window
+            _add_counts(reference, counts, 1)
+            reference_count += 1
+
+            if position >= self.trailing:
+                leaving = self._windows[order[position - self.trailing]]
+                _add_counts(reference, leaving, -1)
+                reference_count -= 1
+
+        return points
+
+    def _compare(
+        self,
+        window: int,
+        counts: List[List[int]],
+        reference: Dict[str, Dict[int, float]],
+    ) -> Dict[str, Any]:
+
+        current = self._distributions(counts)
+
+        dimension_kl = {
+            dim: kl_divergence(current[dim], reference[dim])
+            for dim in self._dimensions
+        }
+        dimension_js = {
+            dim: js_divergence(current[dim], reference[dim])
+            for dim in self._dimensions
+        }
+
+        return self._point(window, counts, dimension_kl, dimension_js)
+
+    def _point(
+        self,
+        window: int,
+        counts: List[List[int]],
+        dimension_kl: Optional[Dict[str, float]],
+        dimension_js: Optional[Dict[str, float]],
+    ) -> Dict[str, Any]:
+
+        overall_kl = overall_js = None
+
+        if dimension_kl is not None and dimension_js is not None:
+            overall_kl = sum(dimension_kl.values()) / len(dimension_kl)
+            overall_js = sum(dimension_js.values()) / len(dimension_js)
+
+        start = datetime.fromtimestamp(
+            window * self.window_seconds, tz=timezone.utc
+        )
+
+        return {
+            "window_start": start.isoformat().replace("+00:00", "Z"),
+            "count": sum(counts[0]),
+            "dimension_kl": dimension_kl,
+            "dimension_js": dimension_js,
+            "overall_kl": overall_kl,
+            "overall_js": overall_js,
+            "drift_detected": (
+                overall_kl is not None
+                and overall_kl > self.config.drift_threshold
+            ),
+        }
+
+    def _distributions(
+        self,
+        counts: List[List[int]],
+    ) -> Dict[str, Dict[int, float]]:
+
+        score_min = self.config.score_min
+
+        return {
+            dim: compute_distribution(
+                _as_histogram(column, score_min), self.config
+            )
+            for dim, column in zip(self._dimensions, counts)
+        }
+
+    def _window_of(self, timestamp: str) -> int:
+        moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+
+        return int(moment.timestamp()) // self.window_seconds
+
+
+def detect_windowed_drift(
+    entries: Iterable[EvaluationEntry],
+    config: Config,
+    window_seconds: int,
+    baseline: Optional[SummarySource] = None,
+    trailing: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Drift time series of a stream of entries; see DriftMonitor.
+    """
+
+    try:
+        monitor = DriftMonitor(config, window_seconds, baseline, trailing)
+        return monitor.extend(entries).series()
+
+    except DriftDetectionError:
+        raise
+
+    except Exception as e:
+        raise DriftDetectionError(
+            f"Windowed drift detection failed: {str(e)}"
+        )
+
+
+def format_drift_series(points: List[Dict[str, Any]]) -> str:
+    """
+    Fixed-width table of a drift time series.
+    """
+
+    lines = [
+        f"{'Window start':<22}{'Entries':>9}{'KL':>10}{'JS':>10}  Drift"
+    ]
+
+    for point in points:
+        kl, js = point["overall_kl"], point["overall_js"]
+        lines.append(
+            f"{point['window_start']:<22}{point['count']:>9}"
+            f"{'-' if kl is None else f'{kl:.4f}':>10}"
+            f"{'-' if js is None else f'{js:.4f}':>10}"
+            f"  {'yes' if point['drift_detected'] else 'no'}"
+        )
+
+    return "\n".join(lines)
+
+
+def _add_counts(
+    target: List[List[int]],
+    counts: List[List[int]],
+    sign: int,
+) -> None:
+    for target_column, column in zip(target, counts):
+        for index, count in enumerate(column):
+            target_column[index] += sign * count
+
+
+def _as_histogram(column: List[int], score_min: int) -> Histogram:
+    return {
+        score_min + index: count
+        for index, count in enumerate(column)
+        if count
+    }
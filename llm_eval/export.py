@@ -4,28 +4,227 @@ Export Layer
 Author: Pradeep Kumar
 
 Handles structured result exporting.
+
+Results are streamed: ResultWriter writes each analysis section as
+soon as it is handed over, and per-entry rows one at a time, so an
+export never holds more than one section or row in memory. Output
+goes to a temporary file beside the target and is renamed into place
+on success, so readers never see a partial export.
+
+Formats:
+
+- "json": one compact object, {"<section>": <result>, ...,
+  "entries": [<row>, ...]}
+- "jsonl": one compact object per line, {"section": ..., "result": ...}
+  for analyses and {"section": "entries", ...row} per entry
+
+Output is standard JSON: non-finite floats, such as the infinite t
+statistic of two constant groups with different means, are written as
+null.
 """
 
 import json
+import math
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from types import TracebackType
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Type
 
+from .config import Config
+from .models import EvaluationEntry
+from .utils import default_file_mode
 from .exceptions import EvaluationError
 
 
+EXPORT_FORMATS = ("json", "jsonl")
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), allow_nan=False)
+
+
+def export_format(path: Path) -> str:
+    """
+    Export format implied by the file suffix (JSON unless .jsonl).
+    """
+
+    return "jsonl" if path.suffix.lower() == ".jsonl" else "json"
+
+
 def export_results(
     results: Dict[str, Any],
     output_path: Path,
+    fmt: Optional[str] = None,
 ) -> None:
     """
     Export evaluation results to JSON file.
     """
 
+    with ResultWriter(output_path, fmt) as writer:
+        for name, value in results.items():
+            writer.write_section(name, value)
+
+
+class ResultWriter:
+    """
+    Incremental, atomic result exporter. Use as a context manager:
+    the file is committed on a clean exit and discarded on error.
+    """
+
+    def __init__(self, path: Path, fmt: Optional[str] = None) -> None:
+        self.path = path
+        self.fmt = fmt or export_format(path)
+
+        if self.fmt not in EXPORT_FORMATS:
+            raise EvaluationError(f"Unknown export format: {self.fmt}")
+
+        self._file: Optional[IO[str]] = None
+        self._temp_path: Optional[str] = None
+        self._sections = 0
+
+    def __enter__(self) -> "ResultWriter":
+        try:
+            handle, self._temp_path = tempfile.mkstemp(
+                dir=self.path.parent,
+                prefix=f".{self.path.name}.",
+                suffix=".tmp",
+            )
+            self._file = os.fdopen(handle, "w", encoding="utf-8")
+
+        except OSError as e:
+            raise EvaluationError(f"Failed to export results: {str(e)}")
+
+        if self.fmt == "json":
+            self._file.write("{")
+
+        return self
+
+    def write_section(self, name: str, value: Any) -> None:
+        """
+        Append one named analysis result.
+        """
+
+        if self.fmt == "json":
+            self._json_key(name)
+            self._write(_encode(value))
+        else:
+            self._write(_encode({"section": name, "result": value}) + "\n")
+
+    def write_rows(self, name: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Stream rows into a section as they are produced; returns the
+        number of rows written.
+        """
+
+        count = 0
+
+        if self.fmt == "json":
+            self._json_key(name)
+            self._write("[")
+
+            for row in rows:
+                self._write(("," if count else "") + _encode(row))
+                count += 1
+
+            self._write("]")
+        else:
+            for row in rows:
+                self._write(_encode({"section": name, **row}) + "\n")
+                count += 1
+
+        return count
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        assert self._file is not None and self._temp_path is not None
+
+        try:
+            if exc_type is None:
+                if self.fmt == "json":
+                    self._file.write("}\n")
+
+                self._file.close()
+                os.chmod(self._temp_path, default_file_mode())
+                os.replace(self._temp_path, self.path)
+                return
+
+        except OSError as e:
+            raise EvaluationError(f"Failed to export results: {str(e)}")
+
+        finally:
+            self._file.close()
+
+            if os.path.exists(self._temp_path):
+                os.unlink(self._temp_path)
+
+    def _json_key(self, name: str) -> None:
+        if self._sections:
+            self._write(",")
+
+        self._write(_ENCODER.encode(name) + ":")
+        self._sections += 1
+
+    def _write(self, text: str) -> None:
+        if self._file is None:
+            raise EvaluationError("ResultWriter used outside its context.")
+
+        try:
+            self._file.write(text)
+
+        except (OSError, TypeError, ValueError) as e:
+            raise EvaluationError(f"Failed to export results: {str(e)}")
+
+
+def _encode(value: Any) -> str:
+    """
+    Compact standard JSON; only values holding a non-finite float pay
+    for the second, sanitizing pass.
+    """
+
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(results, f, indent=4)
+        return _ENCODER.encode(value)
+    except ValueError:
+        return _ENCODER.encode(_finite(value))
+
+
+def _finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+
+    return value
+
+
+def iter_entry_rows(
+    entries: Iterable[EvaluationEntry],
+    config: Config,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Derived per-entry rows: mean score and the dimensions at the
+    failure score (config.score_min), one row at a time.
+    """
+
+    dimensions = config.required_dimensions
+
+    for entry in entries:
+        values = entry.score_vector(dimensions)
 
-    except Exception as e:
-        raise EvaluationError(
-            f"Failed to export results: {str(e)}"
-        )
+        yield {
+            "id": entry.id,
+            "model": entry.metadata.model,
+            "group": entry.metadata.group,
+            "mean": sum(values) / len(values),
+            "failures": [
+                dim
+                for dim, value in zip(dimensions, values)
+                if value == config.score_min
+            ],
+        }
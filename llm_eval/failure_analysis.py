@@ -8,41 +8,33 @@ Identifies weakest-performing dimensions and ranked failure patterns.
 
 from typing import Dict, List, Tuple, Any
 
-from .models import Dataset
 from .config import Config
-from .utils import mean
+from .summary import (
+    SummarySource,
+    dimension_histograms,
+    histogram_count,
+    histogram_mean,
+)
 from .exceptions import StatisticalComputationError
 
 
 def analyze_failures(
-    dataset: Dataset,
+    dataset: SummarySource,
     config: Config,
 ) -> Dict[str, Any]:
 
     try:
-        dimension_scores: Dict[str, List[int]] = {
-            dim: [] for dim in config.required_dimensions
-        }
-
-        for entry in dataset:
-            for dim in config.required_dimensions:
-                dimension_scores[dim].append(
-                    entry.scores[dim]
-                )
+        histograms = dimension_histograms(dataset, config)
 
         dimension_means: Dict[str, float] = {}
         failure_rates: Dict[str, float] = {}
 
-        for dim, scores in dimension_scores.items():
-            float_scores: List[float] = [float(s) for s in scores]
-
-            dimension_means[dim] = mean(float_scores)
+        for dim, histogram in histograms.items():
+            dimension_means[dim] = histogram_mean(histogram)
 
-            failures = sum(
-                1 for s in scores if s == config.score_min
-            )
+            failures = histogram.get(config.score_min, 0)
 
-            failure_rates[dim] = failures / len(scores)
+            failure_rates[dim] = failures / histogram_count(histogram)
 
         ranked_dimensions: List[Tuple[str, float]] = sorted(
             dimension_means.items(),
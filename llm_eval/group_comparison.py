@@ -0,0 +1,326 @@
+"""
+Multi-Group Comparison
+
+Author: Pradeep Kumar
+
+Compares any number of groups (models, prompt variants) at once:
+one-way ANOVA, every pairwise t-test with Cohen's d, and a
+multiple-comparison correction over the pairwise p-values.
+
+All of it derives from per-group sufficient statistics (count, mean,
+M2 of the per-entry mean score) gathered in a single pass, or in
+O(bins) from histograms, so k groups cost one scan of the data plus
+O(k^2) arithmetic rather than one scan per pair. p-values use the
+F and Student t distributions through the regularized incomplete
+beta function.
+"""
+
+import math
+from itertools import combinations
+from typing import Any, Dict, List, Sequence
+
+from .config import Config
+from .summary import SummarySource
+from .significance import collect_group_statistics, cohen_d_from_statistics
+from .utils import RunningStatistics
+from .exceptions import StatisticalComputationError
+
+
+CORRECTIONS = ("holm", "bonferroni", "bh", "none")
+
+# Continued-fraction settings for the incomplete beta function.
+_BETA_MAX_ITERATIONS = 300
+_BETA_EPSILON = 1e-14
+_BETA_FLOOR = 1e-300
+
+
+def compare_groups(
+    dataset: SummarySource,
+    config: Config,
+    correction: str = "holm",
+) -> Dict[str, Any]:
+    """
+    One-way ANOVA and corrected pairwise t-tests across all groups.
+
+    correction adjusts the pairwise p-values: "holm" (step-down,
+    family-wise), "bonferroni", "bh" (Benjamini-Hochberg false
+    discovery rate) or "none".
+
+    Returns:
+        {
+            "groups": {group: {"count", "mean", "std_dev"}},
+            "anova": {"f_statistic", "df_between", "df_within",
+                      "p_value", "eta_squared", "significant"},
+            "pairwise": [{"group_a", "group_b", "mean_difference",
+                          "t_statistic", "df", "p_value",
+                          "adjusted_p_value", "effect_size_cohen_d",
+                          "significant"}, ...],
+            "correction": str
+        }
+    """
+
+    if correction not in CORRECTIONS:
+        raise StatisticalComputationError(
+            f"Unknown multiple-comparison correction: {correction}"
+        )
+
+    try:
+        group_stats = collect_group_statistics(dataset, config)
+
+        if len(group_stats) < 2:
+            raise StatisticalComputationError(
+                "Group comparison requires at least two groups."
+            )
+
+        for group, stats in group_stats.items():
+            if stats.count < 2:
+                raise StatisticalComputationError(
+                    f"Group {group} needs at least 2 samples."
+                )
+
+        pairs = list(combinations(group_stats, 2))
+        pairwise = [
+            _pairwise_test(a, b, group_stats[a], group_stats[b])
+            for a, b in pairs
+        ]
+
+        adjusted = adjust_p_values(
+            [result["p_value"] for result in pairwise], correction
+        )
+
+        for result, p_value in zip(pairwise, adjusted):
+            result["adjusted_p_value"] = p_value
+            result["significant"] = p_value < config.significance_alpha
+
+        anova = _one_way_anova(list(group_stats.values()))
+        anova["significant"] = anova["p_value"] < config.significance_alpha
+
+        return {
+            "groups": {
+                group: {
+                    "count": stats.count,
+                    "mean": stats.mean,
+                    "std_dev": stats.standard_deviation,
+                }
+                for group, stats in group_stats.items()
+            },
+            "anova": anova,
+            "pairwise": pairwise,
+            "correction": correction,
+        }
+
+    except Exception as e:
+        raise StatisticalComputationError(
+            f"Group comparison failed: {str(e)}"
+        )
+
+
+def adjust_p_values(
+    p_values: Sequence[float],
+    correction: str = "holm",
+) -> List[float]:
+    """
+    Multiple-comparison adjusted p-values, in input order, from one
+    sort and one monotone sweep over the family.
+    """
+
+    m = len(p_values)
+
+    if correction == "none" or m == 0:
+        return list(p_values)
+
+    if correction == "bonferroni":
+        return [min(1.0, p * m) for p in p_values]
+
+    order = sorted(range(m), key=p_values.__getitem__)
+    adjusted = [0.0] * m
+
+    if correction == "holm":
+        running = 0.0
+
+        for rank, index in enumerate(order):
+            running = max(running, (m - rank) * p_values[index])
+            adjusted[index] = min(1.0, running)
+
+        return adjusted
+
+    if correction == "bh":
+        running = 1.0
+
+        for rank in range(m - 1, -1, -1):
+            index = order[rank]
+            running = min(running, p_values[index] * m / (rank + 1))
+            adjusted[index] = running
+
+        return adjusted
+
+    raise StatisticalComputationError(
+        f"Unknown multiple-comparison correction: {correction}"
+    )
+
+
+def _pairwise_test(
+    group_a: str,
+    group_b: str,
+    stats_a: RunningStatistics,
+    stats_b: RunningStatistics,
+) -> Dict[str, Any]:
+    """
+    Pooled-variance two-sample t-test from sufficient statistics.
+    """
+
+    df = stats_a.count + stats_b.count - 2
+    difference = stats_a.mean - stats_b.mean
+    pooled_variance = (stats_a.m2 + stats_b.m2) / df
+    standard_error = math.sqrt(
+        pooled_variance * (1 / stats_a.count + 1 / stats_b.count)
+    )
+
+    if standard_error == 0:
+        # Both groups constant: identical means cannot differ
+        t_stat = 0.0 if difference == 0 else math.copysign(
+            math.inf, difference
+        )
+    else:
+        t_stat = difference / standard_error
+
+    return {
+        "group_a": group_a,
+        "group_b": group_b,
+        "mean_difference": difference,
+        "t_statistic": t_stat,
+        "df": df,
+        "p_value": _t_two_tailed_p_value(t_stat, df),
+        "effect_size_cohen_d": cohen_d_from_statistics(stats_a, stats_b),
+    }
+
+
+def _one_way_anova(group_stats: List[RunningStatistics]) -> Dict[str, Any]:
+    total = sum(stats.count for stats in group_stats)
+    grand_mean = sum(stats.count * stats.mean for stats in group_stats) / (
+        total
+    )
+
+    between = sum(
+        stats.count * (stats.mean - grand_mean) ** 2 for stats in group_stats
+    )
+    within = sum(stats.m2 for stats in group_stats)
+
+    df_between = len(group_stats) - 1
+    df_within = total - len(group_stats)
+
+    if within == 0:
+        f_stat = 0.0 if between == 0 else math.inf
+    else:
+        f_stat = (between / df_between) / (within / df_within)
+
+    return {
+        "f_statistic": f_stat,
+        "df_between": df_between,
+        "df_within": df_within,
+        "p_value": _f_survival(f_stat, df_between, df_within),
+        "eta_squared": (
+            between / (between + within) if between + within else 0.0
+        ),
+    }
+
+
+def _t_two_tailed_p_value(t_stat: float, df: int) -> float:
+    """
+    P(|T| >= |t|) for Student's t with df degrees of freedom.
+    """
+
+    if math.isinf(t_stat):
+        return 0.0
+
+    return _regularized_beta(df / (df + t_stat * t_stat), df / 2, 0.5)
+
+
+def _f_survival(f_stat: float, df_between: int, df_within: int) -> float:
+    """
+    P(F >= f) for the F distribution.
+    """
+
+    if math.isinf(f_stat):
+        return 0.0
+
+    return _regularized_beta(
+        df_within / (df_within + df_between * f_stat),
+        df_within / 2,
+        df_between / 2,
+    )
+
+
+def _regularized_beta(x: float, a: float, b: float) -> float:
+    """
+    Regularized incomplete beta function I_x(a, b), evaluated with
+    Lentz's continued fraction on whichever tail converges fastest.
+    """
+
+    if x <= 0.0:
+        return 0.0
+
+    if x >= 1.0:
+        return 1.0
+
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log1p(-x)
+    )
+
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _beta_fraction(x, a, b) / a
+
+    return 1.0 - math.exp(log_front) * _beta_fraction(1.0 - x, b, a) / b
+
+
+def _beta_fraction(x: float, a: float, b: float) -> float:
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > _BETA_FLOOR else _BETA_FLOOR)
+    result = d
+
+    for m in range(1, _BETA_MAX_ITERATIONS + 1):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > _BETA_FLOOR else _BETA_FLOOR)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > _BETA_FLOOR else _BETA_FLOOR
+            delta = c * d
+            result *= delta
+
+        if abs(delta - 1.0) < _BETA_EPSILON:
+            return result
+
+    return result
+
+
+def format_group_comparison(result: Dict[str, Any]) -> str:
+    """
+    ANOVA line followed by a fixed-width table of the pairwise tests.
+    """
+
+    anova = result["anova"]
+    lines = [
+        f"ANOVA F({anova['df_between']}, {anova['df_within']}) = "
+        f"{anova['f_statistic']:.4f}, p = {anova['p_value']:.4g}, "
+        f"eta^2 = {anova['eta_squared']:.4f}",
+        "",
+        f"{'Pair':<30}{'Diff':>9}{'t':>9}{'d':>8}"
+        f"{'p (' + result['correction'] + ')':>14}  Significant",
+    ]
+
+    for pair in result["pairwise"]:
+        label = f"{pair['group_a']} vs {pair['group_b']}"
+        lines.append(
+            f"{label:<30}{pair['mean_difference']:>9.4f}"
+            f"{pair['t_statistic']:>9.3f}"
+            f"{pair['effect_size_cohen_d']:>8.3f}"
+            f"{pair['adjusted_p_value']:>14.4g}"
+            f"  {'yes' if pair['significant'] else 'no'}"
+        )
+
+    return "\n".join(lines)
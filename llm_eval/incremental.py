@@ -0,0 +1,253 @@
+"""
+Incremental Evaluation
+
+Author: Pradeep Kumar
+
+Evaluation state that grows entry by entry, for logs that are still
+being written (run.py --watch) and for streamed input.
+
+Each entry updates, in O(dimensions):
+
+- weighted unique (group, score vector) rows, from which the report,
+  significance tests and reference/baseline comparisons are produced
+  by the same functions as a batch run, at a cost that depends on the
+  number of distinct rows rather than the number of entries
+- Cohen's Kappa contingency tables (IncrementalAgreement)
+- per-window drift histograms (DriftMonitor)
+
+so refreshing results never re-reads entries already counted.
+"""
+
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import Config
+from .models import EvaluationEntry
+from .summary import CompressedDataset, SummarySource
+from .validation import check_dataset_integrity
+from .reporting import generate_report
+from .significance import independent_t_test
+from .advanced_statistics import (
+    bootstrap_significance_test,
+    exact_permutation_test,
+)
+from .group_comparison import compare_groups
+from .benchmark import benchmark_against_reference
+from .advanced_drift import detect_kl_drift
+from .agreement import IncrementalAgreement
+from .drift_monitor import DriftMonitor
+from .exceptions import EvaluationError
+
+
+class IncrementalEvaluation:
+    """
+    Running evaluation of an entry stream.
+
+    results() returns the same sections as a batch run: "report",
+    plus "agreement", "significance", "bootstrap", "permutation",
+    "comparison", "benchmark", "drift" and "drift_series" when
+    enabled (comparison by passing its p-value correction).
+    The permutation test is opt-in since its exact path is cubic in
+    the smaller group. A section
+    that cannot be computed yet (too few entries, one group so far)
+    holds "Unavailable: <reason>" instead of failing the refresh.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        significance: bool = False,
+        permutation: bool = False,
+        correction: Optional[str] = None,
+        reference: Optional[SummarySource] = None,
+        baseline: Optional[SummarySource] = None,
+        agreement: bool = False,
+        kappa_weights: Optional[str] = None,
+        drift_window: Optional[int] = None,
+        drift_trailing: int = 1,
+    ) -> None:
+        self.config = config
+        self.significance = significance
+        self.permutation = permutation
+        self.correction = correction
+        self.reference = reference
+        self.baseline = baseline
+        self.kappa_weights = kappa_weights
+
+        self._dimensions = tuple(config.required_dimensions)
+        self._rows: Counter[Tuple[str, Tuple[int, ...]]] = Counter()
+
+        self.agreement = IncrementalAgreement(config) if agreement else None
+        self.drift_monitor = (
+            DriftMonitor(config, drift_window, baseline, drift_trailing)
+            if drift_window
+            else None
+        )
+
+    @property
+    def count(self) -> int:
+        return sum(self._rows.values())
+
+    def add(self, entry: EvaluationEntry) -> None:
+        # Agreement may reject the entry (a third rating of an ID), so
+        # it goes first and leaves the other state untouched
+        if self.agreement is not None:
+            self.agreement.add(entry)
+
+        if self.drift_monitor is not None:
+            self.drift_monitor.add(entry)
+
+        self._rows[
+            (entry.metadata.group, entry.score_vector(self._dimensions))
+        ] += 1
+
+    def extend(self, entries: Iterable[EvaluationEntry]) -> None:
+        for entry in entries:
+            self.add(entry)
+
+    def dataset(self) -> CompressedDataset:
+        """
+        Snapshot of the entries so far.
+        """
+
+        return CompressedDataset(
+            dimensions=self._dimensions,
+            rows=dict(self._rows),
+        )
+
+    def results(self) -> Dict[str, Any]:
+        summary = self.dataset().summary()
+        config = self.config
+
+        analyses: List[Tuple[str, Callable[[], Any]]] = [
+            ("report", lambda: generate_report(summary, config)),
+        ]
+
+        if self.agreement is not None:
+            agreement = self.agreement
+            analyses.append(
+                ("agreement", lambda: agreement.kappa(self.kappa_weights))
+            )
+
+        if self.significance:
+            analyses += [
+                ("significance", lambda: independent_t_test(summary, config)),
+                (
+                    "bootstrap",
+                    lambda: bootstrap_significance_test(summary, config),
+                ),
+            ]
+
+        if self.permutation:
+            analyses.append(
+                (
+                    "permutation",
+                    lambda: exact_permutation_test(summary, config),
+                )
+            )
+
+        correction = self.correction
+
+        if correction is not None:
+            analyses.append(
+                (
+                    "comparison",
+                    lambda: compare_groups(summary, config, correction),
+                )
+            )
+
+        reference, baseline = self.reference, self.baseline
+
+        if reference is not None:
+            analyses.append(
+                (
+                    "benchmark",
+                    lambda: benchmark_against_reference(
+                        summary, reference, config
+                    ),
+                )
+            )
+
+        if baseline is not None:
+            analyses.append(
+                (
+                    "drift",
+                    lambda: detect_kl_drift(summary, baseline, config),
+                )
+            )
+
+        results: Dict[str, Any] = {}
+
+        try:
+            check_dataset_integrity(
+                summary.count, summary.group_counts, config
+            )
+            integrity_error = None
+        except EvaluationError as e:
+            integrity_error = e
+
+        for name, analysis in analyses:
+            if integrity_error is not None and name != "agreement":
+                results[name] = f"Unavailable: {integrity_error}"
+                continue
+
+            try:
+                results[name] = analysis()
+            except EvaluationError as e:
+                results[name] = f"Unavailable: {e}"
+
+        if self.drift_monitor is not None:
+            results["drift_series"] = self.drift_monitor.series()
+
+        return results
+
+
+class FileTail:
+    """
+    Reads the bytes appended to a file since the last read.
+
+    If the file shrinks (truncated) or the path now names a different
+    file (device and inode changed, e.g. a rotated log, however large
+    the new file is), read() starts again from the beginning and
+    reports the reset so callers can discard their state.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offset = 0
+        self._identity: Optional[Tuple[int, int]] = None
+
+    def read(self, limit: int = 1 << 24) -> Tuple[bytes, bool]:
+        """
+        (new bytes, reset) with at most limit bytes per call.
+        """
+
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return b"", False
+
+        with f:
+            # fstat the open handle so size and identity describe the
+            # file actually read, even if the path is replaced meanwhile
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            reset = stat.st_size < self.offset or (
+                self._identity is not None and identity != self._identity
+            )
+            self._identity = identity
+
+            if reset:
+                self.offset = 0
+
+            if stat.st_size == self.offset:
+                return b"", reset
+
+            f.seek(self.offset)
+            data = f.read(min(limit, stat.st_size - self.offset))
+
+        self.offset += len(data)
+
+        return data, reset
@@ -1,21 +1,287 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import asdict, dataclass, FrozenInstanceError
+from typing import (
+    Any, Dict, Iterator, List, Mapping, Protocol, Sequence, Tuple, Union,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metadata:
     model: str
     timestamp: str
     group: str
 
 
-@dataclass(frozen=True)
+class TextHandle(Protocol):
+    """
+    Deferred source of an entry's prompt and response text.
+    """
+
+    def load(self) -> Tuple[str, str]:
+        ...
+
+
+Text = Union[Tuple[str, str], TextHandle]
+
+
+# Shared dimension tuples, so entries with the same dimensions reference
+# one tuple instead of each holding its own dict keys.
+_DIMENSIONS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _shared_dimensions(dimensions: Sequence[str]) -> Tuple[str, ...]:
+    key = tuple(dimensions)
+    return _DIMENSIONS.setdefault(key, key)
+
+
+class Scores(Mapping[str, int]):
+    """
+    Read-only dimension -> score mapping over a shared dimension tuple
+    and a per-entry tuple of values.
+    """
+
+    __slots__ = ("_dimensions", "_values")
+
+    def __init__(
+        self,
+        dimensions: Tuple[str, ...],
+        values: Tuple[int, ...],
+    ) -> None:
+        self._dimensions = dimensions
+        self._values = values
+
+    def __getitem__(self, dimension: str) -> int:
+        try:
+            return self._values[self._dimensions.index(dimension)]
+        except ValueError:
+            raise KeyError(dimension)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dimensions)
+
+    def __len__(self) -> int:
+        return len(self._dimensions)
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(self._dimensions, self._values)))
+
+
 class EvaluationEntry:
+    """
+    A single scored model response.
+
+    Entries are slotted: scores are a tuple of values indexed by a
+    shared dimension tuple and exposed through a read-only Scores
+    mapping. prompt and response are either held inline or behind a
+    TextHandle that decodes them on each access, so datasets loaded
+    with lazy text keep only scores and metadata resident. Instances
+    are immutable.
+
+    Entries are not dataclasses and scores are not a dict: use
+    as_dict() and replace() where dataclasses.asdict and
+    dataclasses.replace were used, and dict(entry.scores) for a
+    mutable copy.
+    """
+
+    __slots__ = ("id", "metadata", "_dimensions", "_values", "_text")
+
     id: int
-    prompt: str
-    response: str
-    scores: Dict[str, int]
     metadata: Metadata
+    _dimensions: Tuple[str, ...]
+    _values: Tuple[int, ...]
+    _text: Text
+
+    def __init__(
+        self,
+        id: int,
+        prompt: str,
+        response: str,
+        scores: Mapping[str, int],
+        metadata: Metadata,
+    ) -> None:
+        _init_entry(
+            self,
+            id,
+            _shared_dimensions(list(scores)),
+            tuple(scores.values()),
+            metadata,
+            (prompt, response),
+        )
+
+    @classmethod
+    def with_lazy_text(
+        cls,
+        id: int,
+        text: TextHandle,
+        scores: Mapping[str, int],
+        metadata: Metadata,
+    ) -> "EvaluationEntry":
+        return cls.from_score_vector(
+            id, tuple(scores), tuple(scores.values()), metadata, text
+        )
+
+    @classmethod
+    def from_score_vector(
+        cls,
+        id: int,
+        dimensions: Sequence[str],
+        values: Tuple[int, ...],
+        metadata: Metadata,
+        text: Text,
+    ) -> "EvaluationEntry":
+        """
+        Build an entry from score values in dimension order, without
+        an intermediate scores dict.
+        """
+
+        entry = cls.__new__(cls)
+        _init_entry(
+            entry,
+            id,
+            _shared_dimensions(dimensions),
+            values,
+            metadata,
+            text,
+        )
+        return entry
+
+    @property
+    def scores(self) -> Scores:
+        return Scores(self._dimensions, self._values)
+
+    @property
+    def prompt(self) -> str:
+        return self.load_text()[0]
+
+    @property
+    def response(self) -> str:
+        return self.load_text()[1]
+
+    @property
+    def has_lazy_text(self) -> bool:
+        return not isinstance(self._text, tuple)
+
+    def load_text(self) -> Tuple[str, str]:
+        """
+        Return (prompt, response) with a single decode for lazy text.
+        """
+
+        if isinstance(self._text, tuple):
+            return self._text
+        return self._text.load()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        The entry in dataset schema form, with plain dict scores and
+        metadata (what dataclasses.asdict returned).
+        """
+
+        prompt, response = self.load_text()
+
+        return {
+            "id": self.id,
+            "prompt": prompt,
+            "response": response,
+            "scores": dict(self.scores),
+            "metadata": asdict(self.metadata),
+        }
+
+    def replace(self, **changes: Any) -> "EvaluationEntry":
+        """
+        Copy with the given fields changed, like dataclasses.replace.
+        Lazy text stays lazy unless prompt or response changes.
+        """
+
+        unknown = set(changes) - _ENTRY_FIELDS
+
+        if unknown:
+            raise TypeError(
+                f"Unknown EvaluationEntry fields: {sorted(unknown)}"
+            )
+
+        text = self._text
+
+        if "prompt" in changes or "response" in changes:
+            prompt, response = self.load_text()
+            text = (
+                changes.get("prompt", prompt),
+                changes.get("response", response),
+            )
+
+        scores = changes.get("scores", self.scores)
+
+        return EvaluationEntry.from_score_vector(
+            changes.get("id", self.id),
+            tuple(scores),
+            tuple(scores.values()),
+            changes.get("metadata", self.metadata),
+            text,
+        )
+
+    def score_vector(self, dimensions: Sequence[str]) -> Tuple[int, ...]:
+        """
+        Scores in the given dimension order.
+        """
+
+        if dimensions == self._dimensions:
+            return self._values
+
+        scores = self.scores
+        return tuple(scores[dim] for dim in dimensions)
+
+    def _fields(self) -> Tuple[Any, ...]:
+        return (self.id, *self.load_text(), self.scores, self.metadata)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EvaluationEntry):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        prompt, response = self.load_text()
+
+        return (
+            f"EvaluationEntry(id={self.id!r}, prompt={prompt!r}, "
+            f"response={response!r}, scores={self.scores!r}, "
+            f"metadata={self.metadata!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            EvaluationEntry.from_score_vector,
+            (
+                self.id,
+                self._dimensions,
+                self._values,
+                self.metadata,
+                self._text,
+            ),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+
+_ENTRY_FIELDS = frozenset({"id", "prompt", "response", "scores", "metadata"})
+
+
+def _init_entry(
+    entry: EvaluationEntry,
+    id: int,
+    dimensions: Tuple[str, ...],
+    values: Tuple[int, ...],
+    metadata: Metadata,
+    text: Text,
+) -> None:
+    object.__setattr__(entry, "id", id)
+    object.__setattr__(entry, "metadata", metadata)
+    object.__setattr__(entry, "_dimensions", dimensions)
+    object.__setattr__(entry, "_values", values)
+    object.__setattr__(entry, "_text", text)
 
 
 Dataset = List[EvaluationEntry]
@@ -0,0 +1,225 @@
+"""
+Analysis Pipeline
+
+Author: Pradeep Kumar
+
+A small dependency-graph scheduler for evaluation runs.
+
+Stages declare the intermediates they need by name; every stage runs
+at most once and its result is shared by all dependents. With more
+than one worker, stages whose inputs are ready run concurrently:
+in-process stages on a thread pool, and stages marked process=True
+(CPU-bound work such as parsing a dataset) on a process pool, so
+loading comparison datasets overlaps with analysing the main one.
+
+Passing a StageProfiler records per-stage costs; stages then run one
+at a time in this process so the measurements are attributable.
+"""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .profiling import StageProfiler
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One named step. func is called with the results of requires, in
+    order, followed by args.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    requires: Tuple[str, ...] = ()
+    args: Tuple[Any, ...] = ()
+    process: bool = False
+
+
+class Pipeline:
+    """
+    Stages keyed by name, executed in dependency order.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        requires: Iterable[str] = (),
+        process: bool = False,
+    ) -> None:
+        """
+        Register a stage. process=True runs it in a worker process
+        when the pipeline runs in parallel; func, args and the required
+        results must then be picklable.
+        """
+
+        if name in self.stages:
+            raise ValueError(f"Duplicate pipeline stage: {name}")
+
+        self.stages[name] = Stage(
+            name=name,
+            func=func,
+            requires=tuple(requires),
+            args=args,
+            process=process,
+        )
+
+    def order(self, targets: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Stages needed for targets (default: all), dependencies first.
+        """
+
+        ordered: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == "done":
+                return
+
+            if state.get(name) == "visiting":
+                raise ValueError(f"Pipeline cycle through stage: {name}")
+
+            if name not in self.stages:
+                raise ValueError(f"Unknown pipeline stage: {name}")
+
+            state[name] = "visiting"
+
+            for requirement in self.stages[name].requires:
+                visit(requirement)
+
+            state[name] = "done"
+            ordered.append(name)
+
+        for name in self.stages if targets is None else targets:
+            visit(name)
+
+        return ordered
+
+    def run(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        workers: int = 1,
+        profiler: Optional[StageProfiler] = None,
+        on_result: Optional[Callable[[str, Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run every stage needed for targets once and return all results
+        by stage name. With a profiler, stages run serially and each
+        one's timing is appended to profiler.timings. on_result is
+        called with each stage's name and result as soon as it is
+        available, in the calling thread.
+
+        The first failing stage's exception is re-raised once running
+        stages have finished; stages not yet started are skipped.
+        """
+
+        ordered = self.order(targets)
+
+        if workers <= 1 or profiler is not None:
+            results: Dict[str, Any] = {}
+
+            for name in ordered:
+                results[name] = self._call(
+                    self.stages[name], results, profiler
+                )
+
+                if on_result is not None:
+                    on_result(name, results[name])
+
+            return results
+
+        return self._run_parallel(ordered, workers, on_result)
+
+    def _call(
+        self,
+        stage: Stage,
+        results: Dict[str, Any],
+        profiler: Optional[StageProfiler] = None,
+    ) -> Any:
+        inputs = [results[name] for name in stage.requires]
+
+        if profiler is not None:
+            return profiler.call(stage.name, stage.func, inputs, stage.args)
+
+        return stage.func(*inputs, *stage.args)
+
+    def _run_parallel(
+        self,
+        ordered: List[str],
+        workers: int,
+        on_result: Optional[Callable[[str, Any], None]],
+    ) -> Dict[str, Any]:
+
+        results: Dict[str, Any] = {}
+        pending = list(ordered)
+        running: Dict[Future[Any], str] = {}
+        error: Optional[BaseException] = None
+
+        threads = ThreadPoolExecutor(max_workers=workers)
+        processes: Optional[ProcessPoolExecutor] = None
+
+        try:
+            while pending or running:
+                if error is None:
+                    for name in list(pending):
+                        stage = self.stages[name]
+
+                        if not all(r in results for r in stage.requires):
+                            continue
+
+                        executor: Executor = threads
+
+                        if stage.process:
+                            if processes is None:
+                                processes = ProcessPoolExecutor(
+                                    max_workers=workers
+                                )
+                            executor = processes
+
+                        inputs = [results[r] for r in stage.requires]
+                        future = executor.submit(
+                            stage.func, *inputs, *stage.args
+                        )
+                        running[future] = name
+                        pending.remove(name)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    exception = future.exception()
+
+                    if exception is not None:
+                        error = error or exception
+                    else:
+                        results[name] = future.result()
+
+                        if on_result is not None and error is None:
+                            on_result(name, results[name])
+
+        finally:
+            threads.shutdown(cancel_futures=True)
+
+            if processes is not None:
+                processes.shutdown(cancel_futures=True)
+
+        if error is not None:
+            raise error
+
+        return results
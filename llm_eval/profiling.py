@@ -0,0 +1,168 @@
+"""
+Stage Profiling
+
+Author: Pradeep Kumar
+
+Per-stage wall time, CPU time, peak memory and item counts for
+pipeline runs, with optional cProfile dumps.
+
+Pipeline.run(profiler=StageProfiler()) executes stages one at a time
+while profiling: CPU time and tracemalloc peaks are process-wide, so
+concurrent stages would be charged for each other's work.
+
+Peak memory is only traced on request (trace_memory=True):
+tracemalloc hooks every allocation and slows allocation-heavy stages
+several-fold, so timings taken alongside it are marked as such.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .score_matrix import ScoreMatrix
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_bytes: Optional[int]
+    items: Optional[int]
+
+
+class StageProfiler:
+    """
+    Collects one StageTiming per profiled call. With profile_dir set,
+    each stage's cProfile statistics are written to
+    <profile_dir>/<stage>.prof (readable with pstats or snakeviz).
+    peak_bytes is None unless trace_memory is set.
+    """
+
+    def __init__(
+        self,
+        profile_dir: Optional[Path] = None,
+        trace_memory: bool = False,
+    ) -> None:
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self.timings: List[StageTiming] = []
+
+    def call(
+        self,
+        stage: str,
+        func: Callable[..., Any],
+        inputs: Sequence[Any],
+        args: Sequence[Any],
+    ) -> Any:
+        """
+        Run func(*inputs, *args) and record its costs under stage.
+        """
+
+        profile = cProfile.Profile() if self.profile_dir else None
+        tracing = tracemalloc.is_tracing()
+        peak: Optional[int] = None
+
+        if self.trace_memory:
+            if not tracing:
+                tracemalloc.start()
+
+            tracemalloc.reset_peak()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            if profile is not None:
+                result = profile.runcall(func, *inputs, *args)
+            else:
+                result = func(*inputs, *args)
+
+        finally:
+            cpu_seconds = time.process_time() - cpu_start
+            wall_seconds = time.perf_counter() - wall_start
+
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+
+                if not tracing:
+                    tracemalloc.stop()
+
+        if profile is not None and self.profile_dir is not None:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(self.profile_dir / f"{stage}.prof"))
+
+        items = count_items(result)
+
+        if items is None:
+            # Analyses return small dicts; report how much they consumed
+            items = next(
+                (
+                    count
+                    for count in map(count_items, inputs)
+                    if count is not None
+                ),
+                None,
+            )
+
+        self.timings.append(
+            StageTiming(
+                stage=stage,
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                peak_bytes=peak,
+                items=items,
+            )
+        )
+
+        return result
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return [asdict(timing) for timing in self.timings]
+
+
+def count_items(value: Any) -> Optional[int]:
+    """
+    Number of entries held by a dataset-like value, or None.
+    """
+
+    count = getattr(value, "count", None)
+
+    if isinstance(count, int):
+        return count
+
+    if isinstance(value, (list, ScoreMatrix)):
+        return len(value)
+
+    return None
+
+
+def format_timings(timings: Sequence[StageTiming]) -> str:
+    """
+    Fixed-width table of stage timings, noting when the times were
+    taken under tracemalloc.
+    """
+
+    lines = [
+        f"{'Stage':<14}{'Wall (s)':>11}{'CPU (s)':>11}"
+        f"{'Peak (MiB)':>12}{'Items':>12}"
+    ]
+
+    for timing in timings:
+        items = "-" if timing.items is None else str(timing.items)
+        peak = (
+            "-" if timing.peak_bytes is None
+            else f"{timing.peak_bytes / 2**20:.2f}"
+        )
+        lines.append(
+            f"{timing.stage:<14}{timing.wall_seconds:>11.4f}"
+            f"{timing.cpu_seconds:>11.4f}{peak:>12}{items:>12}"
+        )
+
+    if any(timing.peak_bytes is not None for timing in timings):
+        lines.append("(times measured under tracemalloc)")
+
+    return "\n".join(lines)
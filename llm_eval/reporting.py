@@ -9,48 +9,41 @@ Generates deterministic statistical summaries for evaluation datasets.
 from typing import Dict, List
 
 from .config import Config
-from .models import Dataset
-from .utils import mean, standard_deviation, confidence_interval
+from .summary import SummarySource, dimension_histograms
+from .utils import RunningStatistics
 from .exceptions import StatisticalComputationError
 
 
-def generate_report(dataset: Dataset, config: Config) -> str:
+def generate_report(dataset: SummarySource, config: Config) -> str:
     """
     Generate a formatted statistical summary report.
+    Accepts a dataset, a prebuilt ScoreMatrix or a DatasetSummary.
     """
 
     try:
-        dimension_scores = _collect_dimension_scores(dataset, config)
+        dimension_stats = _collect_dimension_statistics(dataset, config)
 
         report_lines: List[str] = []
         report_lines.append("LLM Evaluation Report")
         report_lines.append("-" * 30)
 
-        overall_scores: List[float] = []
+        overall = RunningStatistics()
 
-        for dimension, scores in dimension_scores.items():
-            float_scores: List[float] = [float(s) for s in scores]
+        for dimension, stats in dimension_stats.items():
+            m = stats.mean
+            sd = stats.standard_deviation
+            ci = stats.confidence_interval(config.confidence_level)
 
-            m = mean(float_scores)
-            sd = standard_deviation(float_scores)
-            ci = confidence_interval(
-                float_scores,
-                config.confidence_level,
-            )
-
-            overall_scores.extend(float_scores)
+            overall = overall.merge(stats)
 
             report_lines.append(f"\nDimension: {dimension}")
             report_lines.append(f"  Mean: {m:.4f}")
             report_lines.append(f"  Std Dev: {sd:.4f}")
             report_lines.append(f"  95% CI Margin: ±{ci:.4f}")
 
-        overall_mean = mean(overall_scores)
-        overall_sd = standard_deviation(overall_scores)
-        overall_ci = confidence_interval(
-            overall_scores,
-            config.confidence_level,
-        )
+        overall_mean = overall.mean
+        overall_sd = overall.standard_deviation
+        overall_ci = overall.confidence_interval(config.confidence_level)
 
         report_lines.append("\nOverall Summary")
         report_lines.append(f"  Overall Mean: {overall_mean:.4f}")
@@ -65,19 +58,19 @@ def generate_report(dataset: Dataset, config: Config) -> str:
         )
 
 
-def _collect_dimension_scores(
-    dataset: Dataset,
+def _collect_dimension_statistics(
+    dataset: SummarySource,
     config: Config,
-) -> Dict[str, List[int]]:
+) -> Dict[str, RunningStatistics]:
+    """
+    Per-dimension moments from score histograms; the overall
+    summary is obtained by merging these, not by rescanning.
+    """
 
-    dimension_scores: Dict[str, List[int]] = {
-        dim: [] for dim in config.required_dimensions
+    return {
+        dimension: RunningStatistics.from_histogram(histogram)
+        for dimension, histogram in dimension_histograms(
+            dataset,
+            config,
+        ).items()
     }
-
-    for entry in dataset:
-        for dimension in config.required_dimensions:
-            dimension_scores[dimension].append(
-                entry.scores[dimension]
-            )
-
-    return dimension_scores
\ No newline at end of file
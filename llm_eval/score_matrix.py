@@ -0,0 +1,187 @@
+"""
+Columnar Score Storage
+
+Author: Pradeep Kumar
+
+Provides a column-oriented score store built once per dataset and
+shared by every analysis layer.
+"""
+
+import operator
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from .config import Config
+from .models import Dataset, EvaluationEntry
+from .exceptions import StatisticalComputationError
+
+
+class ScoreMatrix:
+    """
+    Column store of evaluation scores.
+
+    Holds one contiguous integer column per required dimension plus
+    dictionary-encoded group and model columns. Row i of every column
+    describes the i-th entry of the source dataset.
+    """
+
+    def __init__(
+        self,
+        dimensions: Tuple[str, ...],
+        columns: Tuple[Sequence[int], ...],
+        ids: Sequence[int],
+        group_codes: Sequence[int],
+        group_labels: Tuple[str, ...],
+        model_codes: Sequence[int],
+        model_labels: Tuple[str, ...],
+    ) -> None:
+        if len(dimensions) != len(columns):
+            raise StatisticalComputationError(
+                "Score matrix requires one column per dimension."
+            )
+
+        self.dimensions = dimensions
+        self.columns = columns
+        self.ids = ids
+        self.group_codes = group_codes
+        self.group_labels = group_labels
+        self.model_codes = model_codes
+        self.model_labels = model_labels
+
+        self._index: Dict[str, int] = {
+            dim: position for position, dim in enumerate(dimensions)
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, dimension: str) -> Sequence[int]:
+        """
+        Return the score column for a dimension.
+        """
+
+        try:
+            return self.columns[self._index[dimension]]
+        except KeyError:
+            raise StatisticalComputationError(
+                f"Unknown score dimension: {dimension}"
+            )
+
+    def histogram(self, dimension: str) -> Dict[int, int]:
+        """
+        Count occurrences of each score value in a dimension.
+        """
+
+        return dict(Counter(self.column(dimension)))
+
+    def row_totals(self) -> List[int]:
+        """
+        Sum of scores across all dimensions for every row.
+        """
+
+        totals: List[int] = [0] * len(self)
+
+        for column in self.columns:
+            totals = list(map(operator.add, totals, column))
+
+        return totals
+
+    def group_totals(self) -> Dict[str, List[int]]:
+        """
+        Per-row score totals partitioned by group label,
+        in first-seen group order.
+        """
+
+        grouped: Dict[str, List[int]] = {
+            label: [] for label in self.group_labels
+        }
+        buckets = [grouped[label] for label in self.group_labels]
+
+        for code, total in zip(self.group_codes, self.row_totals()):
+            buckets[code].append(total)
+
+        return grouped
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[EvaluationEntry],
+        config: Config,
+    ) -> "ScoreMatrix":
+        """
+        Build a score matrix in a single pass over entries.
+        """
+
+        typecode = score_typecode(config)
+        dimensions = tuple(config.required_dimensions)
+
+        columns = tuple(array(typecode) for _ in dimensions)
+        ids = array("q")
+        group_codes = array("I")
+        model_codes = array("I")
+        group_index: Dict[str, int] = {}
+        model_index: Dict[str, int] = {}
+
+        for entry in entries:
+            for column, value in zip(
+                columns, entry.score_vector(dimensions)
+            ):
+                column.append(value)
+
+            ids.append(entry.id)
+            group_codes.append(
+                _encode(group_index, entry.metadata.group)
+            )
+            model_codes.append(
+                _encode(model_index, entry.metadata.model)
+            )
+
+        return cls(
+            dimensions=dimensions,
+            columns=columns,
+            ids=ids,
+            group_codes=group_codes,
+            group_labels=tuple(group_index),
+            model_codes=model_codes,
+            model_labels=tuple(model_index),
+        )
+
+
+ScoreSource = Union[Dataset, ScoreMatrix]
+
+
+def as_score_matrix(
+    source: ScoreSource,
+    config: Config,
+) -> ScoreMatrix:
+    """
+    Return the score matrix for a dataset, building it if needed.
+    """
+
+    if isinstance(source, ScoreMatrix):
+        return source
+
+    return ScoreMatrix.from_entries(source, config)
+
+
+def _encode(index: Dict[str, int], label: str) -> int:
+    code = index.get(label)
+
+    if code is None:
+        code = len(index)
+        index[label] = code
+
+    return code
+
+
+def score_typecode(config: Config) -> str:
+    """
+    Smallest signed array typecode able to hold the configured score range.
+    """
+
+    for typecode, bound in (("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31)):
+        if -bound <= config.score_min and config.score_max < bound:
+            return typecode
+
+    return "q"
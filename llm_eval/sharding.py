@@ -0,0 +1,106 @@
+"""
+Sharded Evaluation Layer
+
+Author: Pradeep Kumar
+
+Map-reduce evaluation over datasets split across many files.
+
+Each shard is validated and reduced to a DatasetSummary in a worker
+process (map); partial summaries are merged in shard order with
+cross-shard duplicate-ID and dataset integrity checks (reduce). The
+merged summary is accepted by every summary-based analysis.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+from .config import Config
+from .score_matrix import ScoreMatrix
+from .binary_format import is_binary_dataset, open_binary_dataset
+from .summary import DatasetSummary
+from .validation import check_dataset_integrity, iter_validated_entries
+from .exceptions import DatasetValidationError
+
+
+def summarize_shard(
+    path: Path,
+    config: Config,
+) -> Tuple[DatasetSummary, Set[int]]:
+    """
+    Validate one shard and return its summary and entry IDs.
+
+    Dataset-level integrity is not enforced per shard; a single shard
+    may legitimately be small or contain only one group. Binary shards
+    were validated when written and are summarized from their mapped
+    columns.
+    """
+
+    try:
+        if is_binary_dataset(path):
+            with open_binary_dataset(path, config) as binary:
+                return (
+                    DatasetSummary.from_matrix(binary.matrix),
+                    set(binary.ids),
+                )
+
+        matrix = ScoreMatrix.from_entries(
+            iter_validated_entries(path, config, enforce_integrity=False),
+            config,
+        )
+    except DatasetValidationError as e:
+        raise DatasetValidationError(f"{path}: {str(e)}")
+
+    return DatasetSummary.from_matrix(matrix), set(matrix.ids)
+
+
+def summarize_shards(
+    paths: Sequence[Path],
+    config: Config,
+) -> DatasetSummary:
+    """
+    Summarize shards across config.workers processes and merge them.
+    """
+
+    if not paths:
+        raise DatasetValidationError("At least one shard is required.")
+
+    partials: Iterable[Tuple[DatasetSummary, Set[int]]]
+
+    if config.workers <= 1:
+        partials = map(summarize_shard, paths, repeat(config))
+        return _merge_partials(paths, partials, config)
+
+    with ProcessPoolExecutor(max_workers=config.workers) as executor:
+        partials = executor.map(summarize_shard, paths, repeat(config))
+        return _merge_partials(paths, partials, config)
+
+
+def _merge_partials(
+    paths: Sequence[Path],
+    partials: Iterable[Tuple[DatasetSummary, Set[int]]],
+    config: Config,
+) -> DatasetSummary:
+
+    merged: Optional[DatasetSummary] = None
+    seen_ids: Set[int] = set()
+
+    for path, (summary, ids) in zip(paths, partials):
+        duplicates = seen_ids & ids
+
+        if duplicates:
+            raise DatasetValidationError(
+                f"Duplicate ID detected: {min(duplicates)} "
+                f"(repeated in shard {path})"
+            )
+
+        seen_ids |= ids
+        merged = summary if merged is None else merged.merge(summary)
+
+    if merged is None:
+        raise DatasetValidationError("At least one shard is required.")
+
+    check_dataset_integrity(merged.count, merged.group_counts, config)
+
+    return merged
@@ -9,16 +9,16 @@ Implements:
 """
 
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 from .config import Config
-from .models import Dataset
-from .utils import mean, variance
+from .summary import SummarySource, group_histograms
+from .utils import RunningStatistics
 from .exceptions import StatisticalComputationError
 
 
 def independent_t_test(
-    dataset: Dataset,
+    dataset: SummarySource,
     config: Config,
 ) -> Dict[str, float]:
     """
@@ -27,21 +27,21 @@ def independent_t_test(
     """
 
     try:
-        group_scores = _collect_group_scores(dataset)
+        group_stats = collect_group_statistics(dataset, config)
 
-        if len(group_scores) != 2:
+        if len(group_stats) != 2:
             raise StatisticalComputationError(
                 "T-test requires exactly two groups."
             )
 
-        groups = list(group_scores.keys())
-        group_a = group_scores[groups[0]]
-        group_b = group_scores[groups[1]]
+        groups = list(group_stats.keys())
+        stats_a = group_stats[groups[0]]
+        stats_b = group_stats[groups[1]]
 
-        t_stat = _compute_t_statistic(group_a, group_b)
+        t_stat = _compute_t_statistic(stats_a, stats_b)
         p_value = _approximate_two_tailed_p_value(t_stat)
 
-        effect_size = cohen_d(group_a, group_b)
+        effect_size = cohen_d_from_statistics(stats_a, stats_b)
 
         return {
             "t_statistic": t_stat,
@@ -61,40 +61,36 @@ def cohen_d(group_a: List[float], group_b: List[float]) -> float:
     Compute Cohen's d effect size.
     """
 
-    mean_a = mean(group_a)
-    mean_b = mean(group_b)
+    return cohen_d_from_statistics(
+        RunningStatistics.from_values(group_a),
+        RunningStatistics.from_values(group_b),
+    )
 
-    var_a = variance(group_a)
-    var_b = variance(group_b)
 
-    pooled_sd = math.sqrt(
-        ((len(group_a) - 1) * var_a + (len(group_b) - 1) * var_b)
-        / (len(group_a) + len(group_b) - 2)
-    )
+def cohen_d_from_statistics(
+    stats_a: RunningStatistics,
+    stats_b: RunningStatistics,
+) -> float:
+    """
+    Compute Cohen's d from per-group accumulators.
+    """
+
+    pooled_sd = math.sqrt(_pooled_variance(stats_a, stats_b))
 
     if pooled_sd == 0:
         return 0.0
 
-    return (mean_a - mean_b) / pooled_sd
+    return (stats_a.mean - stats_b.mean) / pooled_sd
 
 
 def _compute_t_statistic(
-    group_a: List[float],
-    group_b: List[float],
+    stats_a: RunningStatistics,
+    stats_b: RunningStatistics,
 ) -> float:
-    mean_a = mean(group_a)
-    mean_b = mean(group_b)
-
-    var_a = variance(group_a)
-    var_b = variance(group_b)
+    n_a = stats_a.count
+    n_b = stats_b.count
 
-    n_a = len(group_a)
-    n_b = len(group_b)
-
-    pooled_var = (
-        ((n_a - 1) * var_a + (n_b - 1) * var_b)
-        / (n_a + n_b - 2)
-    )
+    pooled_var = _pooled_variance(stats_a, stats_b)
 
     standard_error = math.sqrt(pooled_var * (1 / n_a + 1 / n_b))
 
@@ -103,7 +99,18 @@ def _compute_t_statistic(
             "Standard error is zero; cannot compute t-statistic."
         )
 
-    return (mean_a - mean_b) / standard_error
+    return (stats_a.mean - stats_b.mean) / standard_error
+
+
+def _pooled_variance(
+    stats_a: RunningStatistics,
+    stats_b: RunningStatistics,
+) -> float:
+    return (
+        ((stats_a.count - 1) * stats_a.variance
+         + (stats_b.count - 1) * stats_b.variance)
+        / (stats_a.count + stats_b.count - 2)
+    )
 
 
 def _approximate_two_tailed_p_value(t_stat: float) -> float:
@@ -117,20 +124,20 @@ def _approximate_two_tailed_p_value(t_stat: float) -> float:
     return 2 * p_one_tail
 
 
-def _collect_group_scores(dataset: Dataset) -> Dict[str, List[float]]:
-    """
-    Collect overall mean score per entry grouped by metadata.group.
+def collect_group_statistics(
+    dataset: SummarySource,
+    config: Config,
+) -> Dict[str, RunningStatistics]:
     """
+    Moments of the per-entry mean score, grouped by metadata.group.
 
-    group_scores: Dict[str, List[float]] = {}
-
-    for entry in dataset:
-        entry_mean = mean(entry.scores.values())
-        group = entry.metadata.group
-
-        if group not in group_scores:
-            group_scores[group] = []
+    Entry totals are integers, so each group's moments are computed
+    exactly from a histogram of totals and then rescaled to means.
+    """
 
-        group_scores[group].append(entry_mean)
+    scale = 1 / len(config.required_dimensions)
 
-    return group_scores
+    return {
+        group: RunningStatistics.from_histogram(histogram).scaled(scale)
+        for group, histogram in group_histograms(dataset, config).items()
+    }
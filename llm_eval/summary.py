@@ -0,0 +1,316 @@
+"""
+Dataset Summary Layer
+
+Author: Pradeep Kumar
+
+Mergeable sufficient statistics for evaluation datasets.
+
+Every score-based analysis (reporting, failure analysis, benchmark,
+dimensional breakdown, t-test and KL drift) depends on the data only
+through per-dimension score histograms and per-group histograms of
+entry score totals. A DatasetSummary holds exactly those, so partial
+summaries computed on shards can be merged and analysed without the
+entries themselves.
+
+A CompressedDataset sits between entries and summaries: it collapses
+the dataset into weighted unique (group, score vector) rows. With a
+handful of dimensions and a small score range there are only a few
+hundred such rows however many entries there are, and every summary
+is derived from them in time independent of dataset size.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from .config import Config
+from .models import EvaluationEntry
+from .score_matrix import ScoreMatrix, ScoreSource, as_score_matrix
+from .exceptions import StatisticalComputationError
+
+
+Histogram = Dict[int, int]
+
+# (group, score vector in dimension order) -> number of entries
+WeightedRows = Dict[Tuple[str, Tuple[int, ...]], int]
+
+
+@dataclass(frozen=True)
+class DatasetSummary:
+    """
+    Histogram summary of a dataset (or a shard of one).
+
+    score_histograms maps dimension -> score -> count.
+    group_histograms maps group -> entry score total -> count,
+    in first-seen group order.
+    """
+
+    dimensions: Tuple[str, ...]
+    score_histograms: Dict[str, Histogram]
+    group_histograms: Dict[str, Histogram]
+
+    @property
+    def count(self) -> int:
+        return sum(
+            sum(histogram.values())
+            for histogram in self.group_histograms.values()
+        )
+
+    @property
+    def group_counts(self) -> Dict[str, int]:
+        return {
+            group: sum(histogram.values())
+            for group, histogram in self.group_histograms.items()
+        }
+
+    @classmethod
+    def from_matrix(cls, matrix: ScoreMatrix) -> "DatasetSummary":
+        return CompressedDataset.from_matrix(matrix).summary()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable form; histogram keys become strings.
+        """
+
+        return {
+            "dimensions": list(self.dimensions),
+            "score_histograms": {
+                dim: _histogram_to_json(histogram)
+                for dim, histogram in self.score_histograms.items()
+            },
+            "group_histograms": {
+                group: _histogram_to_json(histogram)
+                for group, histogram in self.group_histograms.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatasetSummary":
+        return cls(
+            dimensions=tuple(data["dimensions"]),
+            score_histograms={
+                dim: _histogram_from_json(histogram)
+                for dim, histogram in data["score_histograms"].items()
+            },
+            group_histograms={
+                group: _histogram_from_json(histogram)
+                for group, histogram in data["group_histograms"].items()
+            },
+        )
+
+    def merge(self, other: "DatasetSummary") -> "DatasetSummary":
+        """
+        Combine two partial summaries over the same dimensions.
+        """
+
+        if self.dimensions != other.dimensions:
+            raise StatisticalComputationError(
+                "Cannot merge summaries with different dimensions."
+            )
+
+        return DatasetSummary(
+            dimensions=self.dimensions,
+            score_histograms={
+                dim: _merge_histograms(
+                    self.score_histograms[dim],
+                    other.score_histograms[dim],
+                )
+                for dim in self.dimensions
+            },
+            group_histograms=_merge_keyed(
+                self.group_histograms,
+                other.group_histograms,
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class CompressedDataset:
+    """
+    Dataset collapsed into weighted unique (group, score vector) rows.
+
+    rows preserves first-seen order, so groups derived from it keep
+    the order in which they appear in the data.
+    """
+
+    dimensions: Tuple[str, ...]
+    rows: WeightedRows
+
+    @property
+    def count(self) -> int:
+        return sum(self.rows.values())
+
+    @classmethod
+    def from_matrix(cls, matrix: ScoreMatrix) -> "CompressedDataset":
+        labels = matrix.group_labels
+        counts = Counter(zip(matrix.group_codes, zip(*matrix.columns)))
+
+        return cls(
+            dimensions=matrix.dimensions,
+            rows={
+                (labels[code], vector): count
+                for (code, vector), count in counts.items()
+            },
+        )
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[EvaluationEntry],
+        config: Config,
+    ) -> "CompressedDataset":
+        """
+        Compress entries in a single streaming pass; memory is bounded
+        by the number of unique rows, not the number of entries.
+        """
+
+        dimensions = tuple(config.required_dimensions)
+
+        counts = Counter(
+            (entry.metadata.group, entry.score_vector(dimensions))
+            for entry in entries
+        )
+
+        return cls(dimensions=dimensions, rows=dict(counts))
+
+    def summary(self) -> DatasetSummary:
+        """
+        Weighted per-dimension and per-group histograms.
+        """
+
+        score_histograms: Dict[str, Histogram] = {
+            dim: {} for dim in self.dimensions
+        }
+        group_histograms: Dict[str, Histogram] = {}
+
+        for (group, vector), count in self.rows.items():
+            totals = group_histograms.setdefault(group, {})
+            total = sum(vector)
+            totals[total] = totals.get(total, 0) + count
+
+            for dim, value in zip(self.dimensions, vector):
+                histogram = score_histograms[dim]
+                histogram[value] = histogram.get(value, 0) + count
+
+        return DatasetSummary(
+            dimensions=self.dimensions,
+            score_histograms=score_histograms,
+            group_histograms=group_histograms,
+        )
+
+    def merge(self, other: "CompressedDataset") -> "CompressedDataset":
+        if self.dimensions != other.dimensions:
+            raise StatisticalComputationError(
+                "Cannot merge summaries with different dimensions."
+            )
+
+        rows = dict(self.rows)
+
+        for key, count in other.rows.items():
+            rows[key] = rows.get(key, 0) + count
+
+        return CompressedDataset(dimensions=self.dimensions, rows=rows)
+
+
+SummarySource = Union[ScoreSource, DatasetSummary, CompressedDataset]
+
+
+def as_summary(
+    source: SummarySource,
+    config: Config,
+) -> DatasetSummary:
+    """
+    Return the summary for a dataset, matrix, compressed dataset or
+    summary.
+    """
+
+    if isinstance(source, DatasetSummary):
+        return source
+
+    if isinstance(source, CompressedDataset):
+        return source.summary()
+
+    return DatasetSummary.from_matrix(as_score_matrix(source, config))
+
+
+def dimension_histograms(
+    source: SummarySource,
+    config: Config,
+) -> Dict[str, Histogram]:
+    """
+    Score histogram per required dimension.
+
+    Avoids computing group totals when the source is not already
+    summarized, since most analyses only need these.
+    """
+
+    if isinstance(source, (DatasetSummary, CompressedDataset)):
+        histograms = as_summary(source, config).score_histograms
+    else:
+        matrix = as_score_matrix(source, config)
+        histograms = {
+            dim: matrix.histogram(dim)
+            for dim in config.required_dimensions
+        }
+
+    try:
+        return {
+            dim: histograms[dim] for dim in config.required_dimensions
+        }
+    except KeyError as e:
+        raise StatisticalComputationError(
+            f"Unknown score dimension: {e.args[0]}"
+        )
+
+
+def group_histograms(
+    source: SummarySource,
+    config: Config,
+) -> Dict[str, Histogram]:
+    """
+    Histogram of per-entry score totals for every group.
+    """
+
+    return as_summary(source, config).group_histograms
+
+
+def histogram_count(histogram: Histogram) -> int:
+    return sum(histogram.values())
+
+
+def histogram_mean(histogram: Histogram) -> float:
+    count = histogram_count(histogram)
+
+    if count == 0:
+        raise ValueError("Cannot compute mean of empty list.")
+
+    return sum(value * n for value, n in histogram.items()) / count
+
+
+def _histogram_to_json(histogram: Histogram) -> Dict[str, int]:
+    return {str(value): count for value, count in histogram.items()}
+
+
+def _histogram_from_json(data: Dict[str, int]) -> Histogram:
+    return {int(value): count for value, count in data.items()}
+
+
+def _merge_histograms(a: Histogram, b: Histogram) -> Histogram:
+    merged = dict(a)
+
+    for value, count in b.items():
+        merged[value] = merged.get(value, 0) + count
+
+    return merged
+
+
+def _merge_keyed(
+    a: Dict[str, Histogram],
+    b: Dict[str, Histogram],
+) -> Dict[str, Histogram]:
+    merged = dict(a)
+
+    for key, histogram in b.items():
+        merged[key] = _merge_histograms(merged.get(key, {}), histogram)
+
+    return merged
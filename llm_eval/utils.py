@@ -1,6 +1,27 @@
+import hashlib
 import math
+import os
 import random
-from typing import Iterable
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Mapping, Sequence
+
+
+# Read once at import: os.umask can only be queried by setting it.
+_UMASK = os.umask(0o077)
+os.umask(_UMASK)
+
+
+def default_file_mode() -> int:
+    """
+    Permissions open() gives a new file under the process umask.
+
+    tempfile.mkstemp creates files as 0600; atomic writers apply this
+    mode before renaming into place, so results stay as readable as
+    a file written directly.
+    """
+
+    return 0o666 & ~_UMASK
 
 
 def set_global_seed(seed: int) -> None:
@@ -10,19 +31,100 @@ def set_global_seed(seed: int) -> None:
     random.seed(seed)
 
 
+def derive_rng(seed: int, *stream: int) -> random.Random:
+    """
+    Independent RNG for a named sub-stream of a seed.
+
+    The stream key is hashed together with the seed, so derived
+    generators never share state with each other or with the
+    module-global random instance.
+    """
+
+    key = ":".join(str(part) for part in (seed, *stream))
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def binomial_variate(rng: random.Random, n: int, p: float) -> int:
+    """
+    Number of successes in n Bernoulli(p) trials, in O(1) expected
+    time for any n.
+
+    Geometric waiting times when n * p is small, otherwise Hörmann's
+    BTRS transformed rejection (the algorithm of Python 3.12's
+    random.binomialvariate, reproduced so draws do not depend on the
+    interpreter version).
+    """
+
+    if p <= 0.0 or n <= 0:
+        return 0
+
+    if p >= 1.0:
+        return n
+
+    if p > 0.5:
+        return n - binomial_variate(rng, n, 1.0 - p)
+
+    if n * p < 10.0:
+        successes = trials = 0
+        log_q = math.log(1.0 - p)
+
+        if not log_q:
+            return 0
+
+        while True:
+            trials += math.floor(math.log(rng.random()) / log_q) + 1
+
+            if trials > n:
+                return successes
+
+            successes += 1
+
+    spq = math.sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    v_r = 0.92 - 4.2 / b
+
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = math.log(p / (1.0 - p))
+    mode = math.floor((n + 1) * p)
+    h = math.lgamma(mode + 1) + math.lgamma(n - mode + 1)
+
+    while True:
+        u = rng.random() - 0.5
+        us = 0.5 - abs(u)
+        k = math.floor((2.0 * a / us + b) * u + c)
+
+        if k < 0 or k > n:
+            continue
+
+        v = rng.random()
+
+        if us >= 0.07 and v <= v_r:
+            return k
+
+        v *= alpha / (a / (us * us) + b)
+
+        if math.log(v) <= (
+            h
+            - math.lgamma(k + 1)
+            - math.lgamma(n - k + 1)
+            + (k - mode) * lpq
+        ):
+            return k
+
+
 def mean(values: Iterable[float]) -> float:
-    values_list = list(values)
-    if not values_list:
+    if not isinstance(values, Sequence):
+        values = list(values)
+    if not values:
         raise ValueError("Cannot compute mean of empty list.")
-    return sum(values_list) / len(values_list)
+    return sum(values) / len(values)
 
 
 def variance(values: Iterable[float]) -> float:
-    values_list = list(values)
-    if len(values_list) < 2:
-        raise ValueError("Variance requires at least two values.")
-    m = mean(values_list)
-    return sum((x - m) ** 2 for x in values_list) / (len(values_list) - 1)
+    return RunningStatistics.from_values(values).variance
 
 
 def standard_deviation(values: Iterable[float]) -> float:
@@ -38,20 +140,137 @@ def confidence_interval(
     using normal approximation (large-sample assumption).
     """
 
-    values_list = list(values)
+    return RunningStatistics.from_values(values).confidence_interval(
+        confidence_level
+    )
 
-    if not values_list:
-        raise ValueError(
-            "Cannot compute confidence interval on empty list."
-        )
 
-    if confidence_level != 0.95:
-        raise ValueError(
-            "Currently only 95% confidence supported."
+# Values folded into the accumulator per chunk in from_values/extend.
+_CHUNK_SIZE = 4096
+
+
+@dataclass
+class RunningStatistics:
+    """
+    Mergeable single-pass accumulator of count, mean and M2
+    (sum of squared deviations from the mean).
+
+    Values are folded in chunk by chunk and partial results from
+    shards are combined with Chan's parallel update, so every
+    moment-based statistic comes from one pass over the data.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "RunningStatistics":
+        stats = cls()
+        stats.extend(values)
+        return stats
+
+    @classmethod
+    def from_histogram(
+        cls,
+        histogram: Mapping[int, int],
+    ) -> "RunningStatistics":
+        """
+        Exact moments of a value -> count histogram in O(bins).
+        """
+
+        stats = cls()
+
+        for value, count in histogram.items():
+            if count:
+                stats._combine(count, float(value), 0.0)
+
+        return stats
+
+    def update(self, value: float) -> None:
+        """
+        Welford update with a single value.
+        """
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Fold values in chunk by chunk, consuming the iterable once.
+        """
+
+        iterator = iter(values)
+
+        while True:
+            chunk = list(islice(iterator, _CHUNK_SIZE))
+
+            if not chunk:
+                return
+
+            n = len(chunk)
+            chunk_mean = sum(chunk) / n
+            chunk_m2 = sum((x - chunk_mean) ** 2 for x in chunk)
+
+            self._combine(n, chunk_mean, chunk_m2)
+
+    def merge(self, other: "RunningStatistics") -> "RunningStatistics":
+        """
+        Combine two partial accumulators without mutating either.
+        """
+
+        merged = RunningStatistics(self.count, self.mean, self.m2)
+        merged._combine(other.count, other.mean, other.m2)
+        return merged
+
+    def scaled(self, factor: float) -> "RunningStatistics":
+        """
+        Statistics of every value multiplied by factor.
+        """
+
+        return RunningStatistics(
+            self.count,
+            self.mean * factor,
+            self.m2 * factor * factor,
         )
 
-    z = 1.96  # 95% normal approximation
-    sd = standard_deviation(values_list)
-    n = len(values_list)
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            raise ValueError("Variance requires at least two values.")
+        return self.m2 / (self.count - 1)
+
+    @property
+    def standard_deviation(self) -> float:
+        return math.sqrt(self.variance)
+
+    def confidence_interval(self, confidence_level: float) -> float:
+        """
+        Margin of error using normal approximation.
+        """
+
+        if self.count == 0:
+            raise ValueError(
+                "Cannot compute confidence interval on empty list."
+            )
+
+        if confidence_level != 0.95:
+            raise ValueError(
+                "Currently only 95% confidence supported."
+            )
+
+        z = 1.96  # 95% normal approximation
+        return z * (self.standard_deviation / math.sqrt(self.count))
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        if count == 0:
+            return
+
+        total = self.count + count
+        delta = mean - self.mean
 
-    return z * (sd / math.sqrt(n))
\ No newline at end of file
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
@@ -5,72 +5,957 @@ Author: Pradeep Kumar
 
 This module enforces strict schema and integrity guarantees
 for LLM evaluation datasets.
+
+Datasets may be a top-level JSON array or JSON Lines (one entry
+per line). Both formats are parsed incrementally, so entries are
+validated and yielded as soon as they are read.
+
+With lazy_text, entries keep only the byte span of their JSON object
+and re-read prompt and response from the file on access.
+
+Entries are checked by a validator compiled once per Config: a fast
+path of precompiled checks accepts well-formed entries, and anything
+it does not recognise falls through to the full checks that produce
+the detailed error. Errors are prefixed with the row they occur on
+(the line number for JSON Lines, the element position for arrays).
+validate_dataset_file reports every error in a file rather than
+stopping at the first, validating JSON Lines in parallel chunks.
+
+IncrementalValidator validates JSON Lines fed in arbitrary byte
+chunks, for files that are still being appended to and for pipes.
 """
 
+import io
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Any
+from typing import (
+    Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Any,
+    BinaryIO, TextIO,
+)
 
 from .config import Config
-from .models import EvaluationEntry, Metadata, Dataset
+from .models import EvaluationEntry, Metadata, Dataset, Text, TextHandle
 from .exceptions import DatasetValidationError
 
 
+_READ_CHUNK_SIZE = 1 << 16
+
+# Approximate size of the line-aligned chunks validate_dataset_file
+# splits JSON Lines files into.
+_CHUNK_BYTES = 1 << 23
+
+_ENTRY_FIELDS = frozenset({"id", "prompt", "response", "scores", "metadata"})
+_METADATA_FIELDS = frozenset({"model", "timestamp", "group"})
+
+# IDs are stored as signed 64-bit integers (ScoreMatrix, binary format).
+_ID_MIN = -(1 << 63)
+_ID_MAX = (1 << 63) - 1
+
+_DECODER = json.JSONDecoder()
+
+# Byte offset and length of one entry's JSON object in the file.
+_Span = Tuple[int, int]
+
+# (row, item, span) as produced by the parsers.
+_RawRow = Tuple[int, Any, Optional[_Span]]
+
+
 def load_and_validate_dataset(
     path: Path,
     config: Config,
+    lazy_text: bool = False,
 ) -> Dataset:
     """
-    Load dataset from JSON file and perform full validation.
+    Load dataset from JSON or JSON Lines file and perform full validation.
+    """
+
+    return list(iter_validated_entries(path, config, lazy_text=lazy_text))
+
+
+def iter_validated_entries(
+    path: Path,
+    config: Config,
+    enforce_integrity: bool = True,
+    lazy_text: bool = False,
+    unique_ids: bool = True,
+    max_ratings: Optional[int] = None,
+) -> Iterator[EvaluationEntry]:
+    """
+    Stream validated entries from a JSON array or JSON Lines file.
+
+    Entries are validated one at a time while duplicate IDs and group
+    counts are tracked on the fly. Dataset-level checks (minimum size
+    and group integrity) run once the file is exhausted, so consumers
+    must drain the iterator to receive the full validation guarantee.
+
+    Set enforce_integrity=False when the file is one shard of a larger
+    dataset; the caller is then responsible for check_dataset_integrity
+    on the merged counts.
+
+    Set lazy_text=True to defer prompt and response decoding; the
+    file must then stay in place for as long as the text is read.
+
+    Rating data repeats each ID once per rater: pass unique_ids=False
+    and max_ratings to cap the ratings per ID instead.
     """
 
     if not path.exists():
         raise DatasetValidationError(f"Dataset file not found: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        raw_data: Any = json.load(f)
+    tracker = _IntegrityTracker(unique_ids, max_ratings)
+    validator = _EntryValidator(config)
 
-    if not isinstance(raw_data, list):
-        raise DatasetValidationError(
-            "Dataset must be a list of entries."
+    with path.open("rb") as f:
+        for row, item, span in _iter_raw_items(f, track_spans=lazy_text):
+            text = None
+
+            if lazy_text and span is not None:
+                text = _JsonText(path, *span)
+
+            try:
+                entry = validator.validate(item, text)
+                tracker.observe(entry)
+            except DatasetValidationError as e:
+                raise DatasetValidationError(f"Row {row}: {str(e)}")
+
+            yield entry
+
+    if enforce_integrity:
+        check_dataset_integrity(tracker.count, tracker.group_counts, config)
+
+
+class IncrementalValidator:
+    """
+    Validates JSON Lines delivered in arbitrary byte chunks.
+
+    Only complete lines are parsed; a trailing partial line is held
+    until its newline arrives (or finish() is called). Line numbers,
+    duplicate-ID tracking and group counts carry across chunks, and
+    memory is bounded by the chunk size plus the seen IDs.
+
+    unique_ids=False accepts repeated IDs (agreement data rates each
+    ID once per rater), up to max_ratings per ID when it is set.
+    skip_invalid=True records "Row N: ..." errors in self.errors and
+    drops the row instead of raising.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        unique_ids: bool = True,
+        skip_invalid: bool = False,
+        max_ratings: Optional[int] = None,
+    ) -> None:
+        self.config = config
+        self.skip_invalid = skip_invalid
+        self.errors: List[str] = []
+        self.line_number = 0
+
+        self._pending = b""
+        self._started = False
+        self._validator = _EntryValidator(config)
+        self._tracker = _IntegrityTracker(unique_ids, max_ratings)
+
+    @property
+    def count(self) -> int:
+        return self._tracker.count
+
+    @property
+    def group_counts(self) -> Dict[str, int]:
+        return self._tracker.group_counts
+
+    def feed(self, data: bytes) -> List[EvaluationEntry]:
+        """
+        Validate the complete lines in pending bytes plus data.
+        """
+
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+
+        return self._validate_lines(lines)
+
+    def finish(self) -> List[EvaluationEntry]:
+        """
+        Validate a final line left without a trailing newline.
+        """
+
+        lines = [self._pending] if self._pending else []
+        self._pending = b""
+
+        return self._validate_lines(lines)
+
+    def check_integrity(self) -> None:
+        check_dataset_integrity(
+            self._tracker.count, self._tracker.group_counts, self.config
         )
 
-    if len(raw_data) < config.min_dataset_size:
+    def _validate_lines(self, lines: List[bytes]) -> List[EvaluationEntry]:
+        entries: List[EvaluationEntry] = []
+
+        for line in lines:
+            self.line_number += 1
+
+            if not line.strip():
+                continue
+
+            # A JSON array cannot be split into lines; fail once, clearly
+            if not self._started and line.lstrip().startswith(b"["):
+                raise DatasetValidationError(
+                    "Expected JSON Lines (one entry object per line), "
+                    "got a JSON array."
+                )
+
+            self._started = True
+
+            try:
+                try:
+                    item = _decode_line(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    raise DatasetValidationError(
+                        f"Invalid JSON on line {self.line_number}: "
+                        f"{getattr(e, 'msg', str(e))}"
+                    )
+
+                try:
+                    entry = self._validator.validate(item)
+                    self._tracker.observe(entry)
+                except DatasetValidationError as e:
+                    raise DatasetValidationError(
+                        f"Row {self.line_number}: {str(e)}"
+                    )
+
+            except DatasetValidationError as e:
+                if not self.skip_invalid:
+                    raise
+                self.errors.append(str(e))
+                continue
+
+            entries.append(entry)
+
+        return entries
+
+
+def check_dataset_integrity(
+    count: int,
+    group_counts: Dict[str, int],
+    config: Config,
+) -> None:
+    """
+    Dataset-level checks: minimum size and group integrity.
+    """
+
+    if count < config.min_dataset_size:
         raise DatasetValidationError(
             f"Dataset must contain at least "
             f"{config.min_dataset_size} entries."
         )
 
-    entries: List[EvaluationEntry] = []
-    seen_ids: Set[int] = set()
+    _validate_group_integrity(group_counts)
+
+
+def validate_dataset_file(
+    path: Path,
+    config: Config,
+) -> List[str]:
+    """
+    Validate a whole file and return every error found, each prefixed
+    with its row; an empty list means the dataset is valid.
+
+    JSON Lines files are split into byte-range chunks validated across
+    config.workers processes. A JSON array is validated in-process and
+    a syntax error ends it, since no later element can be located.
+    """
+
+    if not path.exists():
+        raise DatasetValidationError(f"Dataset file not found: {path}")
+
+    with path.open("rb") as f:
+        stripped = f.read(_READ_CHUNK_SIZE).lstrip()
+
+    if stripped.startswith(b"{"):
+        chunks = _line_chunks(path)
+
+        if config.workers <= 1 or len(chunks) == 1:
+            reports = [
+                _check_line_chunk(path, start, end, config)
+                for start, end in chunks
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=config.workers) as executor:
+                reports = list(executor.map(
+                    _check_line_chunk,
+                    repeat(path),
+                    *zip(*chunks),
+                    repeat(config),
+                ))
+
+    elif stripped.startswith(b"["):
+        reports = [_check_array(path, config)]
+
+    else:
+        return ["Dataset must be a list of entries."]
+
+    return _combine_reports(reports, config)
+
+
+@dataclass
+class _ChunkReport:
+    """
+    Validation outcome of one chunk, with rows local to the chunk.
+    """
+
+    rows: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    accepted: List[Tuple[int, Any, str]] = field(default_factory=list)
+
+    def check(
+        self,
+        validator: "_EntryValidator",
+        row: int,
+        item: Any,
+    ) -> None:
+        try:
+            entry = validator.validate(item)
+        except DatasetValidationError as e:
+            self.errors.append((row, str(e)))
+            return
+
+        self.accepted.append((row, entry.id, entry.metadata.group))
+
+
+def _line_chunks(path: Path) -> List[Tuple[int, int]]:
+    """
+    Split a JSON Lines file into byte ranges of about _CHUNK_BYTES
+    that each start at the beginning of a line.
+    """
+
+    size = path.stat().st_size
+    boundaries = [0]
+
+    with path.open("rb") as f:
+        while boundaries[-1] + _CHUNK_BYTES < size:
+            f.seek(boundaries[-1] + _CHUNK_BYTES)
+            f.readline()
+            boundaries.append(f.tell())
+
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:])) or [(0, size)]
+
+
+def _check_line_chunk(
+    path: Path,
+    start: int,
+    end: int,
+    config: Config,
+) -> _ChunkReport:
+    report = _ChunkReport()
+    validator = _EntryValidator(config)
+
+    with path.open("rb") as f:
+        f.seek(start)
+
+        for row, (_, line) in enumerate(_iter_lines(f, end), start=1):
+            report.rows = row
+
+            if not line.strip():
+                continue
+
+            try:
+                item = _decode_line(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                report.errors.append(
+                    (row, f"Invalid JSON: {getattr(e, 'msg', str(e))}")
+                )
+                continue
+
+            report.check(validator, row, item)
+
+    return report
+
+
+def _check_array(path: Path, config: Config) -> _ChunkReport:
+    report = _ChunkReport()
+    validator = _EntryValidator(config)
+
+    try:
+        with path.open("rb") as f:
+            for row, item, _ in _iter_raw_items(f):
+                report.rows = row
+                report.check(validator, row, item)
+    except DatasetValidationError as e:
+        report.errors.append((report.rows + 1, str(e)))
+
+    return report
+
+
+def _combine_reports(
+    reports: List[_ChunkReport],
+    config: Config,
+) -> List[str]:
+    """
+    Number rows across chunks and add duplicate-ID and dataset-level
+    errors.
+    """
+
+    errors: List[Tuple[int, str]] = []
+    seen_ids: Set[Any] = set()
     group_counts: Dict[str, int] = {}
+    count = 0
+    offset = 0
+
+    for report in reports:
+        errors.extend(
+            (offset + row, message) for row, message in report.errors
+        )
+
+        for row, entry_id, group in report.accepted:
+            if entry_id in seen_ids:
+                errors.append(
+                    (offset + row, f"Duplicate ID detected: {entry_id}")
+                )
+                continue
+
+            seen_ids.add(entry_id)
+            group_counts[group] = group_counts.get(group, 0) + 1
+            count += 1
+
+        offset += report.rows
+
+    messages = [
+        f"Row {row}: {message}"
+        for row, message in sorted(errors, key=itemgetter(0))
+    ]
+
+    try:
+        check_dataset_integrity(count, group_counts, config)
+    except DatasetValidationError as e:
+        messages.append(str(e))
+
+    return messages
+
+
+class _IntegrityTracker:
+    """
+    Incremental dataset-level integrity state.
+
+    Memory grows with the number of distinct IDs, which is the minimum
+    required to detect duplicates.
+    """
+
+    def __init__(
+        self,
+        unique_ids: bool = True,
+        max_ratings: Optional[int] = None,
+    ) -> None:
+        self.count = 0
+        self.unique_ids = unique_ids
+        self.max_ratings = max_ratings
+        self.seen_ids: Set[int] = set()
+        self.ratings: Dict[int, int] = {}
+        self.group_counts: Dict[str, int] = {}
+
+    def observe(self, entry: EvaluationEntry) -> None:
+        if self.unique_ids:
+            if entry.id in self.seen_ids:
+                raise DatasetValidationError(
+                    f"Duplicate ID detected: {entry.id}"
+                )
+
+            self.seen_ids.add(entry.id)
+
+        elif self.max_ratings is not None:
+            ratings = self.ratings.get(entry.id, 0)
+
+            if ratings >= self.max_ratings:
+                raise DatasetValidationError(
+                    f"ID {entry.id} has more than "
+                    f"{self.max_ratings} ratings."
+                )
+
+            self.ratings[entry.id] = ratings + 1
+
+        self.group_counts[entry.metadata.group] = (
+            self.group_counts.get(entry.metadata.group, 0) + 1
+        )
+
+        self.count += 1
+
+
+class _MetadataTable:
+    """
+    Shares metadata strings and instances across entries.
+
+    Model and group labels are interned. Each (model, group) pair keeps
+    its latest Metadata, so consecutive entries of a pair with the same
+    timestamp (typical of batch runs, even when models interleave)
+    reuse one instance, and a repeated timestamp reuses one string.
+    """
+
+    def __init__(self) -> None:
+        self._latest: Dict[Tuple[Any, Any], Metadata] = {}
+        self._timestamp: Any = None
+
+    def get(self, model: Any, timestamp: Any, group: Any) -> Metadata:
+        key = (model, group)
+
+        try:
+            latest = self._latest.get(key)
+        except TypeError:  # unhashable labels are not shared
+            return Metadata(model=model, timestamp=timestamp, group=group)
+
+        if latest is not None and latest.timestamp == timestamp:
+            return latest
+
+        if timestamp == self._timestamp:
+            timestamp = self._timestamp
+
+        self._timestamp = timestamp
+
+        if latest is None:
+            latest = Metadata(
+                model=_intern(model),
+                timestamp=timestamp,
+                group=_intern(group),
+            )
+        else:
+            latest = Metadata(
+                model=latest.model,
+                timestamp=timestamp,
+                group=latest.group,
+            )
 
-    for item in raw_data:
-        entry = _validate_entry(item, config)
+        self._latest[key] = latest
+        return latest
 
-        if entry.id in seen_ids:
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
+class _JsonText:
+    """
+    Prompt and response of an entry, re-read from its byte span.
+    """
+
+    path: Path
+    offset: int
+    length: int
+
+    def load(self) -> Tuple[str, str]:
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            item = json.loads(f.read(self.length))
+
+        return item["prompt"], item["response"]
+
+
+class _ByteTracker:
+    """
+    Maps character positions in a sliding text buffer to byte
+    offsets in the underlying UTF-8 file.
+
+    Every character is encoded once, as the position moves past it.
+    """
+
+    def __init__(self, offset: int) -> None:
+        self.index = 0
+        self.offset = offset
+
+    def advance(self, buffer: str, index: int) -> int:
+        self.offset += len(buffer[self.index:index].encode("utf-8"))
+        self.index = index
+        return self.offset
+
+    def rebase(self, buffer: str, pos: int) -> None:
+        self.advance(buffer, pos)
+        self.index = 0
+
+
+def _iter_raw_items(
+    f: BinaryIO,
+    track_spans: bool = False,
+) -> Iterator[_RawRow]:
+    """
+    Dispatch to the array or JSON Lines parser based on the
+    first non-whitespace character of the file.
+
+    JSON Lines items always carry their byte span; array items only
+    when track_spans is set, since that costs a re-encode of the text.
+    """
+
+    head = f.read(_READ_CHUNK_SIZE)
+    stripped = head.lstrip()
+
+    if stripped.startswith(b"["):
+        f.seek(0)
+        return _iter_array_items(f, track_spans)
+
+    if stripped.startswith(b"{"):
+        return _iter_json_lines(f, head)
+
+    raise DatasetValidationError(
+        "Dataset must be a list of entries."
+    )
+
+
+def _iter_array_items(f: BinaryIO, track_spans: bool) -> Iterator[_RawRow]:
+    """
+    Decode the binary file as UTF-8 text for _iter_json_array. The
+    wrapper is detached when iteration ends so it neither closes the
+    caller's file nor is left unclosed (once the caller has closed
+    the file, the wrapper reports itself closed too).
+    """
+
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+
+    try:
+        buffer = text.read(_READ_CHUNK_SIZE)
+        leading = len(buffer) - len(buffer.lstrip())
+
+        tracker = _ByteTracker(leading) if track_spans else None
+        yield from _iter_json_array(text, buffer[leading:], tracker)
+
+    except UnicodeDecodeError as e:
+        raise DatasetValidationError(f"Invalid JSON: {str(e)}")
+
+    finally:
+        if not f.closed:
+            text.detach()
+
+
+def _iter_lines(
+    f: BinaryIO,
+    end: Optional[int] = None,
+    head: bytes = b"",
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (byte offset, line) from the current position up to end,
+    where head holds bytes already read from the position.
+    """
+
+    position = f.tell() - len(head)
+    remaining = None if end is None else end - f.tell()
+    pending = head
+
+    while True:
+        size = _READ_CHUNK_SIZE
+
+        if remaining is not None:
+            size = min(size, remaining)
+            remaining -= size
+
+        chunk = f.read(size) if size else b""
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+
+        for line in lines:
+            yield position, line
+            position += len(line) + 1
+
+        if not chunk:
+            if pending:
+                yield position, pending
+            return
+
+
+def _decode_line(line: bytes) -> Any:
+    return _DECODER.decode(line.decode("utf-8"))
+
+
+def _iter_json_lines(
+    f: BinaryIO,
+    head: bytes,
+) -> Iterator[_RawRow]:
+    """
+    Parse one JSON object per line. Blank lines are ignored.
+    """
+
+    lines = _iter_lines(f, head=head)
+
+    for line_number, (offset, line) in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            item = _decode_line(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise DatasetValidationError(
+                f"Invalid JSON on line {line_number}: "
+                f"{getattr(e, 'msg', str(e))}"
+            )
+
+        yield line_number, item, (offset, len(line))
+
+
+def _iter_json_array(
+    f: TextIO,
+    buffer: str,
+    tracker: Optional[_ByteTracker] = None,
+) -> Iterator[_RawRow]:
+    """
+    Incrementally parse the elements of a top-level JSON array.
+
+    Only the element currently being decoded is held in memory
+    together with at most one read chunk of lookahead.
+    """
+
+    decoder = json.JSONDecoder()
+    pos = 1  # skip opening bracket
+    row = 0
+    eof = False
+    expect_value = True
+    first = True
+
+    while True:
+        # Skip whitespace, refilling the buffer as needed.
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+
+            if pos < len(buffer) or eof:
+                break
+
+            buffer, pos, eof = _refill(f, buffer, pos, tracker)
+
+        if pos >= len(buffer):
             raise DatasetValidationError(
-                f"Duplicate ID detected: {entry.id}"
+                "Invalid JSON: unterminated dataset array."
             )
 
-        seen_ids.add(entry.id)
+        char = buffer[pos]
+
+        if char == "]" and (first or not expect_value):
+            return
+
+        if not expect_value:
+            if char != ",":
+                raise DatasetValidationError(
+                    "Invalid JSON: expected ',' between entries."
+                )
+
+            pos += 1
+            expect_value = True
+            continue
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise DatasetValidationError(
+                        f"Invalid JSON: {e.msg}"
+                    )
+
+                buffer, pos, eof = _refill(f, buffer, pos, tracker)
+                continue
+
+            # A value touching the buffer end may be truncated.
+            if end == len(buffer) and not eof:
+                buffer, pos, eof = _refill(f, buffer, pos, tracker)
+                continue
+
+            break
+
+        span = None
 
-        group_counts[entry.metadata.group] = (
-            group_counts.get(entry.metadata.group, 0) + 1
+        if tracker is not None:
+            start = tracker.advance(buffer, pos)
+            span = (start, tracker.advance(buffer, end) - start)
+
+        row += 1
+        yield row, item, span
+
+        pos = end
+        expect_value = False
+        first = False
+
+
+def _refill(
+    f: TextIO,
+    buffer: str,
+    pos: int,
+    tracker: Optional[_ByteTracker] = None,
+) -> Tuple[str, int, bool]:
+    """
+    Drop consumed input and append the next chunk.
+    """
+
+    if tracker is not None:
+        tracker.rebase(buffer, pos)
+
+    chunk = f.read(_READ_CHUNK_SIZE)
+    return buffer[pos:] + chunk, 0, not chunk
+
+
+@dataclass(frozen=True)
+class _Schema:
+    """
+    Entry checks precompiled from a Config.
+    """
+
+    dimensions: Tuple[str, ...]
+    score_getter: Callable[[Dict[str, Any]], Any]
+    allowed_scores: FrozenSet[int]
+
+
+@lru_cache(maxsize=32)
+def _compile_schema(config: Config) -> _Schema:
+    dimensions = tuple(config.required_dimensions)
+
+    # itemgetter returns a tuple only for two or more keys.
+    score_getter: Callable[[Dict[str, Any]], Any] = (
+        itemgetter(*dimensions) if len(dimensions) > 1
+        else lambda scores: tuple(scores[dim] for dim in dimensions)
+    )
+
+    return _Schema(
+        dimensions=dimensions,
+        score_getter=score_getter,
+        allowed_scores=frozenset(
+            range(config.score_min, config.score_max + 1)
+        ),
+    )
+
+
+class _EntryValidator:
+    """
+    Validates and builds entries for one load.
+
+    The fast path only accepts entries that the full checks would
+    accept; everything else is re-checked by _check_entry, which
+    raises the detailed error (or accepts edge cases such as
+    boolean scores that the fast path leaves to it).
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.schema = _compile_schema(config)
+        self.metadata_table = _MetadataTable()
+        self._valid_timestamp: Optional[str] = None
+
+    def validate(
+        self,
+        item: Any,
+        text: Optional[TextHandle] = None,
+    ) -> EvaluationEntry:
+
+        values = self._fast_scores(item)
+
+        if values is None or not self._fast_metadata(item["metadata"]):
+            _check_entry(item, self.config)
+            scores = item["scores"]
+            values = tuple(scores[dim] for dim in self.schema.dimensions)
+
+        metadata = item["metadata"]
+        text_source: Text = (
+            text if text is not None else (item["prompt"], item["response"])
         )
 
-        entries.append(entry)
+        return EvaluationEntry.from_score_vector(
+            id=item["id"],
+            dimensions=self.schema.dimensions,
+            values=values,
+            metadata=self.metadata_table.get(
+                metadata["model"],
+                metadata["timestamp"],
+                metadata["group"],
+            ),
+            text=text_source,
+        )
 
-    _validate_group_integrity(group_counts)
+    def _fast_scores(self, item: Any) -> Optional[Tuple[int, ...]]:
+        if type(item) is not dict or not _ENTRY_FIELDS <= item.keys():
+            return None
+
+        if type(item["id"]) is not int or not (
+            _ID_MIN <= item["id"] <= _ID_MAX
+        ):
+            return None
+
+        scores = item["scores"]
+        schema = self.schema
+
+        if type(scores) is not dict or len(scores) != len(schema.dimensions):
+            return None
+
+        try:
+            values: Tuple[int, ...] = schema.score_getter(scores)
+        except KeyError:
+            return None
+
+        if not schema.allowed_scores.issuperset(values):
+            return None
+
+        for value in values:
+            if type(value) is not int:
+                return None
 
-    return entries
+        return values
 
+    def _fast_metadata(self, metadata: Any) -> bool:
+        if type(metadata) is not dict or not _METADATA_FIELDS <= (
+            metadata.keys()
+        ):
+            return False
 
-def _validate_entry(
-    item: Dict[str, Any],
+        if type(metadata["model"]) is not str or (
+            type(metadata["group"]) is not str
+        ):
+            return False
+
+        timestamp = metadata["timestamp"]
+
+        # Batch runs repeat timestamps; skip re-parsing the last one.
+        if timestamp == self._valid_timestamp:
+            return True
+
+        if type(timestamp) is not str or not _is_iso_timestamp(timestamp):
+            return False
+
+        self._valid_timestamp = timestamp
+        return True
+
+
+def _is_iso_timestamp(timestamp: str) -> bool:
+    """
+    Fast equivalent of the full timestamp check for the common form
+    with at most a trailing 'Z'; other forms return False and are left
+    to _validate_metadata.
+    """
+
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+
+    if "Z" in timestamp:
+        return False
+
+    try:
+        datetime.fromisoformat(timestamp)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _check_entry(
+    item: Any,
     config: Config,
-) -> EvaluationEntry:
+) -> None:
+
+    if not isinstance(item, dict):
+        raise DatasetValidationError(
+            "Each dataset entry must be a JSON object."
+        )
 
     required_fields = {
         "id",
@@ -85,23 +970,19 @@ def _validate_entry(
             f"Missing required fields. Required: {required_fields}"
         )
 
-    scores = item["scores"]
-    _validate_scores(scores, config)
+    # bool is an int subclass but not a usable ID
+    if not isinstance(item["id"], int) or isinstance(item["id"], bool):
+        raise DatasetValidationError(
+            f"Entry id must be an integer: {item['id']!r}"
+        )
 
-    metadata = item["metadata"]
-    _validate_metadata(metadata)
+    if not _ID_MIN <= item["id"] <= _ID_MAX:
+        raise DatasetValidationError(
+            f"Entry id out of 64-bit range: {item['id']}"
+        )
 
-    return EvaluationEntry(
-        id=item["id"],
-        prompt=item["prompt"],
-        response=item["response"],
-        scores=scores,
-        metadata=Metadata(
-            model=metadata["model"],
-            timestamp=metadata["timestamp"],
-            group=metadata["group"],
-        ),
-    )
+    _validate_scores(item["scores"], config)
+    _validate_metadata(item["metadata"])
 
 
 def _validate_scores(
@@ -139,6 +1020,11 @@ def _validate_metadata(
     metadata: Dict[str, Any],
 ) -> None:
 
+    if not isinstance(metadata, dict):
+        raise DatasetValidationError(
+            "Metadata must be a dictionary."
+        )
+
     required_fields = {"model", "timestamp", "group"}
 
     if not required_fields.issubset(metadata.keys()):
@@ -146,6 +1032,18 @@ def _validate_metadata(
             f"Metadata missing required fields: {required_fields}"
         )
 
+    for name in ("model", "group"):
+        if not isinstance(metadata[name], str):
+            raise DatasetValidationError(
+                f"Metadata '{name}' must be a string."
+            )
+
+    if not isinstance(metadata["timestamp"], str):
+        raise DatasetValidationError(
+            f"Invalid ISO 8601 timestamp: "
+            f"{metadata['timestamp']}"
+        )
+
     try:
         datetime.fromisoformat(
             metadata["timestamp"].replace("Z", "+00:00")
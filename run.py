@@ -7,17 +7,508 @@ Entry point for LLM Evaluation Framework.
 """
 
 import argparse
+import os
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from llm_eval.config import Config
-from llm_eval.validation import load_and_validate_dataset
+from llm_eval.exceptions import DatasetValidationError
+from llm_eval.models import EvaluationEntry
+from llm_eval.validation import (
+    IncrementalValidator,
+    iter_validated_entries,
+    validate_dataset_file,
+)
+from llm_eval.score_matrix import ScoreMatrix
+from llm_eval.summary import (
+    CompressedDataset,
+    DatasetSummary,
+    SummarySource,
+    as_summary,
+)
+from llm_eval.sharding import summarize_shards
+from llm_eval.cache import (
+    DEFAULT_RESULT_CACHE_BYTES,
+    ResultCache,
+    default_result_cache_dir,
+    file_digest,
+    load_summary_cached,
+)
+from llm_eval.binary_format import (
+    convert_to_binary,
+    is_binary_dataset,
+    open_binary_dataset,
+)
 from llm_eval.reporting import generate_report
 from llm_eval.significance import independent_t_test
-from llm_eval.agreement import compute_cohens_kappa
+from llm_eval.agreement import RATINGS_PER_ID, compute_cohens_kappa
 from llm_eval.benchmark import benchmark_against_reference
 from llm_eval.advanced_drift import detect_kl_drift
-from llm_eval.advanced_statistics import bootstrap_significance_test
-from llm_eval.export import export_results
+from llm_eval.drift_monitor import (
+    detect_windowed_drift,
+    format_drift_series,
+    parse_window,
+)
+from llm_eval.advanced_statistics import (
+    bootstrap_significance_test,
+    exact_permutation_test,
+    format_permutation_test,
+)
+from llm_eval.group_comparison import (
+    CORRECTIONS,
+    compare_groups,
+    format_group_comparison,
+)
+from llm_eval.export import ResultWriter, iter_entry_rows
+from llm_eval.pipeline import Pipeline
+from llm_eval.incremental import FileTail, IncrementalEvaluation
+from llm_eval.profiling import StageProfiler, format_timings
+
+
+# Bump an analysis's version whenever its output for unchanged inputs
+# changes, so cached results are not reused.
+_RESULT_VERSIONS = {
+    "report": 1,
+    "agreement": 1,
+    "significance": 1,
+    "bootstrap": 2,
+    "permutation": 1,
+    "comparison": 1,
+    "benchmark": 1,
+    "drift": 1,
+    "drift_series": 1,
+}
+
+# Printed after the report, in this order
+_RESULT_SECTIONS = (
+    ("agreement", "Cohen's Kappa:"),
+    ("significance", "T-Test Result:"),
+    ("bootstrap", "Bootstrap Result:"),
+    ("permutation", "Permutation Test Result:"),
+    ("comparison", "Group Comparison:"),
+    ("benchmark", "Benchmark Result:"),
+    ("drift", "Drift Detection:"),
+    ("drift_series", "Drift Time Series:"),
+)
+
+# Bytes read from stdin per validation step with --data -
+_STDIN_CHUNK_BYTES = 1 << 16
+
+# Sections printed as tables rather than raw results
+_RESULT_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "permutation": format_permutation_test,
+    "comparison": format_group_comparison,
+    "drift_series": format_drift_series,
+}
+
+
+@contextmanager
+def _attributed_to(path: Path) -> Iterator[None]:
+    """
+    Prefix validation errors with the file they occur in, since
+    datasets load concurrently and errors surface from worker stages.
+    """
+
+    try:
+        yield
+    except DatasetValidationError as e:
+        raise DatasetValidationError(f"{path}: {str(e)}")
+
+
+def _load_source(
+    data_paths: List[Path],
+    config: Config,
+    per_entry: bool,
+) -> SummarySource:
+    """
+    Load the main dataset in the most compact form the requested
+    analyses allow; per_entry keeps entry IDs for agreement.
+    """
+
+    if len(data_paths) > 1:
+        # Map-reduce over shards into one mergeable summary
+        return summarize_shards(data_paths, config)
+
+    path = data_paths[0]
+
+    with _attributed_to(path):
+        if is_binary_dataset(path):
+            # Memory-mapped, already-validated columns; the mapping is
+            # closed once the stage has what it needs out of it
+            with open_binary_dataset(path, config) as binary:
+                if per_entry:
+                    return binary.copy_matrix()
+                return CompressedDataset.from_matrix(binary.matrix)
+
+        if per_entry:
+            # Columnar scores built while streaming the main dataset
+            # through validation; kappa needs the per-entry IDs, each
+            # rated once per rater
+            return ScoreMatrix.from_entries(
+                iter_validated_entries(
+                    path,
+                    config,
+                    unique_ids=False,
+                    max_ratings=RATINGS_PER_ID,
+                ),
+                config,
+            )
+
+        # Weighted unique score vectors, so every analysis runs in
+        # time independent of the dataset size
+        return CompressedDataset.from_entries(
+            iter_validated_entries(path, config),
+            config,
+        )
+
+
+def _load_comparison_summary(
+    path: Path,
+    config: Config,
+    cache_dir: Optional[Path],
+    use_cache: bool = True,
+    digest: Optional[str] = None,
+) -> DatasetSummary:
+    """
+    Summary of a reference or baseline dataset. Binary files are
+    mapped directly; JSON files go through the sidecar cache, keyed
+    on digest when the file has already been hashed.
+    """
+
+    with _attributed_to(path):
+        if is_binary_dataset(path):
+            with open_binary_dataset(path, config) as binary:
+                return DatasetSummary.from_matrix(binary.matrix)
+
+        if not use_cache:
+            return CompressedDataset.from_entries(
+                iter_validated_entries(path, config),
+                config,
+            ).summary()
+
+        return load_summary_cached(path, config, cache_dir, digest)
+
+
+def _run_cached(
+    pipeline: Pipeline,
+    analyses: List[str],
+    result_cache: Optional[ResultCache],
+    data_paths: List[Path],
+    config: Config,
+    comparison_paths: Dict[str, Optional[str]],
+    params: Dict[str, Any],
+    profiler: Optional[StageProfiler] = None,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+    comparison_digests: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Results of the named analyses, served from the result cache where
+    possible; the pipeline only runs the stages the misses need.
+    on_result receives each analysis as soon as it is available.
+    comparison_digests holds file digests already computed by path.
+    """
+
+    known = comparison_digests or {}
+
+    outputs: Dict[str, Any] = {}
+    keys: Dict[str, Dict[str, Any]] = {}
+
+    if result_cache is not None:
+        data_digests = [file_digest(path) for path in data_paths]
+
+        for name in analyses:
+            digests = list(data_digests)
+            comparison = comparison_paths.get(name)
+
+            if comparison:
+                digests.append(
+                    known.get(comparison) or file_digest(Path(comparison))
+                )
+
+            keys[name] = result_cache.key(
+                name,
+                _RESULT_VERSIONS[name],
+                digests,
+                config,
+                params.get(name),
+            )
+
+            cached = result_cache.get(keys[name])
+
+            if cached is not None:
+                outputs[name] = cached
+
+                if on_result is not None:
+                    on_result(name, cached)
+
+    missing = [name for name in analyses if name not in outputs]
+
+    def finished(name: str, value: Any) -> None:
+        if name not in missing:
+            return
+
+        outputs[name] = value
+
+        if result_cache is not None:
+            result_cache.put(keys[name], value)
+
+        if on_result is not None:
+            on_result(name, value)
+
+    if missing:
+        pipeline.run(
+            missing,
+            workers=config.workers,
+            profiler=profiler,
+            on_result=finished,
+        )
+
+    return outputs
+
+
+def _iter_entries(
+    data_paths: List[Path],
+    config: Config,
+) -> Iterator[EvaluationEntry]:
+    """
+    Stream the validated entries of every --data file without their
+    text, for per-entry export rows.
+    """
+
+    for path in data_paths:
+        if is_binary_dataset(path):
+            with open_binary_dataset(path, config) as binary:
+                yield from binary.iter_entries(lazy_text=True)
+        else:
+            yield from iter_validated_entries(path, config, lazy_text=True)
+
+
+def _drift_series(
+    baseline: Optional[DatasetSummary],
+    data_paths: List[Path],
+    config: Config,
+    window_seconds: int,
+    trailing: int,
+) -> List[Dict[str, Any]]:
+    """
+    Windowed drift of the main dataset against the --drift baseline
+    (when given) or its own trailing windows.
+    """
+
+    return detect_windowed_drift(
+        _iter_entries(data_paths, config),
+        config,
+        window_seconds,
+        baseline,
+        trailing,
+    )
+
+
+def _print_results(outputs: Dict[str, Any]) -> None:
+    print(outputs["report"])
+
+    for name, title in _RESULT_SECTIONS:
+        if name in outputs:
+            print(f"\n{title}")
+            print(_RESULT_FORMATTERS.get(name, str)(outputs[name]))
+
+
+def _export(outputs: Dict[str, Any], path: Path) -> None:
+    with ResultWriter(path) as writer:
+        for name, value in outputs.items():
+            writer.write_section(name, value)
+
+
+def _watch(
+    path: Path,
+    evaluation_factory: Callable[[], IncrementalEvaluation],
+    config: Config,
+    unique_ids: bool,
+    interval: float,
+    export_path: Optional[Path],
+) -> None:
+    """
+    Follow a growing JSON Lines file: validate only the appended
+    lines, fold them into the running evaluation and reprint (and
+    re-export) the results whenever entries arrived. Invalid rows are
+    reported and skipped; a truncated or replaced file starts over.
+    Runs until interrupted.
+    """
+
+    tail = FileTail(path)
+    validator = IncrementalValidator(
+        config, unique_ids, skip_invalid=True, max_ratings=RATINGS_PER_ID
+    )
+    evaluation = evaluation_factory()
+
+    try:
+        while True:
+            changed = False
+
+            while True:
+                data, reset = tail.read()
+
+                if reset:
+                    validator = IncrementalValidator(
+                        config,
+                        unique_ids,
+                        skip_invalid=True,
+                        max_ratings=RATINGS_PER_ID,
+                    )
+                    evaluation = evaluation_factory()
+                    changed = True
+
+                if not data:
+                    break
+
+                evaluation.extend(validator.feed(data))
+                changed = True
+
+            if changed:
+                outputs = evaluation.results()
+                stamp = datetime.now().isoformat(timespec="seconds")
+
+                print(
+                    f"\n=== {stamp}: {evaluation.count} entries, "
+                    f"{len(validator.errors)} invalid rows skipped ==="
+                )
+
+                for error in validator.errors[-5:]:
+                    print(f"  {error}")
+
+                _print_results(outputs)
+
+                if export_path is not None:
+                    _export(outputs, export_path)
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        pass
+
+
+def _iter_stdin_chunks() -> Iterator[bytes]:
+    """
+    Chunks of standard input as they become available. Each chunk is
+    processed before the next read, so a fast producer is held back
+    by the pipe instead of being buffered here.
+    """
+
+    descriptor = sys.stdin.fileno()
+
+    while True:
+        chunk = os.read(descriptor, _STDIN_CHUNK_BYTES)
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _evaluate_stream(
+    chunks: Iterable[bytes],
+    evaluation: IncrementalEvaluation,
+    config: Config,
+    unique_ids: bool,
+    partial_interval: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Validate and evaluate a JSON Lines stream with memory bounded by
+    the chunk size and the running state, printing partial results
+    every partial_interval seconds. Returns the final results once
+    the stream closes, after the dataset-level checks.
+    """
+
+    validator = IncrementalValidator(
+        config, unique_ids, max_ratings=RATINGS_PER_ID
+    )
+    last_partial = time.monotonic()
+
+    for chunk in chunks:
+        evaluation.extend(validator.feed(chunk))
+
+        if partial_interval is None:
+            continue
+
+        now = time.monotonic()
+
+        if now - last_partial >= partial_interval:
+            last_partial = now
+            print(f"\n=== Partial results: {evaluation.count} entries ===")
+            _print_results(evaluation.results())
+            print("=== End of partial results ===", flush=True)
+
+    evaluation.extend(validator.finish())
+    validator.check_integrity()
+
+    if evaluation.agreement is not None:
+        # Unlike --watch, a closed stream cannot complete a pair
+        evaluation.agreement.check_complete()
+
+    return evaluation.results()
+
+
+def _report_stream_validation(config: Config) -> None:
+    """
+    --validate-only for --data -: report every invalid row of stdin.
+    """
+
+    validator = IncrementalValidator(config, skip_invalid=True)
+
+    for chunk in _iter_stdin_chunks():
+        validator.feed(chunk)
+
+    validator.finish()
+    errors = list(validator.errors)
+
+    try:
+        validator.check_integrity()
+    except DatasetValidationError as e:
+        errors.append(str(e))
+
+    if not errors:
+        print("<stdin>: valid")
+        return
+
+    print(f"<stdin>: {len(errors)} error(s)")
+
+    for error in errors:
+        print(f"  {error}")
+
+    raise SystemExit(1)
+
+
+def _report_validation(paths: List[Path], config: Config) -> None:
+    """
+    Print all validation errors per file; exit non-zero if any.
+    """
+
+    failed = False
+
+    for path in paths:
+        if is_binary_dataset(path):
+            # Validated when written; opening checks the Config
+            open_binary_dataset(path, config).close()
+            errors = []
+        else:
+            errors = validate_dataset_file(path, config)
+
+        if not errors:
+            print(f"{path}: valid")
+            continue
+
+        failed = True
+        print(f"{path}: {len(errors)} error(s)")
+
+        for error in errors:
+            print(f"  {error}")
+
+    if failed:
+        raise SystemExit(1)
 
 
 def main():
@@ -28,7 +519,12 @@ def main():
     parser.add_argument(
         "--data",
         required=True,
-        help="Path to evaluation dataset JSON file",
+        nargs="+",
+        help=(
+            "Path to evaluation dataset (JSON or JSON Lines); "
+            "several paths are evaluated as shards, and - reads "
+            "JSON Lines from standard input"
+        ),
     )
 
     parser.add_argument(
@@ -37,12 +533,47 @@ def main():
         help="Compute inter-rater agreement (Cohen's Kappa)",
     )
 
+    parser.add_argument(
+        "--kappa-weights",
+        choices=["linear", "quadratic"],
+        help="Use weighted Cohen's Kappa for ordinal scores",
+    )
+
     parser.add_argument(
         "--significance",
         action="store_true",
         help="Run independent t-test and bootstrap significance",
     )
 
+    parser.add_argument(
+        "--permutation",
+        action="store_true",
+        help=(
+            "Run the exact permutation test (cost cubic in the smaller "
+            "group; beyond its budget the p-value is a normal "
+            "approximation and is labelled as such)"
+        ),
+    )
+
+    parser.add_argument(
+        "--compare-groups",
+        action="store_true",
+        help=(
+            "Compare all groups at once: one-way ANOVA and pairwise "
+            "t-tests with corrected p-values"
+        ),
+    )
+
+    parser.add_argument(
+        "--correction",
+        choices=CORRECTIONS,
+        default="holm",
+        help=(
+            "Multiple-comparison correction for --compare-groups "
+            "(default holm)"
+        ),
+    )
+
     parser.add_argument(
         "--benchmark",
         help="Path to reference dataset JSON file",
@@ -53,88 +584,431 @@ def main():
         help="Path to baseline dataset JSON file",
     )
 
+    parser.add_argument(
+        "--drift-window",
+        type=parse_window,
+        metavar="WINDOW",
+        help=(
+            "Drift time series over metadata.timestamp windows: hour, "
+            "day, week or a length such as 15m, 6h, 2d"
+        ),
+    )
+
+    parser.add_argument(
+        "--drift-trailing",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Without --drift, compare each window with the previous N "
+            "windows (default 1)"
+        ),
+    )
+
     parser.add_argument(
         "--export",
-        help="Export results to JSON file",
+        help=(
+            "Stream results to this file as compact JSON, or JSON "
+            "Lines if it ends in .jsonl"
+        ),
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--export-entries",
+        action="store_true",
+        help=(
+            "With --export, add a per-entry row (mean score, group, "
+            "failed dimensions) for every entry"
+        ),
+    )
 
-    config = Config()
+    parser.add_argument(
+        "--convert-binary",
+        metavar="OUTPUT",
+        help="Validate --data, write it in binary columnar form and exit",
+    )
 
-    # Load main dataset
-    dataset = load_and_validate_dataset(
-        Path(args.data),
-        config,
+    parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="Report every validation error in --data and exit",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help=(
+            "Directory for cached reference/baseline summaries and "
+            "results (default: summaries alongside each file, "
+            "results under ~/.cache/llm_eval)"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write cached summaries and results",
+    )
+
+    parser.add_argument(
+        "--cache-size-mb",
+        type=int,
+        default=DEFAULT_RESULT_CACHE_BYTES >> 20,
+        help="Size limit of the result cache before LRU eviction",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Print wall time, CPU time and item counts per stage "
+            "(stages run serially, result cache bypassed)"
+        ),
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help=(
+            "With --profile, also trace peak memory per stage "
+            "(tracemalloc slows allocation-heavy stages)"
+        ),
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        help="With --profile, write a cProfile dump per stage here",
     )
 
-    results = {}
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Follow a growing JSON Lines --data file and refresh the "
+            "results as entries are appended (Ctrl-C to stop)"
+        ),
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=30.0,
+        metavar="SECONDS",
+        help="Polling and refresh interval for --watch (default 30)",
+    )
+
+    parser.add_argument(
+        "--partial-interval",
+        type=float,
+        metavar="SECONDS",
+        help="With --data -, print partial results this often",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for parallel analyses",
+    )
+
+    args = parser.parse_args()
+
+    if len(args.data) > 1 and args.agreement:
+        parser.error("--agreement requires a single --data file")
+
+    if args.export_entries and not args.export:
+        parser.error("--export-entries requires --export")
+
+    streaming = args.data == ["-"]
+
+    if "-" in args.data and not streaming:
+        parser.error("--data - cannot be combined with other files")
+
+    if streaming and (
+        args.watch or args.profile or args.export_entries
+        or args.convert_binary
+    ):
+        parser.error(
+            "--data - cannot be combined with --watch, --profile, "
+            "--export-entries or --convert-binary"
+        )
+
+    if args.partial_interval is not None and not streaming:
+        parser.error("--partial-interval requires --data -")
 
-    # Generate core report
-    report = generate_report(dataset, config)
-    print(report)
-    results["report"] = report
+    if args.watch and len(args.data) > 1:
+        parser.error("--watch requires a single --data file")
+
+    if args.watch and (args.profile or args.export_entries):
+        parser.error(
+            "--watch cannot be combined with --profile or --export-entries"
+        )
+
+    if args.profile_dir and not args.profile:
+        parser.error("--profile-dir requires --profile")
+
+    if args.profile_memory and not args.profile:
+        parser.error("--profile-memory requires --profile")
+
+    if len(args.data) > 1 and args.convert_binary:
+        parser.error("--convert-binary requires a single --data file")
+
+    config = Config(workers=args.workers)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+
+    data_paths = [Path(path) for path in args.data]
+
+    if args.validate_only:
+        if streaming:
+            _report_stream_validation(config)
+        else:
+            _report_validation(data_paths, config)
+        return
+
+    if args.convert_binary:
+        count = convert_to_binary(
+            data_paths[0],
+            Path(args.convert_binary),
+            config,
+        )
+        print(f"Wrote {count} entries to {args.convert_binary}")
+        return
+
+    if args.watch or streaming:
+        reference = baseline = None
+
+        if args.benchmark:
+            reference = _load_comparison_summary(
+                Path(args.benchmark), config, cache_dir, not args.no_cache
+            )
+
+        if args.drift:
+            baseline = _load_comparison_summary(
+                Path(args.drift), config, cache_dir, not args.no_cache
+            )
+
+        def evaluation_factory() -> IncrementalEvaluation:
+            return IncrementalEvaluation(
+                config,
+                significance=args.significance,
+                permutation=args.permutation,
+                correction=args.correction if args.compare_groups else None,
+                reference=reference,
+                baseline=baseline,
+                agreement=args.agreement,
+                kappa_weights=args.kappa_weights,
+                drift_window=args.drift_window,
+                drift_trailing=args.drift_trailing,
+            )
+
+        export_path = Path(args.export) if args.export else None
+
+        # Agreement data rates every ID once per rater
+        if args.watch:
+            _watch(
+                data_paths[0],
+                evaluation_factory,
+                config,
+                not args.agreement,
+                args.watch_interval,
+                export_path,
+            )
+            return
+
+        outputs = _evaluate_stream(
+            _iter_stdin_chunks(),
+            evaluation_factory(),
+            config,
+            not args.agreement,
+            args.partial_interval,
+        )
+        _print_results(outputs)
+
+        if export_path is not None:
+            _export(outputs, export_path)
+            print(f"\nResults exported to {args.export}")
+        return
+
+    # Every stage runs once; with --workers > 1 independent stages
+    # run concurrently and comparison datasets load in worker processes
+    pipeline = Pipeline()
+
+    # A single JSON dataset parses in a worker process alongside the
+    # reference and baseline; memory-mapped binary columns stay
+    # in-process and shards already fan out across their own pool
+    pipeline.add(
+        "source",
+        _load_source,
+        data_paths,
+        config,
+        args.agreement,
+        process=len(data_paths) == 1 and not is_binary_dataset(data_paths[0]),
+    )
+    pipeline.add("summary", as_summary, config, requires=["source"])
+    pipeline.add("report", generate_report, config, requires=["summary"])
 
-    # Agreement analysis
     if args.agreement:
-        agreement = compute_cohens_kappa(dataset, config)
-        print("\nCohen's Kappa:")
-        print(agreement)
-        results["agreement"] = agreement
+        pipeline.add(
+            "agreement",
+            compute_cohens_kappa,
+            config,
+            args.kappa_weights,
+            requires=["source"],
+        )
 
-    # Significance testing
     if args.significance:
-        t_test_result = independent_t_test(dataset, config)
-        bootstrap_result = bootstrap_significance_test(dataset, config)
+        pipeline.add(
+            "significance",
+            independent_t_test,
+            config,
+            requires=["summary"],
+        )
+        pipeline.add(
+            "bootstrap",
+            bootstrap_significance_test,
+            config,
+            requires=["summary"],
+        )
 
-        print("\nT-Test Result:")
-        print(t_test_result)
+    if args.permutation:
+        pipeline.add(
+            "permutation",
+            exact_permutation_test,
+            config,
+            requires=["summary"],
+        )
 
-        print("\nBootstrap Result:")
-        print(bootstrap_result)
+    if args.compare_groups:
+        pipeline.add(
+            "comparison",
+            compare_groups,
+            config,
+            args.correction,
+            requires=["summary"],
+        )
 
-        results["significance"] = t_test_result
-        results["bootstrap"] = bootstrap_result
+    # Hashed once: each digest keys both the result cache and the
+    # comparison file's summary sidecar
+    comparison_digests = {
+        path: file_digest(Path(path))
+        for path in (args.benchmark, args.drift)
+        if path and not args.no_cache
+    }
 
-    # Benchmark comparison
     if args.benchmark:
-        reference_dataset = load_and_validate_dataset(
+        pipeline.add(
+            "reference",
+            _load_comparison_summary,
             Path(args.benchmark),
             config,
+            cache_dir,
+            not args.no_cache,
+            comparison_digests.get(args.benchmark),
+            process=True,
         )
-
-        benchmark_result = benchmark_against_reference(
-            dataset,
-            reference_dataset,
+        pipeline.add(
+            "benchmark",
+            benchmark_against_reference,
             config,
+            requires=["summary", "reference"],
         )
 
-        print("\nBenchmark Result:")
-        print(benchmark_result)
-
-        results["benchmark"] = benchmark_result
-
-    # Drift detection
     if args.drift:
-        baseline_dataset = load_and_validate_dataset(
+        pipeline.add(
+            "baseline",
+            _load_comparison_summary,
             Path(args.drift),
             config,
+            cache_dir,
+            not args.no_cache,
+            comparison_digests.get(args.drift),
+            process=True,
+        )
+        pipeline.add(
+            "drift",
+            detect_kl_drift,
+            config,
+            requires=["summary", "baseline"],
         )
 
-        drift_result = detect_kl_drift(
-            dataset,
-            baseline_dataset,
+    if args.drift_window:
+        # Streams the entries again, since summaries drop timestamps
+        pipeline.add(
+            "drift_series",
+            _drift_series,
+            *([] if args.drift else [None]),
+            data_paths,
             config,
+            args.drift_window,
+            args.drift_trailing,
+            requires=["baseline"] if args.drift else [],
+            process=True,
         )
 
-        print("\nDrift Detection:")
-        print(drift_result)
+    analyses = ["report"] + [
+        name for name, _ in _RESULT_SECTIONS if name in pipeline.stages
+    ]
+
+    result_cache = None
+    profiler = None
+
+    if args.profile:
+        # Cached analyses would not run, so nothing would be measured
+        profiler = StageProfiler(
+            Path(args.profile_dir) if args.profile_dir else None,
+            trace_memory=args.profile_memory,
+        )
+    elif not args.no_cache:
+        result_cache = ResultCache(
+            cache_dir / "results" if cache_dir else default_result_cache_dir(),
+            args.cache_size_mb << 20,
+        )
+
+    with ExitStack() as stack:
+        # Sections are written as each analysis finishes; the file is
+        # renamed into place only once the export is complete
+        writer = (
+            stack.enter_context(ResultWriter(Path(args.export)))
+            if args.export
+            else None
+        )
+
+        outputs = _run_cached(
+            pipeline,
+            analyses,
+            result_cache,
+            data_paths,
+            config,
+            comparison_paths={
+                "benchmark": args.benchmark,
+                "drift": args.drift,
+                "drift_series": args.drift,
+            },
+            params={
+                "agreement": args.kappa_weights,
+                "comparison": args.correction,
+                "drift_series": [args.drift_window, args.drift_trailing],
+            },
+            profiler=profiler,
+            on_result=writer.write_section if writer else None,
+            comparison_digests=comparison_digests,
+        )
+
+        _print_results(outputs)
+
+        if profiler is not None:
+            print("\nStage Timings:")
+            print(format_timings(profiler.timings))
+
+            if writer is not None:
+                writer.write_section("timings", profiler.as_dicts())
 
-        results["drift"] = drift_result
+        if writer is not None and args.export_entries:
+            writer.write_rows(
+                "entries",
+                iter_entry_rows(_iter_entries(data_paths, config), config),
+            )
 
-    # Export results
     if args.export:
-        export_results(results, Path(args.export))
         print(f"\nResults exported to {args.export}")
 
 
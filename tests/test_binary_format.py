@@ -0,0 +1,103 @@
+import pytest
+from pathlib import Path
+import json
+import tempfile
+
+from llm_eval.config import Config
+from llm_eval.validation import load_and_validate_dataset
+from llm_eval.binary_format import convert_to_binary, open_binary_dataset
+from llm_eval.reporting import generate_report
+from llm_eval.sharding import summarize_shards
+from llm_eval.synthetic import generate_entries
+from llm_eval.exceptions import DatasetValidationError
+
+
+DIMENSIONS = (
+    "instruction_adherence",
+    "factual_accuracy",
+    "logical_coherence",
+    "safety",
+    "tone_alignment",
+)
+
+
+def create_entries():
+    timestamps = [
+        "2026-02-24T10:15:30Z",
+        "2026-02-24T12:15:30.250000+05:30",
+        "2026-02-25T08:00:00",
+    ]
+
+    return [
+        {
+            "id": entry_id,
+            "prompt": f"Prompt {entry_id} ✓",
+            "response": "" if entry_id == 2 else f"Response {entry_id}",
+            "scores": {dim: entry_id % 3 for dim in DIMENSIONS},
+            "metadata": {
+                "model": "gpt-4" if entry_id < 4 else "llama",
+                "timestamp": timestamps[entry_id % 3],
+                "group": "A" if entry_id % 2 else "B",
+            },
+        }
+        for entry_id in range(1, 7)
+    ]
+
+
+def test_binary_round_trip():
+    config = Config()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "data.json"
+        target = Path(directory) / "data.lleb"
+        source.write_text(json.dumps(create_entries()))
+
+        assert convert_to_binary(source, target, config) == 6
+
+        dataset = load_and_validate_dataset(source, config)
+
+        with open_binary_dataset(target, config) as binary:
+            assert list(binary) == dataset
+            assert list(binary.iter_entries(lazy_text=True)) == dataset
+            assert generate_report(binary.matrix, config) == (
+                generate_report(dataset, config)
+            )
+
+
+def test_binary_rejects_different_config():
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "data.json"
+        target = Path(directory) / "data.lleb"
+        source.write_text(json.dumps(create_entries()))
+
+        convert_to_binary(source, target, Config())
+
+        with pytest.raises(DatasetValidationError):
+            open_binary_dataset(target, Config(score_max=4))
+
+
+def test_binary_shards_and_copied_matrix():
+    config = Config()
+    items = list(generate_entries(60, config))
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_shards, binary_shards = [], []
+
+        for index in range(3):
+            source = Path(directory) / f"shard_{index}.json"
+            target = Path(directory) / f"shard_{index}.lleb"
+            source.write_text(json.dumps(items[index::3]))
+            convert_to_binary(source, target, config)
+            json_shards.append(source)
+            binary_shards.append(target)
+
+        assert summarize_shards(binary_shards, config) == (
+            summarize_shards(json_shards, config)
+        )
+
+        with open_binary_dataset(binary_shards[0], config) as binary:
+            matrix = binary.copy_matrix()
+            expected = generate_report(binary.matrix, config)
+
+    # The copy owns its columns, so it outlives the closed mapping
+    assert generate_report(matrix, config) == expected
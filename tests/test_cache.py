@@ -0,0 +1,137 @@
+from pathlib import Path
+import json
+import os
+import tempfile
+
+from llm_eval.config import Config
+from llm_eval import cache
+from llm_eval.cache import ResultCache, file_digest, load_summary_cached
+from llm_eval.summary import DatasetSummary
+from llm_eval.validation import load_and_validate_dataset
+from llm_eval.score_matrix import ScoreMatrix
+
+
+DIMENSIONS = (
+    "instruction_adherence",
+    "factual_accuracy",
+    "logical_coherence",
+    "safety",
+    "tone_alignment",
+)
+
+
+def create_entries():
+    return [
+        {
+            "id": entry_id,
+            "prompt": "Test",
+            "response": "Test",
+            "scores": {dim: entry_id % 3 for dim in DIMENSIONS},
+            "metadata": {
+                "model": "gpt-4",
+                "timestamp": "2026-02-24T10:15:30Z",
+                "group": "A" if entry_id % 2 else "B",
+            },
+        }
+        for entry_id in range(1, 7)
+    ]
+
+
+def test_summary_cache_hit_and_invalidation():
+    config = Config()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "baseline.json"
+        path.write_text(json.dumps(create_entries()))
+
+        first = load_summary_cached(path, config)
+        sidecar = Path(directory) / "baseline.json.summary.json"
+
+        assert sidecar.exists()
+        assert load_summary_cached(path, config) == first
+        assert first == DatasetSummary.from_matrix(
+            ScoreMatrix.from_entries(
+                load_and_validate_dataset(path, config),
+                config,
+            )
+        )
+
+        # Changed contents must not be served from the stale sidecar.
+        entries = create_entries()
+        entries[0]["scores"] = {dim: 0 for dim in DIMENSIONS}
+        path.write_text(json.dumps(entries))
+
+        assert load_summary_cached(path, config) != first
+
+
+def test_summary_cache_dir_separates_same_named_files(monkeypatch):
+    config = Config()
+    entries = create_entries()
+    entries[0]["scores"] = {dim: 0 for dim in DIMENSIONS}
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_dir = Path(directory) / "cache"
+        cache_dir.mkdir()
+        paths = []
+
+        for name, items in (("a", create_entries()), ("b", entries)):
+            (Path(directory) / name).mkdir()
+            paths.append(Path(directory) / name / "baseline.json")
+            paths[-1].write_text(json.dumps(items))
+
+        digests = [file_digest(path) for path in paths]
+        first = [
+            load_summary_cached(path, config, cache_dir, digest)
+            for path, digest in zip(paths, digests)
+        ]
+
+        assert len(os.listdir(cache_dir)) == 2
+
+        # Hits reuse the given digest instead of hashing the file again
+        def no_hashing(path):
+            raise AssertionError(f"{path} hashed again")
+
+        monkeypatch.setattr(cache, "file_digest", no_hashing)
+
+        assert [
+            load_summary_cached(path, config, cache_dir, digest)
+            for path, digest in zip(paths, digests)
+        ] == first
+        assert first[0] != first[1]
+
+
+def test_result_cache_hit_key_and_eviction():
+    config = Config()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(Path(directory), max_bytes=1 << 20)
+        key = ResultCache.key("bootstrap", 1, ["abc"], config)
+
+        assert cache.get(key) is None
+
+        cache.put(key, {"empirical_p_value": 0.5, "significant": False})
+
+        assert cache.get(key) == {
+            "empirical_p_value": 0.5,
+            "significant": False,
+        }
+        assert cache.get(
+            ResultCache.key("bootstrap", 2, ["abc"], config)
+        ) is None
+        assert cache.get(
+            ResultCache.key("bootstrap", 1, ["abc"], Config(random_seed=1))
+        ) is None
+        assert cache.get(
+            ResultCache.key("bootstrap", 1, ["abc"], Config(workers=4))
+        ) is not None
+
+        old = ResultCache.key("report", 1, ["old"], config)
+        new = ResultCache.key("report", 1, ["new"], config)
+        cache.put(old, "x" * 400)
+        os.utime(cache._path(old), (0, 0))
+
+        cache.max_bytes = 1000
+        cache.put(new, "y" * 400)
+
+        assert cache.get(old) is None
+        assert cache.get(new) == "y" * 400
@@ -0,0 +1,275 @@
+from pathlib import Path
+import json
+import sys
+import tempfile
+
+import pytest
+
+import run
+from llm_eval import cache
+from llm_eval.config import Config
+from llm_eval.exceptions import (
+    DatasetValidationError,
+    StatisticalComputationError,
+)
+from llm_eval.incremental import IncrementalEvaluation
+from llm_eval.synthetic import generate_entries, generate_rating_pairs
+
+
+def json_lines(items):
+    return b"".join(
+        json.dumps(item).encode("utf-8") + b"\n" for item in items
+    )
+
+
+def test_watch_skips_malformed_rows_and_extra_ratings(monkeypatch, capsys):
+    config = Config()
+    pairs = list(generate_rating_pairs(20, config))
+
+    bad_timestamp = dict(
+        pairs[0], id=100, metadata=dict(pairs[0]["metadata"], timestamp=1)
+    )
+    bad_metadata = dict(pairs[0], id=101, metadata="rater_a")
+    list_id = dict(pairs[0], id=[102])
+    list_group = dict(
+        pairs[0], id=103, metadata=dict(pairs[0]["metadata"], group=["A"])
+    )
+    third_rating = pairs[0]
+
+    evaluations = []
+
+    def factory():
+        evaluations.append(
+            IncrementalEvaluation(config, agreement=True)
+        )
+        return evaluations[-1]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "log.jsonl"
+        path.write_bytes(json_lines(pairs[:-2]))
+
+        appended = json_lines(
+            [bad_timestamp, bad_metadata, list_id, list_group, third_rating]
+            + pairs[-2:]
+        )
+        sleeps = []
+
+        # First pause appends to the log, the second stops the watch
+        def sleep(_):
+            sleeps.append(None)
+
+            if len(sleeps) > 1:
+                raise KeyboardInterrupt
+
+            with path.open("ab") as f:
+                f.write(appended)
+
+        monkeypatch.setattr(run.time, "sleep", sleep)
+        run._watch(path, factory, config, False, 0, None)
+
+    output = capsys.readouterr().out
+    evaluation = evaluations[-1]
+
+    assert "40 entries, 5 invalid rows skipped" in output
+    assert "Invalid ISO 8601 timestamp: 1" in output
+    assert "Metadata must be a dictionary." in output
+    assert "Entry id must be an integer: [102]" in output
+    assert "Metadata 'group' must be a string." in output
+    assert "ID 1 has more than 2 ratings." in output
+    assert evaluation.count == 40
+    assert evaluation.agreement is not None
+    assert evaluation.agreement.pairs == 20
+
+
+def chunked(data, size):
+    return (data[start:start + size] for start in range(0, len(data), size))
+
+
+def test_stdin_stream_matches_file_run(monkeypatch, capsys):
+    config = Config()
+    data = json_lines(generate_entries(60, config))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.jsonl"
+        path.write_bytes(data)
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["run.py", "--data", str(path), "--significance", "--no-cache"],
+        )
+        run.main()
+
+    from_file = capsys.readouterr().out
+
+    # 37-byte chunks split most lines across chunk boundaries
+    outputs = run._evaluate_stream(
+        chunked(data, 37),
+        IncrementalEvaluation(config, significance=True),
+        config,
+        True,
+        None,
+    )
+    run._print_results(outputs)
+
+    assert capsys.readouterr().out == from_file
+
+
+def test_stdin_stream_rejects_duplicates_and_arrays():
+    config = Config()
+    items = list(generate_entries(20, config))
+
+    with pytest.raises(
+        DatasetValidationError, match="^Row 3: Duplicate ID detected: 1"
+    ):
+        run._evaluate_stream(
+            [json_lines(items[:2] + items[:1])],
+            IncrementalEvaluation(config),
+            config,
+            True,
+            None,
+        )
+
+    with pytest.raises(DatasetValidationError, match="got a JSON array"):
+        run._evaluate_stream(
+            chunked(json.dumps(items, indent=2).encode("utf-8"), 64),
+            IncrementalEvaluation(config),
+            config,
+            True,
+            None,
+        )
+
+
+def run_cli(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["run.py", *args, "--no-cache"])
+    run.main()
+    return capsys.readouterr().out
+
+
+def write_shards(directory, items, count, name="shard"):
+    paths = []
+
+    for index in range(count):
+        path = Path(directory) / f"{name}_{index}.jsonl"
+        path.write_bytes(json_lines(items[index::count]))
+        paths.append(str(path))
+
+    return paths
+
+
+def test_validation_error_names_the_failing_data_file(monkeypatch, capsys):
+    items = list(generate_entries(40, Config()))
+    items[21] = dict(items[21], scores={})
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_shards(directory, items, 2)
+
+        with pytest.raises(
+            DatasetValidationError,
+            match=f"^{paths[1]}: Row 11: Score dimensions mismatch",
+        ):
+            run_cli(monkeypatch, capsys, "--data", *paths)
+
+
+def test_multi_source_run_is_independent_of_workers(monkeypatch, capsys):
+    items = list(generate_entries(90, Config()))
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_shards(directory, items[:60], 3)
+        single = write_shards(directory, items[:60], 1, "single")
+        reference, baseline, _ = write_shards(
+            directory, items[60:], 3, "ref"
+        )
+
+        outputs = [
+            run_cli(
+                monkeypatch,
+                capsys,
+                "--data",
+                *data,
+                "--significance",
+                "--benchmark",
+                reference,
+                "--drift",
+                baseline,
+                "--workers",
+                workers,
+            )
+            for data in (paths, single)
+            for workers in ("1", "3")
+        ]
+
+    assert outputs[0] == outputs[1]
+    assert outputs[2] == outputs[3]
+    assert "Benchmark Result:" in outputs[0]
+
+
+def test_agreement_stream_and_file_runs_agree(monkeypatch, capsys):
+    config = Config()
+    data = json_lines(generate_rating_pairs(30, config))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "ratings.jsonl"
+        path.write_bytes(data)
+        from_file = run_cli(
+            monkeypatch, capsys, "--data", str(path), "--agreement"
+        )
+
+    outputs = run._evaluate_stream(
+        chunked(data, 37),
+        IncrementalEvaluation(config, agreement=True),
+        config,
+        False,
+        None,
+    )
+    run._print_results(outputs)
+
+    assert capsys.readouterr().out == from_file
+    assert "Cohen's Kappa:" in from_file
+
+    # The last ID only has its first rating when the stream closes
+    with pytest.raises(
+        StatisticalComputationError, match="must have exactly 2 ratings"
+    ):
+        run._evaluate_stream(
+            [data[:data.rindex(b"\n", 0, -1) + 1]],
+            IncrementalEvaluation(config, agreement=True),
+            config,
+            False,
+            None,
+        )
+
+
+def test_cached_comparison_file_is_hashed_once(monkeypatch, capsys):
+    items = list(generate_entries(60, Config()))
+    hashed = []
+    digest = cache.file_digest
+
+    def file_digest(path):
+        hashed.append(Path(path).name)
+        return digest(path)
+
+    monkeypatch.setattr(run, "file_digest", file_digest)
+    monkeypatch.setattr(cache, "file_digest", file_digest)
+
+    with tempfile.TemporaryDirectory() as directory:
+        (data,) = write_shards(directory, items[:30], 1)
+        (baseline,) = write_shards(directory, items[30:], 1, "baseline")
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "run.py",
+                "--data",
+                data,
+                "--drift",
+                baseline,
+                "--cache-dir",
+                str(Path(directory) / "cache"),
+            ],
+        )
+        run.main()
+
+    assert "Drift Detection:" in capsys.readouterr().out
+    assert hashed.count("baseline_0.jsonl") == 1
@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from llm_eval.config import Config
+from llm_eval.models import EvaluationEntry, Metadata
+from llm_eval.advanced_drift import detect_kl_drift
+from llm_eval.drift_monitor import detect_windowed_drift, parse_window
+
+
+def create_entries(config):
+    # Hour 0 scores mostly 2, hour 1 mostly 0, hour 2 mixed
+    hours = [[2, 2, 2, 1], [0, 0, 1, 0], [0, 1, 2, 1]]
+
+    return [
+        EvaluationEntry(
+            id=hour * 10 + index,
+            prompt="P",
+            response="R",
+            scores={dim: score for dim in config.required_dimensions},
+            metadata=Metadata(
+                model="gpt-4",
+                timestamp=f"2026-02-24T{hour:02d}:{index * 10:02d}:00Z",
+                group="A" if index % 2 else "B",
+            ),
+        )
+        for hour, scores in enumerate(hours)
+        for index, score in enumerate(scores)
+    ]
+
+
+def test_windowed_drift_against_trailing_window():
+    config = Config(min_dataset_size=1)
+    entries = create_entries(config)
+
+    series = detect_windowed_drift(entries[::-1], config, 3600)
+
+    assert [point["window_start"] for point in series] == [
+        "2026-02-24T00:00:00Z",
+        "2026-02-24T01:00:00Z",
+        "2026-02-24T02:00:00Z",
+    ]
+    assert [point["count"] for point in series] == [4, 4, 4]
+    assert series[0]["overall_kl"] is None
+    assert series[1]["drift_detected"]
+
+    # Each step matches a whole-dataset comparison of the two windows
+    expected = detect_kl_drift(entries[8:], entries[4:8], config)
+    assert math.isclose(series[2]["overall_kl"], expected["overall_kl"])
+    assert 0 < series[2]["overall_js"] < math.log(2)
+
+
+def test_windowed_drift_against_baseline():
+    config = Config(min_dataset_size=1)
+    entries = create_entries(config)
+
+    series = detect_windowed_drift(
+        entries, config, parse_window("day"), baseline=entries[:4]
+    )
+
+    assert len(series) == 1
+    assert series[0]["count"] == 12
+    assert math.isclose(
+        series[0]["overall_kl"],
+        detect_kl_drift(entries, entries[:4], config)["overall_kl"],
+    )
+
+
+def test_parse_window():
+    assert parse_window("hour") == 3600
+    assert parse_window("15m") == 900
+    assert parse_window("2d") == 172800
+    assert parse_window("90") == 90
+
+    with pytest.raises(ValueError):
+        parse_window("0h")
@@ -0,0 +1,128 @@
+from pathlib import Path
+import json
+import os
+import tempfile
+
+import pytest
+
+from llm_eval.config import Config
+from llm_eval.export import ResultWriter, export_results, iter_entry_rows
+from llm_eval.group_comparison import compare_groups
+from llm_eval.models import EvaluationEntry, Metadata
+from llm_eval.summary import DatasetSummary
+
+
+def create_entries(config):
+    return [
+        EvaluationEntry(
+            id=entry_id,
+            prompt="Test",
+            response="Test",
+            scores={
+                dim: entry_id % 3 for dim in config.required_dimensions
+            },
+            metadata=Metadata(
+                model="gpt-4",
+                timestamp="2026-02-24T10:15:30Z",
+                group="A" if entry_id % 2 else "B",
+            ),
+        )
+        for entry_id in range(1, 4)
+    ]
+
+
+def test_streaming_export_formats():
+    config = Config()
+    entries = create_entries(config)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "results.json"
+        lines_path = Path(directory) / "results.jsonl"
+
+        for path in (json_path, lines_path):
+            with ResultWriter(path) as writer:
+                writer.write_section("report", "text")
+                writer.write_section("drift", {"overall_kl": 0.5})
+                rows = iter_entry_rows(iter(entries), config)
+                assert writer.write_rows("entries", rows) == 3
+
+        exported = json.loads(json_path.read_text(encoding="utf-8"))
+        lines = [
+            json.loads(line)
+            for line in lines_path.read_text(encoding="utf-8").splitlines()
+        ]
+
+        assert len(os.listdir(directory)) == 2
+
+    assert exported["report"] == "text"
+    assert exported["drift"] == {"overall_kl": 0.5}
+    assert exported["entries"][2] == {
+        "id": 3,
+        "model": "gpt-4",
+        "group": "A",
+        "mean": 0.0,
+        "failures": list(config.required_dimensions),
+    }
+    assert lines[1] == {"section": "drift", "result": {"overall_kl": 0.5}}
+    assert lines[2]["section"] == "entries"
+    assert lines[2]["mean"] == 1.0
+
+
+def test_failed_export_leaves_previous_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "results.json"
+        export_results({"report": "old"}, path)
+
+        with pytest.raises(RuntimeError):
+            with ResultWriter(path) as writer:
+                writer.write_section("report", "new")
+                raise RuntimeError("analysis failed")
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "report": "old"
+        }
+        assert os.listdir(directory) == ["results.json"]
+
+
+def test_export_has_regular_file_permissions():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "results.json"
+        direct = Path(directory) / "direct.json"
+
+        export_results({"report": "text"}, path)
+        direct.write_text("{}")
+
+        # Same mode as a file written directly, not mkstemp's 0600
+        assert path.stat().st_mode & 0o777 == direct.stat().st_mode & 0o777
+
+
+def reject_constant(name):
+    raise ValueError(f"non-standard JSON constant: {name}")
+
+
+def test_infinite_statistics_export_as_null():
+    # Constant groups with different means: infinite t and F
+    summary = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 3, 2: 3}},
+        group_histograms={"A": {0: 3}, "B": {2: 3}},
+    )
+    config = Config(required_dimensions=("safety",))
+    comparison = compare_groups(summary, config)
+
+    assert comparison["anova"]["f_statistic"] == float("inf")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("results.json", "results.jsonl"):
+            path = Path(directory) / name
+            export_results({"comparison": comparison}, path)
+            text = path.read_text(encoding="utf-8")
+
+            exported = json.loads(
+                text.splitlines()[0], parse_constant=reject_constant
+            )
+            result = exported.get("comparison") or exported["result"]
+
+            assert result["anova"]["f_statistic"] is None
+            assert result["pairwise"][0]["t_statistic"] is None
+            assert result["anova"]["p_value"] == 0.0
@@ -0,0 +1,88 @@
+from pathlib import Path
+import json
+import os
+import tempfile
+
+import pytest
+
+from llm_eval.config import Config
+from llm_eval.exceptions import DatasetValidationError
+from llm_eval.incremental import FileTail, IncrementalEvaluation
+from llm_eval.advanced_statistics import exact_permutation_test
+from llm_eval.group_comparison import compare_groups
+from llm_eval.reporting import generate_report
+from llm_eval.significance import independent_t_test
+from llm_eval.synthetic import generate_entries
+from llm_eval.validation import IncrementalValidator, load_and_validate_dataset
+
+
+def dataset_bytes(count):
+    return b"".join(
+        json.dumps(item).encode("utf-8") + b"\n"
+        for item in generate_entries(count, Config())
+    )
+
+
+def test_incremental_validator_handles_split_lines():
+    data = dataset_bytes(20)
+    validator = IncrementalValidator(Config())
+    entries = []
+
+    for start in range(0, len(data), 37):
+        entries += validator.feed(data[start:start + 37])
+
+    entries += validator.finish()
+    validator.check_integrity()
+
+    assert [entry.id for entry in entries] == list(range(1, 21))
+
+    with pytest.raises(DatasetValidationError, match="Row 21"):
+        validator.feed(data.splitlines(keepends=True)[0])
+
+    lenient = IncrementalValidator(Config(), skip_invalid=True)
+    assert len(lenient.feed(b"{bad\n" + data)) == 20
+    assert lenient.errors[0].startswith("Invalid JSON on line 1")
+
+
+def test_incremental_evaluation_matches_batch_results():
+    config = Config(significance_alpha=0.05)
+    data = dataset_bytes(60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "log.jsonl"
+        path.write_bytes(data[:100])
+
+        tail = FileTail(path)
+        validator = IncrementalValidator(config)
+        evaluation = IncrementalEvaluation(
+            config, significance=True, permutation=True, correction="holm"
+        )
+
+        evaluation.extend(validator.feed(tail.read()[0]))
+        early = evaluation.results()
+
+        with path.open("ab") as f:
+            f.write(data[100:])
+
+        evaluation.extend(validator.feed(tail.read()[0]))
+        assert tail.read() == (b"", False)
+
+        dataset = load_and_validate_dataset(path, config)
+
+        path.write_bytes(data[:10])
+        assert tail.read() == (data[:10], True)
+
+        # A rotated log larger than what was read is still a new file
+        rotated = Path(directory) / "rotated.jsonl"
+        rotated.write_bytes(data[:200])
+        os.replace(rotated, path)
+        assert tail.read() == (data[:200], True)
+
+    results = evaluation.results()
+
+    assert early["report"].startswith("Unavailable")
+    assert evaluation.count == 60
+    assert results["report"] == generate_report(dataset, config)
+    assert results["significance"] == independent_t_test(dataset, config)
+    assert results["comparison"] == compare_groups(dataset, config)
+    assert results["permutation"] == exact_permutation_test(dataset, config)
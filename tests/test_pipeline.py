@@ -0,0 +1,103 @@
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from llm_eval.pipeline import Pipeline
+from llm_eval.profiling import StageProfiler, format_timings
+
+
+def build_pipeline(calls):
+    def load(value):
+        calls.append("load")
+        return value
+
+    def double(x):
+        calls.append("double")
+        return 2 * x
+
+    pipeline = Pipeline()
+    pipeline.add("source", load, 3)
+    pipeline.add("double", double, requires=["source"])
+    pipeline.add("add", lambda x, y: x + y, requires=["source", "double"])
+    pipeline.add("scale", lambda x, k: x * k, 10, requires=["double"])
+    return pipeline
+
+
+def test_shared_stages_run_once():
+    calls = []
+    results = build_pipeline(calls).run()
+
+    assert results == {"source": 3, "double": 6, "add": 9, "scale": 60}
+    assert calls == ["load", "double"]
+
+
+def test_parallel_run_matches_serial():
+    assert build_pipeline([]).run(workers=4) == build_pipeline([]).run()
+
+
+def test_targets_limit_stages():
+    pipeline = build_pipeline([])
+
+    assert pipeline.order(["add"]) == ["source", "double", "add"]
+    assert set(pipeline.run(["scale"], workers=2)) == {
+        "source", "double", "scale"
+    }
+
+
+def test_stage_error_propagates():
+    def fail(x):
+        raise RuntimeError("boom")
+
+    pipeline = build_pipeline([])
+    pipeline.add("fail", fail, requires=["source"])
+
+    for workers in (1, 3):
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run(workers=workers)
+
+
+def test_cycle_is_rejected():
+    pipeline = Pipeline()
+    pipeline.add("a", lambda b: b, requires=["b"])
+    pipeline.add("b", lambda a: a, requires=["a"])
+
+    with pytest.raises(ValueError):
+        pipeline.order()
+
+
+def test_process_stages_receive_inputs():
+    pipeline = Pipeline()
+    pipeline.add("values", lambda: [3, -1, 2])
+    pipeline.add("sorted", sorted, requires=["values"], process=True)
+    pipeline.add("total", sum, requires=["values"], process=True)
+
+    results = pipeline.run(workers=2)
+
+    assert results["sorted"] == [-1, 2, 3]
+    assert results["total"] == 4
+
+
+def test_profiled_run_records_each_stage():
+    with tempfile.TemporaryDirectory() as directory:
+        profiler = StageProfiler(Path(directory))
+        results = build_pipeline([]).run(
+            ["add"], workers=4, profiler=profiler
+        )
+
+        assert (Path(directory) / "double.prof").exists()
+
+    stages = [timing.stage for timing in profiler.timings]
+
+    assert results["add"] == 9
+    assert stages == ["source", "double", "add"]
+    assert all(t.wall_seconds >= 0 for t in profiler.timings)
+    assert all(t.peak_bytes is None for t in profiler.timings)
+    assert "tracemalloc" not in format_timings(profiler.timings)
+
+    traced = StageProfiler(trace_memory=True)
+    build_pipeline([]).run(["add"], profiler=traced)
+
+    assert all(t.peak_bytes is not None for t in traced.timings)
+    assert "Peak (MiB)" in format_timings(traced.timings)
+    assert "under tracemalloc" in format_timings(traced.timings)
@@ -0,0 +1,94 @@
+from llm_eval.config import Config
+from llm_eval.models import EvaluationEntry, Metadata
+from llm_eval.score_matrix import ScoreMatrix
+from llm_eval.summary import CompressedDataset
+from llm_eval.significance import independent_t_test
+from llm_eval.reporting import generate_report
+from llm_eval.benchmark import benchmark_against_reference
+from llm_eval.failure_analysis import analyze_failures
+from llm_eval.dimensional_analysis import dimensional_breakdown
+
+
+DIMENSIONS = (
+    "instruction_adherence",
+    "factual_accuracy",
+    "logical_coherence",
+    "safety",
+    "tone_alignment",
+)
+
+
+def create_dataset():
+    rows = [
+        (1, "A", "gpt-4", (2, 2, 1, 2, 2)),
+        (2, "A", "gpt-4", (1, 0, 1, 2, 1)),
+        (3, "B", "llama", (0, 0, 1, 1, 0)),
+        (4, "B", "llama", (2, 1, 0, 1, 2)),
+    ]
+
+    return [
+        EvaluationEntry(
+            id=entry_id,
+            prompt="P",
+            response="R",
+            scores=dict(zip(DIMENSIONS, scores)),
+            metadata=Metadata(
+                model=model,
+                timestamp="2026-02-24T10:15:30Z",
+                group=group,
+            ),
+        )
+        for entry_id, group, model, scores in rows
+    ]
+
+
+def test_matrix_columns_and_codes():
+    config = Config(min_dataset_size=4)
+    matrix = ScoreMatrix.from_entries(create_dataset(), config)
+
+    assert len(matrix) == 4
+    assert list(matrix.column("factual_accuracy")) == [2, 0, 0, 1]
+    assert matrix.group_labels == ("A", "B")
+    assert list(matrix.group_codes) == [0, 0, 1, 1]
+    assert matrix.group_totals() == {"A": [9, 5], "B": [2, 6]}
+
+
+def test_analyses_accept_matrix():
+    config = Config(min_dataset_size=4)
+    dataset = create_dataset()
+    matrix = ScoreMatrix.from_entries(dataset, config)
+
+    assert generate_report(matrix, config) == generate_report(
+        dataset, config
+    )
+    assert analyze_failures(matrix, config) == analyze_failures(
+        dataset, config
+    )
+    assert dimensional_breakdown(matrix, config) == dimensional_breakdown(
+        dataset, config
+    )
+    assert benchmark_against_reference(
+        matrix, dataset, config
+    )["overall_delta"] == 0
+
+
+def test_compressed_dataset_collapses_repeated_vectors():
+    config = Config(min_dataset_size=4)
+    dataset = create_dataset() * 50
+    matrix = ScoreMatrix.from_entries(dataset, config)
+
+    compressed = CompressedDataset.from_entries(dataset, config)
+
+    assert len(compressed.rows) == 4
+    assert compressed.count == 200
+    assert compressed == CompressedDataset.from_matrix(matrix)
+    assert compressed.summary().group_histograms == {
+        "A": {9: 50, 5: 50},
+        "B": {2: 50, 6: 50},
+    }
+    assert generate_report(compressed, config) == generate_report(
+        dataset, config
+    )
+    assert independent_t_test(compressed, config) == independent_t_test(
+        dataset, config
+    )
@@ -0,0 +1,89 @@
+import pytest
+from pathlib import Path
+import json
+import tempfile
+
+from llm_eval.config import Config
+from llm_eval.validation import load_and_validate_dataset
+from llm_eval.sharding import summarize_shards
+from llm_eval.reporting import generate_report
+from llm_eval.failure_analysis import analyze_failures
+from llm_eval.exceptions import DatasetValidationError
+
+
+DIMENSIONS = (
+    "instruction_adherence",
+    "factual_accuracy",
+    "logical_coherence",
+    "safety",
+    "tone_alignment",
+)
+
+
+def create_entries():
+    return [
+        {
+            "id": entry_id,
+            "prompt": "Test",
+            "response": "Test",
+            "scores": {
+                dim: (entry_id + offset) % 3
+                for offset, dim in enumerate(DIMENSIONS)
+            },
+            "metadata": {
+                "model": "gpt-4",
+                "timestamp": "2026-02-24T10:15:30Z",
+                "group": "A" if entry_id % 2 else "B",
+            },
+        }
+        for entry_id in range(1, 9)
+    ]
+
+
+def write_shards(directory, shards):
+    paths = []
+
+    for index, shard in enumerate(shards):
+        path = Path(directory) / f"shard_{index}.jsonl"
+        path.write_text(
+            "".join(json.dumps(item) + "\n" for item in shard)
+        )
+        paths.append(path)
+
+    return paths
+
+
+def test_sharded_summary_matches_single_file():
+    config = Config(min_dataset_size=4)
+    entries = create_entries()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # First shard holds a single group, which is valid per shard.
+        paths = write_shards(
+            directory,
+            [entries[:1], entries[1:5], entries[5:]],
+        )
+        single = Path(directory) / "all.json"
+        single.write_text(json.dumps(entries))
+
+        summary = summarize_shards(paths, config)
+        dataset = load_and_validate_dataset(single, config)
+
+    assert summary.count == 8
+    assert generate_report(summary, config) == generate_report(
+        dataset, config
+    )
+    assert analyze_failures(summary, config) == analyze_failures(
+        dataset, config
+    )
+
+
+def test_duplicate_id_across_shards_fails():
+    config = Config(min_dataset_size=4)
+    entries = create_entries()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_shards(directory, [entries[:4], entries[3:]])
+
+        with pytest.raises(DatasetValidationError):
+            summarize_shards(paths, config)
@@ -1,7 +1,24 @@
+import itertools
+import math
+
+from llm_eval import advanced_statistics
 from llm_eval.config import Config
 from llm_eval.models import EvaluationEntry, Metadata
 from llm_eval.significance import independent_t_test
-from llm_eval.agreement import compute_cohens_kappa
+from llm_eval.agreement import (
+    IncrementalAgreement,
+    compute_cohens_kappa,
+    build_contingency_tables,
+    kappa_from_table,
+)
+from llm_eval.advanced_statistics import (
+    bootstrap_significance_test,
+    exact_permutation_test,
+    format_permutation_test,
+)
+from llm_eval.group_comparison import adjust_p_values, compare_groups
+from llm_eval.summary import DatasetSummary
+from llm_eval.utils import RunningStatistics, binomial_variate, derive_rng
 
 
 def create_dataset():
@@ -93,4 +110,230 @@ def test_kappa_runs():
     dataset = create_dataset()
     result = compute_cohens_kappa(dataset, config)
 
-    assert "instruction_adherence" in result
\ No newline at end of file
+    assert "instruction_adherence" in result
+
+
+def test_incremental_agreement_matches_batch_kappa():
+    config = Config(min_dataset_size=4)
+    agreement = IncrementalAgreement(config)
+
+    for entry in create_dataset():
+        agreement.add(entry)
+
+    assert agreement.pairs == 2
+    assert agreement.kappa("linear") == compute_cohens_kappa(
+        create_dataset(), config, "linear"
+    )
+
+
+def test_bootstrap_is_deterministic():
+    config = Config(min_dataset_size=4, bootstrap_iterations=500)
+    dataset = create_dataset()
+
+    first = bootstrap_significance_test(dataset, config)
+    second = bootstrap_significance_test(dataset, config)
+
+    assert first == second
+    assert 0.0 <= first["empirical_p_value"] <= 1.0
+
+
+def test_bootstrap_independent_of_worker_count():
+    dataset = create_dataset()
+    serial = Config(min_dataset_size=4, bootstrap_iterations=5000)
+    parallel = Config(
+        min_dataset_size=4,
+        bootstrap_iterations=5000,
+        workers=2,
+    )
+
+    assert bootstrap_significance_test(
+        dataset, serial
+    ) == bootstrap_significance_test(dataset, parallel)
+
+
+def test_running_statistics_merge_matches_single_pass():
+    left = [0.2, 1.4, 2.0, 0.8]
+    right = [1.0, 1.6, 0.4]
+
+    merged = RunningStatistics.from_values(left).merge(
+        RunningStatistics.from_values(right)
+    )
+    combined = RunningStatistics.from_values(left + right)
+    histogram = RunningStatistics.from_histogram({0: 2, 1: 3, 2: 1})
+
+    assert merged.count == combined.count == 7
+    assert math.isclose(merged.mean, combined.mean)
+    assert math.isclose(merged.variance, combined.variance)
+    assert math.isclose(histogram.mean, 5 / 6)
+    assert math.isclose(
+        histogram.variance,
+        RunningStatistics.from_values([0, 0, 1, 1, 1, 2]).variance,
+    )
+
+
+def test_contingency_tables_and_weighted_kappa():
+    config = Config(min_dataset_size=4)
+    dataset = create_dataset()
+
+    tables = build_contingency_tables(dataset, config)
+
+    # ID 1 rated (2, 1), ID 2 rated (0, 1) on every dimension.
+    assert tables["safety"] == [[0, 1, 0], [0, 0, 0], [0, 1, 0]]
+
+    perfect = [[3, 0, 0], [0, 2, 0], [0, 0, 4]]
+    near_miss = [[2, 1, 0], [0, 2, 0], [0, 1, 3]]
+
+    assert kappa_from_table(perfect, "quadratic") == 1.0
+    assert kappa_from_table(near_miss, "linear") > kappa_from_table(
+        near_miss
+    )
+
+
+def test_multinomial_bootstrap_matches_resampling():
+    summary = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 30, 1: 40, 2: 30}},
+        group_histograms={
+            "A": {0: 10, 1: 22, 2: 18},
+            "B": {0: 20, 1: 18, 2: 12},
+        },
+    )
+    p_values = {
+        method: bootstrap_significance_test(
+            summary,
+            Config(
+                bootstrap_iterations=4000,
+                bootstrap_method=method,
+                required_dimensions=("safety",),
+            ),
+        )["empirical_p_value"]
+        for method in ("multinomial", "resample")
+    }
+
+    # Both estimate the same p-value; allow ~4 standard errors
+    assert abs(p_values["multinomial"] - p_values["resample"]) < 0.045
+
+
+def test_binomial_variate_moments():
+    rng = derive_rng(0)
+
+    for n, p in ((20, 0.2), (100000, 0.3)):
+        draws = [binomial_variate(rng, n, p) for _ in range(4000)]
+        mean = sum(draws) / len(draws)
+
+        assert all(0 <= draw <= n for draw in draws)
+        assert abs(mean - n * p) < 4 * math.sqrt(n * p * (1 - p) / 4000)
+
+
+def test_exact_permutation_test_matches_enumeration():
+    histograms = {"A": {0: 2, 3: 1, 5: 2}, "B": {1: 2, 5: 1, 8: 3}}
+    summary = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 11}},
+        group_histograms=histograms,
+    )
+    config = Config(required_dimensions=("safety",))
+
+    group_a = [v for v, c in histograms["A"].items() for _ in range(c)]
+    group_b = [v for v, c in histograms["B"].items() for _ in range(c)]
+    pooled = group_a + group_b
+    n = len(pooled)
+    observed = abs(sum(group_a) * n - sum(pooled) * len(group_a))
+
+    splits = list(itertools.combinations(pooled, len(group_a)))
+    extreme = sum(
+        abs(sum(split) * n - sum(pooled) * len(group_a)) >= observed
+        for split in splits
+    )
+
+    result = exact_permutation_test(summary, config)
+
+    assert result["method"] == "exact"
+    assert math.isclose(result["p_value"], extreme / len(splits))
+    assert "normal approximation" not in format_permutation_test(result)
+
+
+def test_permutation_test_labels_normal_approximation(monkeypatch):
+    summary = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 11}},
+        group_histograms={"A": {0: 2, 3: 1, 5: 2}, "B": {1: 2, 8: 4}},
+    )
+    config = Config(required_dimensions=("safety",))
+
+    monkeypatch.setattr(advanced_statistics, "_PERMUTATION_STATE_BUDGET", 0)
+    result = exact_permutation_test(summary, config)
+
+    assert result["method"] == "normal"
+    assert "p-value is a normal approximation" in (
+        format_permutation_test(result)
+    )
+
+
+def test_group_comparison_anova_and_pairwise():
+    histograms = {
+        "A": {0: 3, 1: 4, 2: 3},
+        "B": {1: 5, 2: 5},
+        "C": {0: 6, 1: 2, 2: 2},
+    }
+    summary = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 30}},
+        group_histograms=histograms,
+    )
+    config = Config(required_dimensions=("safety",))
+    values = {
+        group: [v for v, c in histogram.items() for _ in range(c)]
+        for group, histogram in histograms.items()
+    }
+
+    pooled = [v for group in values.values() for v in group]
+    grand = sum(pooled) / len(pooled)
+    means = {g: sum(v) / len(v) for g, v in values.items()}
+    between = sum(len(v) * (means[g] - grand) ** 2 for g, v in values.items())
+    within = sum(
+        (x - means[g]) ** 2 for g, v in values.items() for x in v
+    )
+
+    result = compare_groups(summary, config, correction="bonferroni")
+    anova = result["anova"]
+
+    assert (anova["df_between"], anova["df_within"]) == (2, 27)
+    assert math.isclose(anova["f_statistic"], (between / 2) / (within / 27))
+    assert 0 < anova["p_value"] < 1
+
+    pairs = {(r["group_a"], r["group_b"]): r for r in result["pairwise"]}
+    assert list(pairs) == [("A", "B"), ("A", "C"), ("B", "C")]
+
+    two_groups = DatasetSummary(
+        dimensions=("safety",),
+        score_histograms={"safety": {0: 20}},
+        group_histograms={"A": histograms["A"], "B": histograms["B"]},
+    )
+    t_test = independent_t_test(two_groups, config)
+
+    assert math.isclose(
+        pairs[("A", "B")]["t_statistic"], t_test["t_statistic"]
+    )
+    assert math.isclose(
+        pairs[("A", "B")]["adjusted_p_value"],
+        min(1.0, 3 * pairs[("A", "B")]["p_value"]),
+    )
+
+
+def test_p_value_corrections():
+    p_values = [0.01, 0.04, 0.03, 0.005]
+
+    assert adjust_p_values(p_values, "none") == p_values
+    assert adjust_p_values(p_values, "bonferroni") == [
+        0.04, 0.16, 0.12, 0.02
+    ]
+
+    holm = adjust_p_values(p_values, "holm")
+    bh = adjust_p_values(p_values, "bh")
+
+    for expected, actual in zip([0.03, 0.06, 0.06, 0.02], holm):
+        assert math.isclose(expected, actual)
+
+    for expected, actual in zip([0.02, 0.04, 0.04, 0.02], bh):
+        assert math.isclose(expected, actual)
@@ -0,0 +1,56 @@
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from llm_eval.config import Config
+from llm_eval.synthetic import (
+    generate_entries,
+    generate_rating_pairs,
+    write_synthetic_dataset,
+)
+from llm_eval.validation import load_and_validate_dataset
+
+
+def test_synthetic_dataset_is_deterministic_and_valid():
+    config = Config()
+
+    with tempfile.TemporaryDirectory() as directory:
+        contents = []
+
+        for fmt in ("jsonl", "json", "jsonl"):
+            path = Path(directory) / f"data.{fmt}"
+            write_synthetic_dataset(path, 40, config, fmt=fmt, groups=3)
+
+            dataset = load_and_validate_dataset(path, config)
+
+            assert len(dataset) == 40
+            assert {e.metadata.group for e in dataset} == {
+                "group_0", "group_1", "group_2"
+            }
+            contents.append(path.read_bytes())
+
+        assert contents[0] == contents[2]
+
+
+def test_synthetic_seeds_and_pairs():
+    config = Config()
+
+    first = list(generate_entries(20, config, seed=1))
+    second = list(generate_entries(20, config, seed=2))
+
+    assert first == list(generate_entries(20, config, seed=1))
+    assert first != second
+
+    pairs = list(generate_rating_pairs(10, config))
+
+    assert len(pairs) == 20
+    assert [p["id"] for p in pairs[::2]] == [p["id"] for p in pairs[1::2]]
+
+
+def test_synthetic_rejects_undersized_datasets():
+    with pytest.raises(ValueError):
+        list(generate_entries(3, Config()))
+
+    with pytest.raises(ValueError):
+        list(generate_entries(20, Config(), groups=1))
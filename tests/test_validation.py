@@ -1,10 +1,17 @@
 import pytest
 from pathlib import Path
 import json
+import pickle
 import tempfile
+from dataclasses import FrozenInstanceError
 
 from llm_eval.config import Config
-from llm_eval.validation import load_and_validate_dataset
+from llm_eval import validation
+from llm_eval.validation import (
+    load_and_validate_dataset,
+    iter_validated_entries,
+    validate_dataset_file,
+)
 from llm_eval.exceptions import DatasetValidationError
 
 
@@ -116,4 +123,220 @@ def test_duplicate_id_fails():
         tmp_path = Path(tmp.name)
 
     with pytest.raises(DatasetValidationError):
-        load_and_validate_dataset(tmp_path, config)
\ No newline at end of file
+        load_and_validate_dataset(tmp_path, config)
+
+
+def test_non_integer_id_fails_validation():
+    config = Config(min_dataset_size=4)
+
+    for entry_id, message in (
+        ("1", "Entry id must be an integer: '1'"),
+        (True, "Entry id must be an integer: True"),
+        (1 << 63, "Entry id out of 64-bit range"),
+    ):
+        data = create_valid_dataset()
+        data[0]["id"] = entry_id
+
+        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+            json.dump(data, tmp)
+            tmp_path = Path(tmp.name)
+
+        with pytest.raises(DatasetValidationError, match=f"^Row 1: {message}"):
+            load_and_validate_dataset(tmp_path, config)
+
+
+def test_jsonl_dataset_passes():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset()
+
+    with tempfile.NamedTemporaryFile(
+        mode="w+", suffix=".jsonl", delete=False
+    ) as tmp:
+        for item in data:
+            tmp.write(json.dumps(item) + "\n")
+        tmp_path = Path(tmp.name)
+
+    dataset = load_and_validate_dataset(tmp_path, config)
+
+    assert [entry.id for entry in dataset] == [1, 2, 3, 4]
+
+
+def test_streaming_reports_duplicate_before_end():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset()
+    data[1]["id"] = 1
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        json.dump(data, tmp)
+        tmp_path = Path(tmp.name)
+
+    entries = iter_validated_entries(tmp_path, config)
+
+    assert next(entries).id == 1
+
+    with pytest.raises(DatasetValidationError):
+        next(entries)
+
+
+def test_lazy_text_matches_eager_load():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset()
+    data[2]["prompt"] = "Prüfung ✓ " * 50
+    data[3]["response"] = "ответ\n" * 20
+
+    # CRLF arrays must keep byte spans aligned with the file
+    for indent, newline in ((None, "\n"), (2, "\n"), (2, "\r\n")):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", encoding="utf-8", newline=newline, delete=False
+        ) as tmp:
+            json.dump(data, tmp, indent=indent, ensure_ascii=False)
+            tmp_path = Path(tmp.name)
+
+        eager = load_and_validate_dataset(tmp_path, config)
+        lazy = load_and_validate_dataset(tmp_path, config, lazy_text=True)
+
+        assert all(entry.has_lazy_text for entry in lazy)
+        assert lazy == eager
+
+    with tempfile.NamedTemporaryFile(
+        mode="w+", encoding="utf-8", suffix=".jsonl", delete=False
+    ) as tmp:
+        for item in data:
+            tmp.write(json.dumps(item, ensure_ascii=False) + "\n")
+        tmp_path = Path(tmp.name)
+
+    lazy = load_and_validate_dataset(tmp_path, config, lazy_text=True)
+
+    assert lazy[2].prompt == data[2]["prompt"]
+    assert lazy[3].response == data[3]["response"]
+
+
+def test_entries_are_compact_and_keep_attribute_api():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset()
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        json.dump(data, tmp)
+        tmp_path = Path(tmp.name)
+
+    first, second = load_and_validate_dataset(tmp_path, config)[:2]
+
+    assert not hasattr(first, "__dict__")
+    assert first.scores == data[0]["scores"]
+    assert first.scores["safety"] == data[0]["scores"]["safety"]
+    assert first.prompt == data[0]["prompt"]
+    assert first.metadata.group == "A"
+    assert first.metadata.group is second.metadata.group
+    assert first.metadata.timestamp is second.metadata.timestamp
+    assert pickle.loads(pickle.dumps(first)) == first
+
+    with pytest.raises(FrozenInstanceError):
+        first.id = 5  # type: ignore[misc]
+
+
+def test_validate_dataset_file_reports_all_errors(monkeypatch):
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset() * 3
+
+    for index, item in enumerate(data):
+        data[index] = dict(item, id=index + 1)
+
+    data[1] = dict(data[1], scores=dict(data[1]["scores"], safety=7))
+    data[5] = dict(data[5], id=1)
+    data[9] = dict(data[9], metadata={"model": "m", "group": "A"})
+
+    with tempfile.NamedTemporaryFile(
+        mode="w+", suffix=".jsonl", delete=False
+    ) as tmp:
+        for item in data:
+            tmp.write(json.dumps(item) + "\n")
+        tmp_path = Path(tmp.name)
+
+    # Force one chunk per line so row numbering crosses chunks.
+    monkeypatch.setattr(validation, "_CHUNK_BYTES", 1)
+
+    errors = validate_dataset_file(tmp_path, config)
+
+    assert [error.split(":")[0] for error in errors] == [
+        "Row 2",
+        "Row 6",
+        "Row 10",
+    ]
+    assert "Duplicate ID detected: 1" in errors[1]
+
+    with pytest.raises(DatasetValidationError, match="^Row 2: "):
+        load_and_validate_dataset(tmp_path, config)
+
+
+def test_wrongly_typed_metadata_is_reported_as_invalid_row():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset() * 2
+
+    for index, item in enumerate(data):
+        data[index] = dict(item, id=index + 1)
+
+    data[1] = dict(
+        data[1], metadata=dict(data[1]["metadata"], timestamp=123)
+    )
+    data[2] = dict(data[2], metadata="rater_1")
+    data[3] = dict(data[3], id=[4])
+    data[4] = dict(data[4], metadata=dict(data[4]["metadata"], group=["A"]))
+
+    lines = [json.dumps(item).encode("utf-8") for item in data]
+    lines[5] = b'{"id": "\xff\xfe"}'
+
+    with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as tmp:
+        tmp.write(b"\n".join(lines) + b"\n")
+        tmp_path = Path(tmp.name)
+
+    errors = validate_dataset_file(tmp_path, config)
+
+    assert [error.split(":")[0] for error in errors[:5]] == [
+        "Row 2",
+        "Row 3",
+        "Row 4",
+        "Row 5",
+        "Row 6",
+    ]
+    assert "Invalid ISO 8601 timestamp: 123" in errors[0]
+    assert "Metadata must be a dictionary." in errors[1]
+    assert "Entry id must be an integer: [4]" in errors[2]
+    assert "Metadata 'group' must be a string." in errors[3]
+    assert "Invalid JSON" in errors[4]
+
+    with pytest.raises(DatasetValidationError, match="^Row 2: "):
+        load_and_validate_dataset(tmp_path, config)
+
+    tmp_path.write_bytes(b"\n".join(lines[:1] + lines[5:]) + b"\n")
+
+    with pytest.raises(DatasetValidationError, match="Invalid JSON"):
+        load_and_validate_dataset(tmp_path, config)
+
+
+def test_entry_as_dict_and_replace():
+    config = Config(min_dataset_size=4)
+    data = create_valid_dataset()
+
+    with tempfile.NamedTemporaryFile(
+        mode="w+", suffix=".jsonl", delete=False
+    ) as tmp:
+        for item in data:
+            tmp.write(json.dumps(item) + "\n")
+        tmp_path = Path(tmp.name)
+
+    entry = load_and_validate_dataset(tmp_path, config, lazy_text=True)[0]
+
+    assert entry.as_dict() == data[0]
+    assert json.loads(json.dumps(entry.as_dict())) == data[0]
+
+    scores = dict(entry.scores, safety=0)
+    changed = entry.replace(id=9, scores=scores)
+
+    assert changed.id == 9 and changed.scores == scores
+    assert changed.has_lazy_text and changed.prompt == entry.prompt
+    assert entry.replace(prompt="New").as_dict() == dict(
+        data[0], prompt="New"
+    )
+
+    with pytest.raises(TypeError):
+        entry.replace(unknown=1)